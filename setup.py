@@ -92,6 +92,7 @@ setup(
         'console_scripts': [
             'keri = keri.cli:main',
             'kerid = keri.daemon:main',
+            'keri_convert = keri.cli:convert',
             'keri_bob = keri.demo.demo_bob:main',
             'keri_eve = keri.demo.demo_eve:main',
             'keri_sam = keri.demo.demo_sam:main',
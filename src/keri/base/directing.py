@@ -19,7 +19,7 @@ class Habitat():
 
      Attributes:
         .secrets is list of secrets (replace later with keeper interface)
-        .kevers is dict of Kevers keyed by qb64 prefix
+        .kevers is dict or eventing.Kevers mapping of Kevers keyed by qb64 prefix
         .db is s lmdb db Logger instance
         .signers is dict  of signers for each secret indexed by verfer qb64
         .inception is Serder of inception event
@@ -31,7 +31,8 @@ class Habitat():
 
         Parameters:
             secrets is list of secrets (replace later with keeper interface)
-            kevers is dict of Kever instance keyed by qb64 prefix
+            kevers is dict or eventing.Kevers mapping of Kever instance keyed
+                by qb64 prefix
             db is lmdb db Logger instance
         """
         self.secrets = secrets
@@ -116,7 +117,7 @@ class Director(doing.Doer):
             raise
 
         finally:  # exit context,  unforced exit due to normal exit of try
-            pass
+            self.kevery.close()  # shut down pipeline pool if any
 
         return True # return value of yield from, or yield ex.value of StopIteration
 
@@ -196,7 +197,7 @@ class Reactor(doing.Doer):
             raise
 
         finally:  # exit context,  unforced exit due to normal exit of try
-            pass
+            self.kevery.close()  # shut down pipeline pool if any
 
         return True # return value of yield from, or yield ex.value of StopIteration
 
@@ -383,7 +384,8 @@ class Directant(doing.Doer):
             raise
 
         finally:  # exit context,  unforced exit due to normal exit of try
-            pass
+            for reactant in self.rants.values():
+                reactant.kevery.close()  # shut down pipeline pool if any
 
         return True # return value of yield from, or yield ex.value of StopIteration
 
@@ -393,6 +395,7 @@ class Directant(doing.Doer):
         Close and remove connection given by ca
         """
         if ca in self.rants:
+            self.rants[ca].kevery.close()
             del self.rants[ca]
         if ca in self.server.ixes:  #  incomer still there
             self.server.ixes[ca].serviceTxes()  #  send final bytes to socket
@@ -721,7 +724,7 @@ class BobDirector(Director):
             raise
 
         finally:  # exit context,  unforced exit due to normal exit of try
-            pass
+            self.kevery.close()  # shut down pipeline pool if any
 
         return True # return value of yield from, or yield ex.value of StopIteration
 
@@ -870,7 +873,7 @@ class SamDirector(Director):
             raise
 
         finally:  # exit context,  unforced exit due to normal exit of try
-            pass
+            self.kevery.close()  # shut down pipeline pool if any
 
         return True # return value of yield from, or yield ex.value of StopIteration
 
@@ -955,7 +958,7 @@ class EveDirector(Director):
             raise
 
         finally:  # exit context,  unforced exit due to normal exit of try
-            pass
+            self.kevery.close()  # shut down pipeline pool if any
 
         return True # return value of yield from, or yield ex.value of StopIteration
 
@@ -964,18 +967,19 @@ class EveDirector(Director):
 
 
 def runController(secrets,  name="who", role="initiator",
-                  remotePort=5621, localPort=5620, limit=0.0):
+                  remotePort=5621, localPort=5620, limit=0.0, **kwa):
     """
     Setup and run the demo for name
+    kwa is dict of Logger init keyword arguments such as batchSize and mapSize
     """
 
 
     print("Direct Mode demo of {} as {} on TCP port {} to port {}.\n\n"
           "".format(name, role, localPort, remotePort))
 
-    with dbing.openLogger(name=name) as db:
+    with dbing.openLogger(name=name, **kwa) as db:
          # setup components
-        kevers = dict()
+        kevers = eventing.Kevers(logger=db)
         hab = Habitat(secrets=secrets, kevers=kevers, db=db)
 
         client = clienting.Client(host='127.0.0.1', port=remotePort)
@@ -18,13 +18,114 @@ Why does this file exist, and why not put this in __main__?
   Also see (1) from http://click.pocoo.org/5/setuptools/#setuptools-integration
 """
 import argparse
+import os
+
+from keri.db.dbing import Databaser, Durabilities, Layouts
+from keri.db.dbing import Logger, convertLogger
+
+
+def addDatabaserArgs(parser):
+    """
+    Adds LMDB environment tuning options of Databaser to argparse parser
+    """
+    g = parser.add_argument_group('database')
+    g.add_argument('--map-size', dest='mapSize', type=int, default=None,
+                   help="Initial LMDB map size in bytes. "
+                        "Default is {}.".format(Databaser.MapSize))
+    g.add_argument('--map-max', dest='mapMax', type=int, default=None,
+                   help="Max LMDB map size in bytes automatic growth may reach. "
+                        "Default is no max.")
+    g.add_argument('--map-growth', dest='mapGrowth', type=float, default=None,
+                   help="Factor LMDB map grows by when full. "
+                        "Default is {}.".format(Databaser.MapGrowth))
+    g.add_argument('--durability', dest='durability', default=None,
+                   choices=list(Durabilities),
+                   help="Commit durability level traded for throughput. "
+                        "Default is {}.".format(Databaser.Durability))
+    g.add_argument('--writemap', dest='writemap', action='store_true',
+                   help="Write through writeable memory map.")
+    g.add_argument('--no-readahead', dest='readahead', action='store_false',
+                   help="Turn off OS readahead for databases larger than RAM.")
+    g.add_argument('--max-readers', dest='maxReaders', type=int, default=None,
+                   help="Max concurrent read transactions. "
+                        "Default is {}.".format(Databaser.MaxReaders))
+    g.add_argument('--batch-size', dest='batchSize', type=int, default=None,
+                   help="Max events per group commit. 0 disables. "
+                        "Default is {}.".format(Databaser.BatchSize))
+    g.add_argument('--batch-time', dest='batchTime', type=float, default=None,
+                   help="Max seconds per group commit. "
+                        "Default is {}.".format(Databaser.BatchTime))
+    return parser
+
+
+def databaserKwa(args):
+    """
+    Returns dict of Databaser init keyword arguments from parsed args of
+    parser setup by addDatabaserArgs
+    """
+    names = ('mapSize', 'mapMax', 'mapGrowth', 'durability', 'writemap',
+             'readahead', 'maxReaders', 'batchSize', 'batchTime')
+    return {name: getattr(args, name) for name in names}
+
 
 parser = argparse.ArgumentParser(description='Command description.')
 parser.add_argument('names', metavar='NAME', nargs=argparse.ZERO_OR_MORE,
                     help="A name of something.")
+addDatabaserArgs(parser)
 
 
 def main(args=None):
     args = parser.parse_args(args=args)
     print(args.names)
+    return args
+
+
+
+converter = argparse.ArgumentParser(description='Convert Logger database '
+                                                'between key layouts offline.')
+converter.add_argument('source', help="Name of database to convert from.")
+converter.add_argument('target', help="Name of new database to convert to.")
+converter.add_argument('--head', dest='headDirPath', default=None,
+                       help="Head directory path of both databases. "
+                            "Default is {}.".format(Databaser.HeadDirPath))
+converter.add_argument('--layout', type=int, default=2, choices=Layouts,
+                       help="Layout version of target. Default is 2.")
+converter.add_argument('--qb2', action='store_true',
+                       help="Target layout 2 keys use qb2 pre and dig.")
+addDatabaserArgs(converter)  # database options apply to target
+
+
+def _loggerDirPath(headDirPath, name):
+    """
+    Returns directory path of existing Logger database name under headDirPath
+    the way Logger would find it without creating anything or None if missing
+    """
+    path = os.path.abspath(os.path.expanduser(
+                os.path.join(headDirPath or Databaser.HeadDirPath,
+                             Databaser.TailDirPath, name)))
+    if not os.path.exists(path) or not os.access(path, os.R_OK | os.W_OK):
+        alt = os.path.abspath(os.path.expanduser(
+                os.path.join(Databaser.AltHeadDirPath,
+                             Databaser.AltTailDirPath, name)))
+        if os.path.exists(path) or os.path.exists(alt):
+            path = alt  # Logger falls back on alt when path not usable
+    if not os.path.exists(os.path.join(path, "data.mdb")):
+        return None
+    return path
+
 
+def convert(args=None):
+    args = converter.parse_args(args=args)
+    if _loggerDirPath(args.headDirPath, args.source) is None:  # do not create
+        converter.error("Missing source database {}.".format(args.source))
+    src = Logger(headDirPath=args.headDirPath, name=args.source)
+    dst = Logger(headDirPath=args.headDirPath, name=args.target,
+                 layout=args.layout, qb2=args.qb2, **databaserKwa(args))
+    try:
+        count = convertLogger(src, dst)
+    finally:
+        src.env.close()
+        dst.env.close()
+    print("Converted {} records from layout {} to layout {}."
+          "".format(count, src.layout, dst.layout))
+    return count
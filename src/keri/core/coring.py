@@ -3,12 +3,15 @@
 keri.core.coring module
 
 """
+import os
 import re
 import json
 import copy
 
 from dataclasses import dataclass, astuple
 from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, local
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
 from math import ceil
@@ -21,7 +24,7 @@ import blake3
 from ..kering import (ValidationError, VersionError, EmptyMaterialError,
                       DerivationError, ShortageError)
 from ..kering import Versionage, Version
-from ..help.helping import extractValues
+from ..help.helping import extractValues, LruCache
 
 
 Serialage = namedtuple("Serialage", 'json mgpk cbor')
@@ -32,6 +35,92 @@ Mimes = Serialage(json='application/keri+json',
                   mgpk='application/keri+msgpack',
                   cbor='application/keri+cbor',)
 
+
+Codecage = namedtuple("Codecage", 'dumps loads')  # serializer backend
+
+def _dumpsJSON(ked):
+    """
+    Returns bytes of compact JSON serialization of ked
+    """
+    return json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def _loadsJSON(raw):
+    """
+    Returns ked from JSON serialization in raw bytes, bytearray, or memoryview
+    """
+    return json.loads(str(raw, "utf-8"))
+
+#  Serializers is registry of serializer backend by serialization kind
+#  dumps(ked) returns bytes and loads(raw) takes bytes, bytearray or memoryview
+Serializers = {Serials.json: Codecage(dumps=_dumpsJSON, loads=_loadsJSON),
+               Serials.mgpk: Codecage(dumps=msgpack.dumps, loads=msgpack.loads),
+               Serials.cbor: Codecage(dumps=cbor.dumps, loads=cbor.loads)}
+
+DefaultSerializers = dict(Serializers)  # reference backends
+
+
+def registerSerializer(kind, dumps=None, loads=None):
+    """
+    Returns prior Codecage for kind after registering backend functions dumps
+    and loads for serialization kind in Serializers. Missing dumps or loads
+    keep the prior function. Register the returned prior Codecage to restore.
+
+    Backend dumps must produce byte for byte the same output as the default
+    backend since digests and signatures are over the serialization.
+    See tests.comply for conformance tests.
+
+    Parameters:
+        kind is serialization kind, one of Serials
+        dumps is function that returns bytes serialization of key event dict
+        loads is function that returns key event dict from serialization
+    """
+    if kind not in Serials:
+        raise ValueError("Invalid serialization kind = {}".format(kind))
+    prior = Serializers[kind]
+    Serializers[kind] = Codecage(dumps=dumps if dumps is not None else prior.dumps,
+                                 loads=loads if loads is not None else prior.loads)
+    return prior
+
+
+def fastSerializers():
+    """
+    Returns dict of Codecage by serialization kind of faster backends that
+    are installed locally. Register with registerSerializer.
+        json uses orjson C codec when installed, its compact utf-8 output
+            matches the default
+        mgpk reuses one msgpack Packer per thread since a Packer is not
+            safe to share across threads
+        cbor uses the cbor2 C extension when installed with default settings
+            since canonical=True sorts map keys and would reorder fields
+    """
+    fasts = {}
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        fasts[Serials.json] = Codecage(dumps=orjson.dumps, loads=orjson.loads)
+
+    packers = local()  # one Packer per thread
+
+    def pack(ked):
+        packer = getattr(packers, "packer", None)
+        if packer is None:
+            packer = packers.packer = msgpack.Packer()  # autoreset bytes per pack
+        return packer.pack(ked)
+
+    fasts[Serials.mgpk] = Codecage(dumps=pack, loads=msgpack.unpackb)
+
+    try:
+        from cbor2 import _cbor2
+    except ImportError:
+        pass
+    else:
+        fasts[Serials.cbor] = Codecage(dumps=_cbor2.dumps, loads=_cbor2.loads)
+
+    return fasts
+
+
 VERRAWSIZE = 6  # hex characters in raw serialization size in version string
 # "{:0{}x}".format(300, 6)  # make num char in hex a variable
 # '00012c'
@@ -55,6 +144,68 @@ Vstrings = Serialage(json=Versify(kind=Serials.json, size=0),
 VEREX = b'KERI(?P<major>[0-9a-f])(?P<minor>[0-9a-f])(?P<kind>[A-Z]{4})(?P<size>[0-9a-f]{6})_'
 Rever = re.compile(VEREX) #compile is faster
 MINSNIFFSIZE = 12 + VERFULLSIZE  # min bytes in buffer to sniff else need more
+# fixed start of version string in serialized event when "vs" is first field
+# json '{"vs":"'  mgpk fixmap + fixstr 'vs' + fixstr  cbor map + text 'vs' + text
+VERSTARTS = Serialage(json=7, mgpk=5, cbor=5)
+VERHEX = frozenset(b'0123456789abcdef')  # allowed version and size digits
+
+
+def Unversify(raw, start=0):
+    """
+    Returns tuple (kind, version, size) parsed from the fixed layout version
+    string KERI{major}{minor}{kind}{size}_ in raw at start or None when the
+    bytes at start are not a version string. Does not use regex. Kind is not
+    checked against Serials.
+
+    Parameters:
+      raw is bytes, bytearray, or memoryview
+      start is int offset into raw of start of version string
+    """
+    vs = bytes(raw[start:start + VERFULLSIZE])
+    if (len(vs) != VERFULLSIZE or not vs.startswith(b'KERI') or vs[-1] != 0x5f
+            or not VERHEX.issuperset(vs[4:6]) or not VERHEX.issuperset(vs[10:16])
+            or not (vs[6:10].isalpha() and vs[6:10].isupper())):  # [A-Z]{4}
+        return None
+    version = Versionage(major=int(vs[4:5], 16), minor=int(vs[5:6], 16))
+    return (vs[6:10].decode("utf-8"), version, int(vs[10:16], 16))
+
+
+def Sniff(raw, offset=0):
+    """
+    Returns tuple (kind, version, size, start) from the version string in the
+    leading bytes of the serialized event in raw at offset where start is the
+    offset into raw of the version string.
+
+    Parses at the fixed start of the version string for the serialization
+    given by the first byte and only when that fails falls back on a Rever
+    search of the leading MINSNIFFSIZE bytes. Usable on a stream to gate on
+    size or to resync at offset.
+
+    Parameters:
+      raw is bytes, bytearray, or memoryview of serialized event
+      offset is int offset into raw of start of serialized event
+
+    Raises ShortageError when fewer than MINSNIFFSIZE bytes at offset
+    """
+    if len(raw) - offset < MINSNIFFSIZE:
+        raise ShortageError("Need more bytes.")
+
+    # json event starts with '{' whereas mgpk and cbor start with map header
+    start = offset + (VERSTARTS.json if raw[offset] == 0x7b else VERSTARTS.mgpk)
+    versage = Unversify(raw, start)
+    if versage is None:  # not first field so search only the leading bytes
+        match = Rever.search(raw, offset, offset + MINSNIFFSIZE)  #  takes bytes
+        if not match or match.start() - offset > 12:
+            raise ValueError("Invalid version string in raw = {}"
+                             "".format(bytes(raw[offset:offset + MINSNIFFSIZE])))
+        start = match.start()
+        versage = Unversify(raw, start)
+
+    kind, version, size = versage
+    if kind not in Serials:
+        raise ValueError("Invalid serialization kind = {}".format(kind))
+    return (kind, version, size, start)
+
 
 def Deversify(vs):
     """
@@ -68,19 +219,16 @@ def Deversify(vs):
     Parameters:
       vs is version string str
 
-    Uses regex match to extract:
+    Uses fixed layout parse to extract:
         serialization kind
         keri version
         serialization size
     """
-    match = Rever.match(vs.encode("utf-8"))  #  match takes bytes
-    if match:
-        major, minor, kind, size = match.group("major", "minor", "kind", "size")
-        version = Versionage(major=int(major, 16), minor=int(minor, 16))
-        kind = kind.decode("utf-8")
+    versage = Unversify(vs.encode("utf-8"))
+    if versage:
+        kind, version, size = versage
         if kind not in Serials:
             raise ValueError("Invalid serialization kind = {}".format(kind))
-        size = int(size, 16)
         return(kind, version, size)
 
     raise ValueError("Invalid version string = {}".format(vs))
@@ -216,13 +364,13 @@ CryTwoDex = CryTwoCodex()  #  Make instance
 CryTwoSizes = {
                "0A": 24,
                "0B": 88,
-               "0B": 88,
+               "0C": 88,
               }
 
 CryTwoRawSizes = {
                   "0A": 16,
                   "0B": 64,
-                  "0B": 64,
+                  "0C": 64,
                  }
 
 @dataclass(frozen=True)
@@ -269,6 +417,8 @@ CrySizes.update(CryTwoSizes)
 CrySizes.update(CryFourSizes)
 
 MINCRYSIZE = min(CrySizes.values())
+MAXCRYSIZE = max(CrySizes.values())  # max bytes any crymat consumes from stream
+VERCACHESIZE = 4096  # default max entries in Verfer verification cache
 
 # all sizes in one dict
 CryRawSizes = dict(CryCntRawSizes)
@@ -296,6 +446,29 @@ class CryNonTransCodex:
 CryNonTransDex = CryNonTransCodex()  #  Make instance
 
 
+# Compiled codex tables used by hot paths instead of the codex instances.
+# Membership tests on a codex instance call astuple() which builds a deep
+# copied tuple on every test. The tables are compiled once from the codex
+# instances and size dicts above so they stay in sync with them.
+# Sizage is namedtuple of code sizes: hs is hard size of code, ss is soft size
+# of index in code, rs is raw size of material, fs is full size in qb64
+Sizage = namedtuple("Sizage", "hs ss rs fs")
+
+CryOneCodes = frozenset(CryOneDex)
+CryTwoCodes = frozenset(CryTwoDex)
+CryFourCodes = frozenset(CryFourDex)
+CryCntCodes = frozenset(CryCntDex)
+CryNonTransCodes = frozenset(CryNonTransDex)
+
+# Mapping of code to Sizage for every cry code. Raises KeyError on import
+# if a codex gains a code without entries in its size dicts.
+CryCodeSizes = {code: Sizage(hs=len(code),
+                             ss=CryIdxSizes.get(code, 0),
+                             rs=CryRawSizes[code],
+                             fs=CrySizes[code])
+                for code in (CryOneCodes | CryTwoCodes | CryFourCodes | CryCntCodes)}
+
+
 class CryMat:
     """
     CryMat is fully qualified cryptographic material base class
@@ -314,61 +487,70 @@ class CryMat:
         .qb64b bytes in Base64 fully qualified with derivation code + crypto mat
         .qb2  bytes in binary with derivation code + crypto material
         .nontrans True when non-transferable derivation code False otherwise
+        .size int number of qb64 bytes consumed by fully qualified material
+        .bsize int number of qb2 bytes consumed by fully qualified material
 
     """
+    __slots__ = ("_code", "_index", "_raw", "_qb64b", "_qb64")
+
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
-                 code=CryOneDex.Ed25519N, index=0):
+                 code=CryOneDex.Ed25519N, index=0, offset=0):
         """
         Validate as fully qualified
         Parameters:
             raw is bytes of unqualified crypto material usable for crypto operations
-            qb64b is bytes of fully qualified crypto material
+            qb64b is bytes, bytearray or memoryview of fully qualified crypto material
             qb64 is str or bytes  of fully qualified crypto material
             qb2 is bytes of fully qualified crypto material
             code is str of derivation code
             index is int of count of attached receipts for CryCntDex codes
+            offset is int offset into qb64b, qb64, or qb2 of start of material.
+                Allows extraction from a memoryview over a receive buffer
+                without first slicing off the material.
 
         When raw provided then validate that code is correct for length of raw
             and assign .raw
         Else when qb64 or qb2 provided extract and assign .raw and .code
 
         """
+        self._qb64b = None  # memoized qualified encodings computed on demand
+        self._qb64 = None
         if raw is not None:  #  raw provided so infil with code
             if not isinstance(raw, (bytes, bytearray)):
                 raise TypeError("Not a bytes or bytearray, raw={}.".format(raw))
             pad = self._pad(raw)
-            if (not ( (pad == 1 and (code in CryOneDex)) or  # One or Five or Nine
-                      (pad == 2 and (code in CryTwoDex)) or  # Two or Six or Ten
-                      (pad == 0 and (code in CryFourDex)) or # Four or Eight
-                      (pad == 0 and (code in CryCntDex)) )):  # Cnt Four
+            if (not ( (pad == 1 and (code in CryOneCodes)) or  # One or Five or Nine
+                      (pad == 2 and (code in CryTwoCodes)) or  # Two or Six or Ten
+                      (pad == 0 and (code in CryFourCodes)) or # Four or Eight
+                      (pad == 0 and (code in CryCntCodes)) )):  # Cnt Four
 
                 raise ValidationError("Wrong code={} for raw={}.".format(code, raw))
 
-            if (code in CryCntDex and ((index < 0) or (index > CRYCNTMAX))):
+            if (code in CryCntCodes and ((index < 0) or (index > CRYCNTMAX))):
                 raise ValidationError("Invalid index={} for code={}.".format(index, code))
 
-            raw = raw[:CryRawSizes[code]]  #  allows longer by truncating if stream
-            if len(raw) != CryRawSizes[code]:  # forbids shorter
+            raw = raw[:CryCodeSizes[code].rs]  #  allows longer by truncating if stream
+            if len(raw) != CryCodeSizes[code].rs:  # forbids shorter
                 raise ValidationError("Unexpected raw size={} for code={}"
                                       " not size={}.".format(len(raw),
                                                              code,
-                                                             CryRawSizes[code]))
+                                                             CryCodeSizes[code].rs))
 
             self._code = code
             self._index = index
             self._raw = bytes(raw)  # crypto ops require bytes not bytearray
 
         elif qb64b is not None:
-            self._exfil(qb64b)
+            self._exfil(qb64b, offset=offset)
 
         elif qb64 is not None:
             if hasattr(qb64, "encode"):  #  ._exfil expects bytes not str
                 qb64 = qb64.encode("utf-8")  #  greedy so do not use on stream
-            self._exfil(qb64)
+            self._exfil(qb64, offset=offset)
 
-        elif qb2 is not None:  # rewrite to use direct binary exfiltration
-            self._exfil(encodeB64(qb2))
+        elif qb2 is not None:
+            self._bexfil(qb2, offset=offset)
 
         else:
             raise EmptyMaterialError("Improper initialization need raw or b64 or b2.")
@@ -430,8 +612,8 @@ class CryMat:
         count is attached receipt couplet count when applicable for CryCntDex codes
         raw is bytes or bytearray
         """
-        if self._code in CryCntDex:
-            l = CryIdxSizes[self._code]  # count length b64 characters
+        if self._code in CryCntCodes:
+            l = CryCodeSizes[self._code].ss  # count length b64 characters
             # full is pre code + index
             full = "{}{}".format(self._code, IntToB64(self._index, l=l))
         else:
@@ -443,67 +625,171 @@ class CryMat:
             raise ValidationError("Invalid code = {} for converted raw pad = {}."
                                   .format(full, self.pad))
         # prepending derivation code and strip off trailing pad characters
-        return (full.encode("utf-8") + encodeB64(self._raw)[:-pad])
+        return (full.encode("utf-8") + encodeB64(self._raw)[:-pad or None])
 
 
-    def _exfil(self, qb64b):
+    def _exfil(self, qb64b, offset=0):
         """
         Extracts self.code and self.raw from qualified base64 bytes qb64b
+        starting at offset.
+
+        qb64b may be bytes, bytearray, or memoryview. Material is extracted in
+        place so qb64b is never sliced except for the text run that is decoded.
+        Slices of qb64b are never bound to names so that a memoryview over a
+        receive buffer does not hold an export of the buffer once done.
         """
-        if len(qb64b) < MINCRYSIZE:  # Need more bytes
+        if len(qb64b) - offset < MINCRYSIZE:  # Need more bytes
             raise ShortageError("Need more bytes.")
 
         cs = 1  # code size  initially 1 to extract selector
-        code = qb64b[:cs].decode("utf-8")  #  convert to str
+        code = chr(qb64b[offset])  #  convert to str
         index = 0
 
         # need to map code to length so can only consume proper number of chars
         #  from front of qb64 so can use with full identifiers not just prefixes
 
-        if code in CryOneDex:  # One Char code
-            qb64b = qb64b[:CryOneSizes[code]]  # strip of full crymat
+        if code in CryOneCodes:  # One Char code
+            pass
 
         elif code == CrySelDex.two: # first char of two char code
             cs += 1  # increase code size
-            code = qb64b[0:cs].decode("utf-8")  #  get full code, convert to str
-            if code not in CryTwoDex:
-                raise ValidationError("Invalid derivation code = {} in {}.".format(code, qb64b))
-            qb64b = qb64b[:CryTwoSizes[code]]  # strip of full crymat
+            code = bytes(qb64b[offset:offset + cs]).decode("utf-8")  #  get full code
+            if code not in CryTwoCodes:
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb64b[offset:offset + MAXCRYSIZE])))
 
         elif code == CrySelDex.four: # first char of four char cnt code
             cs += 3  # increase code size
-            code = qb64b[0:cs].decode("utf-8")  #  get full code, convert to str
-            if code not in CryFourDex:
-                raise ValidationError("Invalid derivation code = {} in {}.".format(code, qb64b))
-            qb64b = qb64b[:CryFourSizes[code]]  # strip of full crymat
+            code = bytes(qb64b[offset:offset + cs]).decode("utf-8")  #  get full code
+            if code not in CryFourCodes:
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb64b[offset:offset + MAXCRYSIZE])))
 
         elif code == CrySelDex.dash:  #  '-' 2 char code + 2 char index count
             cs += 1  # increase code size
-            code = qb64b[0:cs].decode("utf-8")  #  get full code, convert to str
-            if code not in CryCntDex:  # 4 char = 2 code + 2 index
-                raise ValidationError("Invalid derivation code = {} in {}.".format(code, qb64b))
-            qb64b = qb64b[:CryCntSizes[code]]  # strip of full crymat
+            code = bytes(qb64b[offset:offset + cs]).decode("utf-8")  #  get full code
+            if code not in CryCntCodes:  # 4 char = 2 code + 2 index
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb64b[offset:offset + MAXCRYSIZE])))
             cs += 2  # increase code size
-            index = B64ToInt(qb64b[cs-2:cs].decode("utf-8"))  # last two characters for index
 
         else:
-            raise ValueError("Improperly coded material = {}".format(qb64b))
+            raise ValueError("Improperly coded material = {}"
+                             "".format(bytes(qb64b[offset:offset + MAXCRYSIZE])))
 
-        if len(qb64b) != CrySizes[code]:  # must be correct length
-            if len(qb64b) <  CrySizes[code]:  #  need more bytes
-                raise ShortageError("Need more bytes.")
-            else:
-                raise ValidationError("Bad qb64b size expected {}, got {} "
-                                      "bytes.".format(CrySizes[code],
-                                                      len(qb64b)))
+        size = CryCodeSizes[code].fs  # full size of qualified crymat
+        if len(qb64b) - offset < size:  #  need more bytes
+            raise ShortageError("Need more bytes.")
+
+        if code in CryCntCodes:  # last two characters of code are index
+            index = B64ToInt(bytes(qb64b[offset + cs - 2:offset + cs]).decode("utf-8"))
 
         pad = cs % 4  # pad is remainder pre mod 4
-        # strip off prepended code and append pad characters
-        base = qb64b[cs:] + pad * BASE64_PAD
-        raw = decodeB64(base)
+        # decode text run after prepended code with appended pad characters
+        # join copies the run out of qb64b in one step whatever its type
+        raw = decodeB64(b''.join((qb64b[offset + cs:offset + size],
+                                  pad * BASE64_PAD)))
 
-        if len(raw) != (len(qb64b) - cs) * 3 // 4:  # exact lengths
-            raise ValueError("Improperly qualified material = {}".format(qb64b))
+        if len(raw) != (size - cs) * 3 // 4:  # exact lengths
+            raise ValueError("Improperly qualified material = {}"
+                             "".format(bytes(qb64b[offset:offset + size])))
+
+        self._code = code
+        self._index = index
+        self._raw = raw
+        self._qb64b = bytes(qb64b[offset:offset + size])  # parsed text is canonical
+
+
+    def _binfil(self):
+        """
+        Returns fully qualified base2 bytes given self.pad, self.code, self.index
+        and self.raw without Base64 encoding.
+        The code characters are packed as sextets ahead of the bits of raw
+        followed by two zero bits per pad char so the result is the same as
+        decoding the qb64 version.
+        """
+        if self._code in CryCntCodes:
+            l = CryCodeSizes[self._code].ss  # count length b64 characters
+            # full is pre code + index
+            full = "{}{}".format(self._code, IntToB64(self._index, l=l))
+        else:
+            full = self._code
+
+        pad = self.pad
+        # valid pad for code length
+        if len(full) % 4 != pad:  # pad is not remainder of len(code) % 4
+            raise ValidationError("Invalid code = {} for converted raw pad = {}."
+                                  .format(full, self.pad))
+        raw = self._raw
+        i = (B64ToInt(full) << (8 * len(raw))) | int.from_bytes(raw, "big")
+        return (i << (2 * pad)).to_bytes(CryCodeSizes[self._code].fs * 3 // 4, "big")
+
+
+    def _bexfil(self, qb2, offset=0):
+        """
+        Extracts self.code and self.raw from qualified base2 bytes qb2
+        starting at offset without Base64 decoding.
+
+        qb2 may be bytes, bytearray, or memoryview. The selector is the
+        leading sextet of the first byte. As with ._exfil slices of qb2 are
+        never bound to names.
+        """
+        if len(qb2) - offset < MINCRYSIZE * 3 // 4:  # Need more bytes
+            raise ShortageError("Need more bytes.")
+
+        cs = 1  # code size  initially 1 to extract selector
+        code = B64ChrByIdx[qb2[offset] >> 2]  # leading sextet as str
+        index = 0
+
+        if code in CryOneCodes:  # One Char code
+            pass
+
+        elif code == CrySelDex.two: # first char of two char code
+            cs += 1  # increase code size
+            code = B2ToB64(qb2, cs, offset=offset)  #  get full code
+            if code not in CryTwoCodes:
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb2[offset:offset + MAXCRYSIZE])))
+
+        elif code == CrySelDex.four: # first char of four char cnt code
+            cs += 3  # increase code size
+            code = B2ToB64(qb2, cs, offset=offset)  #  get full code
+            if code not in CryFourCodes:
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb2[offset:offset + MAXCRYSIZE])))
+
+        elif code == CrySelDex.dash:  #  '-' 2 char code + 2 char index count
+            cs += 1  # increase code size
+            code = B2ToB64(qb2, cs, offset=offset)  #  get full code
+            if code not in CryCntCodes:  # 4 char = 2 code + 2 index
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb2[offset:offset + MAXCRYSIZE])))
+            cs += 2  # increase code size
+
+        else:
+            raise ValueError("Improperly coded material = {}"
+                             "".format(bytes(qb2[offset:offset + MAXCRYSIZE])))
+
+        bs = CryCodeSizes[code].fs * 3 // 4  # full binary size of qualified crymat
+        if len(qb2) - offset < bs:  #  need more bytes
+            raise ShortageError("Need more bytes.")
+
+        if code in CryCntCodes:  # last two characters of code are index
+            index = B64ToInt(B2ToB64(qb2, cs, offset=offset)[-2:])
+
+        pad = cs % 4  # pad is remainder pre mod 4
+        rs = CryCodeSizes[code].rs
+        i = int.from_bytes(qb2[offset:offset + bs], "big")
+        if i & ((1 << (2 * pad)) - 1):  # pad bits must be zero
+            raise ValueError("Improperly qualified material = {}"
+                             "".format(bytes(qb2[offset:offset + bs])))
+        raw = ((i >> (2 * pad)) & ((1 << (8 * rs)) - 1)).to_bytes(rs, "big")
 
         self._code = code
         self._index = index
@@ -516,8 +802,11 @@ class CryMat:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Computed once since material is immutable
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
 
     @property
@@ -526,8 +815,11 @@ class CryMat:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Computed once since material is immutable
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -535,11 +827,27 @@ class CryMat:
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
-        redo to use b64 to binary decode table since faster
         """
-        # rewrite to do direct binary infiltration by
-        # decode self.code as bits and prepend to self.raw
-        return decodeB64(self._infil())
+        return self._binfil()
+
+    @property
+    def size(self):
+        """
+        Property size:
+        Returns number of bytes in .qb64b taken from code size table so
+        stream extractors may skip over material without reencoding it
+        """
+        return CryCodeSizes[self._code].fs
+
+
+    @property
+    def bsize(self):
+        """
+        Property bsize:
+        Returns number of bytes in .qb2 taken from code size table
+        """
+        return CryCodeSizes[self._code].fs * 3 // 4
+
 
     @property
     def nontrans(self):
@@ -548,7 +856,7 @@ class CryMat:
         Returns True if identifier has non-transferable derivation code,
                 False otherwise
         """
-        return(self.code in CryNonTransDex)
+        return(self.code in CryNonTransCodes)
 
 
 
@@ -575,6 +883,8 @@ class CryCounter(CryMat):
 
 
     """
+    __slots__ = ()
+
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=CryCntDex.Base64, index=None, count=None, **kwa):
         """
@@ -598,7 +908,7 @@ class CryCounter(CryMat):
         super(CryCounter, self).__init__(raw=raw, qb64b=qb64b, qb64=qb64, qb2=qb2,
                                          code=code, index=index, **kwa)
 
-        if self.code not in CryCntDex:
+        if self.code not in CryCntCodes:
             raise ValidationError("Invalid code = {} for CryCounter."
                                   "".format(self.code))
 
@@ -619,6 +929,15 @@ class Verfer(CryMat):
 
     See CryMat for inherited attributes and properties:
 
+    Class Attributes:
+        .Workers is int max threads in shared batch verification pool
+            None means ThreadPoolExecutor default
+        .BatchMin is int min number of verifications in a batch to use pool
+            smaller batches are verified inline on calling thread
+        .Cache is LruCache of successful verifications keyed by code,
+            verifier key, signature and digest of serialization or None
+            when caching is off
+
     Attributes:
 
     Properties:
@@ -626,7 +945,20 @@ class Verfer(CryMat):
     Methods:
         verify: verifies signature
 
+    Class Methods:
+        verifyBatch: verifies many signatures over shared thread pool
+        setPool: resizes or shuts down shared thread pool
+        setCache: resizes or turns off verification cache
+
     """
+    __slots__ = ("_verify", )
+
+    Workers = None  # max threads in pool, None means executor default
+    BatchMin = 4  # batches smaller than this are verified inline
+    _pool = None  # shared ThreadPoolExecutor created on demand
+    _poolLock = Lock()
+    Cache = LruCache(size=VERCACHESIZE)  # successful verifications
+
     def __init__(self, **kwa):
         """
         Assign verification cipher suite function to ._verify
@@ -649,8 +981,96 @@ class Verfer(CryMat):
         Parameters:
             sig is bytes signature
             ser is bytes serialization
+
+        Successful verifications are cached in .Cache so repeats of the same
+        signature on the same serialization are not verified again.
         """
-        return (self._verify(sig=sig, ser=ser, key=self.raw))
+        cache = self.Cache
+        if cache is None:
+            return (self._verify(sig=sig, ser=ser, key=self.raw))
+
+        key = (self.code, self.raw, bytes(sig), blake3.blake3(ser).digest())
+        if cache.get(key, False):
+            return True
+
+        result = self._verify(sig=sig, ser=ser, key=self.raw)
+        if result:  # only cache success
+            cache.put(key, True)
+        return result
+
+
+    @classmethod
+    def verifyBatch(cls, triples):
+        """
+        Returns list of bools one per triple in order where each is True if
+        signature verifies False otherwise.
+        When there are at least .BatchMin triples the verifications are spread
+        over the shared thread pool. libsodium is called through ctypes which
+        releases the GIL so verifications run in parallel across cores.
+
+        Parameters:
+            triples is iterable of (verfer, sig, ser) where
+                verfer is Verfer instance whose .raw is public key
+                sig is bytes signature
+                ser is bytes serialization
+        """
+        triples = list(triples)
+        if len(triples) < cls.BatchMin:
+            return [verfer.verify(sig, ser) for verfer, sig, ser in triples]
+
+        pool = cls._pool
+        if pool is None:
+            with cls._poolLock:
+                if cls._pool is None:
+                    cls._pool = ThreadPoolExecutor(max_workers=cls.Workers,
+                                                   thread_name_prefix="verfer")
+                pool = cls._pool
+
+        # one chunk per worker so pool overhead is per chunk not per triple
+        workers = cls.Workers or os.cpu_count() or 1
+        size = max(cls.BatchMin, -(-len(triples) // workers))
+        chunks = [triples[i:i + size] for i in range(0, len(triples), size)]
+        results = []
+        for verifies in pool.map(cls._verifyChunk, chunks):
+            results.extend(verifies)
+        return results
+
+
+    @staticmethod
+    def _verifyChunk(triples):
+        """
+        Returns list of verify results of triples (verfer, sig, ser) for pool map
+        """
+        return [verfer.verify(sig, ser) for verfer, sig, ser in triples]
+
+
+    @classmethod
+    def setPool(cls, workers=None, batchMin=None):
+        """
+        Shuts down shared thread pool if any so next batch creates a new pool
+        with workers threads.
+
+        Parameters:
+            workers is int max threads or None for executor default
+            batchMin is int min batch size to use pool or None to keep .BatchMin
+        """
+        with cls._poolLock:
+            if cls._pool is not None:
+                cls._pool.shutdown(wait=True)
+                cls._pool = None
+            cls.Workers = workers
+            if batchMin is not None:
+                cls.BatchMin = batchMin
+
+
+    @classmethod
+    def setCache(cls, size=VERCACHESIZE):
+        """
+        Replaces verification cache with new empty LruCache of size entries
+        or turns caching off when size is 0 or None
+        """
+        cls.Cache = LruCache(size=size) if size else None
+
 
     @staticmethod
     def _ed25519(sig, ser, key):
@@ -688,6 +1108,8 @@ class Sigver(CryMat):
 
 
     """
+    __slots__ = ("_verfer", )
+
     def __init__(self, verfer=None, **kwa):
         """
         Assign verfer to ._verfer attribute
@@ -733,6 +1155,8 @@ class Signer(CryMat):
         sign: create signature
 
     """
+    __slots__ = ("_sign", "_verfer")
+
     def __init__(self,raw=None, code=CryOneDex.Ed25519_Seed, transferable=True, **kwa):
         """
         Assign signing cipher suite function to ._sign
@@ -876,6 +1300,8 @@ class Diger(CryMat):
         verify: verifies signature
 
     """
+    __slots__ = ("_verify", )
+
     def __init__(self, raw=None, ser=None, code=CryOneDex.Blake3_256, **kwa):
         """
         Assign digest verification function to ._verify
@@ -944,6 +1370,8 @@ class Nexter(Diger):
 
 
     """
+    __slots__ = ("_sith", "_keys")
+
     def __init__(self, ser=None, sith=None, keys=None, ked=None, **kwa):
         """
         Assign digest verification function to ._verify
@@ -1061,6 +1489,8 @@ class Prefixer(CryMat):
         verify():  Verifies derivation of aid prefix
 
     """
+    __slots__ = ("_derive", "_verify")
+
     # element labels to exclude in digest or signature derivation from inception icp
     IcpExcludes = ["pre"]
     # element labels to exclude in digest or signature derivation from delegated inception dip
@@ -1451,6 +1881,29 @@ def B64ToInt(cs):
     return i
 
 
+def B64ToB2(cs):
+    """
+    Returns conversion of Base64 str cs to Base2 bytes
+
+    Each char of cs is one sextet. Sextets are left aligned in the fewest bytes
+    that hold them so any pad bits are zeros at the end of the last byte.
+    """
+    l = len(cs)
+    i = B64ToInt(cs) << (2 * (l % 4))  # left align sextets
+    return i.to_bytes((l * 3 + 3) // 4, "big")
+
+def B2ToB64(b, l, offset=0):
+    """
+    Returns conversion of the first l sextets of Base2 bytes b starting at
+    byte offset to Base64 str
+
+    b may be bytes, bytearray, or memoryview
+    """
+    n = (l * 3 + 3) // 4  # bytes that hold l sextets
+    i = int.from_bytes(b[offset:offset + n], "big") >> (2 * (l % 4))
+    return IntToB64(i, l=l)
+
+
 @dataclass(frozen=True)
 class SigSelectCodex:
     """
@@ -1627,6 +2080,7 @@ SigSizes.update(SigFourSizes)
 SigSizes.update(SigFiveSizes)
 
 MINSIGSIZE = min(SigSizes.values())
+MAXSIGSIZE = max(SigSizes.values())  # max bytes any sigmat consumes from stream
 
 SigIdxSizes = dict(SigCntIdxSizes)
 SigIdxSizes.update(SigTwoIdxSizes)
@@ -1638,6 +2092,20 @@ SigRawSizes.update(SigTwoRawSizes)
 SigRawSizes.update(SigFourRawSizes)
 SigRawSizes.update(SigFiveRawSizes)
 
+# Compiled codex tables used by hot paths instead of the codex instances.
+# See CryCodeSizes. Sig codes overlap Cry codes so have their own table.
+SigTwoCodes = frozenset(SigTwoDex)
+SigFourCodes = frozenset(SigFourDex)
+SigFiveCodes = frozenset(SigFiveDex)
+SigCntCodes = frozenset(SigCntDex)
+
+# Mapping of code to Sizage for every sig code
+SigCodeSizes = {code: Sizage(hs=len(code),
+                             ss=SigIdxSizes[code],
+                             rs=SigRawSizes[code],
+                             fs=SigSizes[code])
+                for code in (SigTwoCodes | SigFourCodes | SigFiveCodes | SigCntCodes)}
+
 
 class SigMat:
     """
@@ -1657,64 +2125,73 @@ class SigMat:
         .qb64 str in Base64 fully qualified with derivation code and signature crypto material
         .qb64b bytes in Base64 fully qualified with derivation code and signature crypto material
         .qb2  bytes in binary fully qualified with derivation code and signature crypto material
+        .size int number of qb64 bytes consumed by fully qualified material
+        .bsize int number of qb2 bytes consumed by fully qualified material
     """
+    __slots__ = ("_code", "_index", "_raw", "_qb64b", "_qb64")
+
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
-                 code=SigTwoDex.Ed25519, index=0):
+                 code=SigTwoDex.Ed25519, index=0, offset=0):
         """
         Validate as fully qualified
         Parameters:
             raw is bytes of unqualified crypto material usable for crypto operations
-            qb64b is bytes of fully qualified crypto material
+            qb64b is bytes, bytearray or memoryview of fully qualified crypto material
             qb64 is str or bytes of fully qualified crypto material
             qb2 is bytes of fully qualified crypto material
             code is str of derivation code cipher suite
             index is int of offset index into current signing key list
                    or if from SigCntDex then its count of attached signatures
+            offset is int offset into qb64b, qb64, or qb2 of start of material.
+                Allows extraction from a memoryview over a receive buffer
+                without first slicing off the material.
 
         When raw provided then validate that code is correct for length of raw
             and assign .raw .code and .index
         Else when either qb64 or qb2 provided then extract and assign .raw and .code
 
         """
+        self._qb64b = None  # memoized qualified encodings computed on demand
+        self._qb64 = None
         if raw is not None:  #  raw provided
             if not isinstance(raw, (bytes, bytearray)):
                 raise TypeError("Not a bytes or bytearray, raw={}.".format(raw))
             pad = self._pad(raw)
-            if (not ( (pad == 2 and (code in SigTwoDex)) or  # Two or Six or Ten
-                      (pad == 0 and (code in SigCntDex)) or  # Cnt (Count)
-                      (pad == 0 and (code in SigFourDex)) or  # Four or Eight
-                      (pad == 1 and (code in SigFiveDex)) )):   # Five or Nine
+            if (not ( (pad == 2 and (code in SigTwoCodes)) or  # Two or Six or Ten
+                      (pad == 0 and (code in SigCntCodes)) or  # Cnt (Count)
+                      (pad == 0 and (code in SigFourCodes)) or  # Four or Eight
+                      (pad == 1 and (code in SigFiveCodes)) )):   # Five or Nine
 
                 raise ValidationError("Wrong code={} for raw={}.".format(code, raw))
 
-            if ( (code in SigTwoDex and ((index < 0) or (index > SIGTWOMAX)) ) or
-                 (code in SigCntDex and ((index < 0) or (index > SIGFOURMAX)) ) or
-                 (code in SigFourDex and ((index < 0) or (index > SIGFOURMAX)) ) or
-                 (code in SigFiveDex and ((index < 0) or (index > SIGFIVEMAX)) ) ):
+            if ( (code in SigTwoCodes and ((index < 0) or (index > SIGTWOMAX)) ) or
+                 (code in SigCntCodes and ((index < 0) or (index > SIGFOURMAX)) ) or
+                 (code in SigFourCodes and ((index < 0) or (index > SIGFOURMAX)) ) or
+                 (code in SigFiveCodes and ((index < 0) or (index > SIGFIVEMAX)) ) ):
 
                 raise ValidationError("Invalid index={} for code={}.".format(index, code))
 
-            raw = raw[:SigRawSizes[code]]  # allows longer by truncating stream
-            if len(raw) != SigRawSizes[code]:  # forbids shorter
+            raw = raw[:SigCodeSizes[code].rs]  # allows longer by truncating stream
+            if len(raw) != SigCodeSizes[code].rs:  # forbids shorter
                 raise ValidationError("Unexpected raw size={} for code={}"
                                       " not size={}.".format(len(raw),
                                                              code,
-                                                             SigRawSizes[code]))
+                                                             SigCodeSizes[code].rs))
 
             self._code = code  # front part without index
             self._index = index
             self._raw = bytes(raw)  # crypto ops require bytes not bytearray
 
         elif qb64b is not None:
-            self._exfil(qb64b)
+            self._exfil(qb64b, offset=offset)
 
         elif qb64 is not None:
             if hasattr(qb64, "encode"):  #  ._exfil expects bytes not str
                 qb64 = qb64.encode("utf-8")  #  greedy so do not use on stream
-            self._exfil(qb64)
+            self._exfil(qb64, offset=offset)
 
-        elif qb2 is not None:  # rewrite to use direct binary exfiltration
-            self._exfil(encodeB64(qb2))
+        elif qb2 is not None:
+            self._bexfil(qb2, offset=offset)
 
         else:
             raise EmptyMaterialError("Improper initialization need raw or b64 or b2.")
@@ -1773,7 +2250,7 @@ class SigMat:
         Returns fully qualified attached sig base64 bytes computed from
         self.raw, self.code and self.index.
         """
-        l = SigIdxSizes[self._code]  # index length b64 characters
+        l = SigCodeSizes[self._code].ss  # index length b64 characters
         # full is pre code + index
         full =  "{}{}".format(self._code, IntToB64(self._index, l=l))
 
@@ -1783,66 +2260,150 @@ class SigMat:
             raise ValidationError("Invalid code + index = {} for converted raw pad = {}."
                                   .format(full, self.pad))
         # prepending full derivation code with index and strip off trailing pad characters
-        return (full.encode("utf-8") + encodeB64(self._raw)[:-pad])
+        return (full.encode("utf-8") + encodeB64(self._raw)[:-pad or None])
 
 
-    def _exfil(self, qb64b):
+    def _exfil(self, qb64b, offset=0):
         """
         Extracts self.code,self.index, and self.raw from qualified base64 qb64
+        starting at offset.
+
+        qb64b may be bytes, bytearray, or memoryview. Material is extracted in
+        place so qb64b is never sliced except for the text run that is decoded.
+        Slices of qb64b are never bound to names so that a memoryview over a
+        receive buffer does not hold an export of the buffer once done.
         """
-        if len(qb64b) < MINSIGSIZE:  # Need more bytes
+        if len(qb64b) - offset < MINSIGSIZE:  # Need more bytes
             raise ShortageError("Need more bytes.")
 
         cs = 1  # code size  initially 1 to extract selector or one char code
-        code = qb64b[:cs].decode("utf-8")  # get front code, convert to str
-        if hasattr(code, "decode"):  # converts bytes like to str
-            code = code.decode("utf-8")
-        index = 0
+        code = chr(qb64b[offset])  # get front code, convert to str
 
         # need to map code to length so can only consume proper number of chars
         # from front of qb64 so can use with full identifiers not just prefixes
 
-        if code in SigTwoDex:  # 2 char = 1 code + 1 index
-            qb64b = qb64b[:SigTwoSizes[code]]  # strip of full sigmat
+        if code in SigTwoCodes:  # 2 char = 1 code + 1 index
             cs += 1
-            index = B64IdxByChr[qb64b[cs-1:cs].decode("utf-8")]  # one character for index
 
         elif code == SigSelDex.four:  #  '0'
             cs += 1
-            code = qb64b[0:cs].decode("utf-8")  # get front code, convert to str
-            if code not in SigFourDex:  # 4 char = 2 code + 2 index
-                raise ValidationError("Invalid derivation code = {} in {}.".format(code, qb64b))
-            qb64b = qb64b[:SigFourSizes[code]]  # strip of full sigmat
+            code = bytes(qb64b[offset:offset + cs]).decode("utf-8")  # get front code
+            if code not in SigFourCodes:  # 4 char = 2 code + 2 index
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb64b[offset:offset + MAXSIGSIZE])))
             cs += 2
-            index = B64ToInt(qb64b[cs-2:cs].decode("utf-8"))  # two characters for index
 
         elif code == SigSelDex.dash:  #  '-'
             cs += 1
-            code = qb64b[0:cs].decode("utf-8")  # get front code, convert to str
-            if code not in SigCntDex:  # 4 char = 2 code + 2 index
-                raise ValidationError("Invalid derivation code = {} in {}.".format(code, qb64b))
-            qb64b = qb64b[:SigCntSizes[code]]  # strip of full sigmat
+            code = bytes(qb64b[offset:offset + cs]).decode("utf-8")  # get front code
+            if code not in SigCntCodes:  # 4 char = 2 code + 2 index
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb64b[offset:offset + MAXSIGSIZE])))
             cs += 2
-            index = B64ToInt(qb64b[cs-2:cs].decode("utf-8"))  # two characters for index
 
         else:
-            raise ValueError("Improperly coded material = {}".format(qb64b))
+            raise ValueError("Improperly coded material = {}"
+                             "".format(bytes(qb64b[offset:offset + MAXSIGSIZE])))
 
-        if len(qb64b) != SigSizes[code]:  # not correct length
-            if len(qb64b) <  SigSizes[code]:  #  need more bytes
-                raise ShortageError("Need more bytes.")
-            else:
-                raise ValidationError("Bad qb64b size expected {}, got {} "
-                                      "bytes.".format(SigSizes[code],
-                                                      len(qb64b)))
+        size = SigCodeSizes[code].fs  # full size of qualified sigmat
+        if len(qb64b) - offset < size:  #  need more bytes
+            raise ShortageError("Need more bytes.")
+
+        # index characters follow code characters
+        ics = cs - SigCodeSizes[code].ss  # start of index characters
+        index = B64ToInt(bytes(qb64b[offset + ics:offset + cs]).decode("utf-8"))
 
         pad = cs % 4  # pad is remainder pre mod 4
-        # strip off prepended code and append pad characters
-        base = qb64b[cs:] + pad * BASE64_PAD
-        raw = decodeB64(base)
+        # decode text run after prepended code with appended pad characters
+        # join copies the run out of qb64b in one step whatever its type
+        raw = decodeB64(b''.join((qb64b[offset + cs:offset + size],
+                                  pad * BASE64_PAD)))
+
+        if len(raw) != (size - cs) * 3 // 4:  # exact lengths
+            raise ValueError("Improperly qualified material = {}"
+                             "".format(bytes(qb64b[offset:offset + size])))
+
+        self._code = code
+        self._index = index
+        self._raw = raw
+        self._qb64b = bytes(qb64b[offset:offset + size])  # parsed text is canonical
+
+
+    def _binfil(self):
+        """
+        Returns fully qualified attached sig base2 bytes computed from
+        self.raw, self.code and self.index without Base64 encoding.
+        """
+        l = SigCodeSizes[self._code].ss  # index length b64 characters
+        # full is pre code + index
+        full =  "{}{}".format(self._code, IntToB64(self._index, l=l))
+
+        pad = self.pad
+        # valid pad for code length
+        if len(full) % 4 != pad:  # pad is not remainder of len(code) % 4
+            raise ValidationError("Invalid code + index = {} for converted raw pad = {}."
+                                  .format(full, self.pad))
+        raw = self._raw
+        i = (B64ToInt(full) << (8 * len(raw))) | int.from_bytes(raw, "big")
+        return (i << (2 * pad)).to_bytes(SigCodeSizes[self._code].fs * 3 // 4, "big")
+
+
+    def _bexfil(self, qb2, offset=0):
+        """
+        Extracts self.code, self.index, and self.raw from qualified base2 bytes
+        qb2 starting at offset without Base64 decoding.
+
+        qb2 may be bytes, bytearray, or memoryview. As with ._exfil slices of
+        qb2 are never bound to names.
+        """
+        if len(qb2) - offset < MINSIGSIZE * 3 // 4:  # Need more bytes
+            raise ShortageError("Need more bytes.")
+
+        cs = 1  # code size  initially 1 to extract selector or one char code
+        code = B64ChrByIdx[qb2[offset] >> 2]  # leading sextet as str
+
+        if code in SigTwoCodes:  # 2 char = 1 code + 1 index
+            cs += 1
+
+        elif code == SigSelDex.four:  #  '0'
+            cs += 1
+            code = B2ToB64(qb2, cs, offset=offset)  # get front code
+            if code not in SigFourCodes:  # 4 char = 2 code + 2 index
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb2[offset:offset + MAXSIGSIZE])))
+            cs += 2
+
+        elif code == SigSelDex.dash:  #  '-'
+            cs += 1
+            code = B2ToB64(qb2, cs, offset=offset)  # get front code
+            if code not in SigCntCodes:  # 4 char = 2 code + 2 index
+                raise ValidationError("Invalid derivation code = {} in {}."
+                                      "".format(code,
+                                                bytes(qb2[offset:offset + MAXSIGSIZE])))
+            cs += 2
+
+        else:
+            raise ValueError("Improperly coded material = {}"
+                             "".format(bytes(qb2[offset:offset + MAXSIGSIZE])))
+
+        bs = SigCodeSizes[code].fs * 3 // 4  # full binary size of qualified sigmat
+        if len(qb2) - offset < bs:  #  need more bytes
+            raise ShortageError("Need more bytes.")
 
-        if len(raw) != (len(qb64b) - cs) * 3 // 4:  # exact lengths
-            raise ValueError("Improperly qualified material = {}".format(qb64b))
+        # index characters follow code characters
+        ics = cs - SigCodeSizes[code].ss  # start of index characters
+        index = B64ToInt(B2ToB64(qb2, cs, offset=offset)[ics:])
+
+        pad = cs % 4  # pad is remainder pre mod 4
+        rs = SigCodeSizes[code].rs
+        i = int.from_bytes(qb2[offset:offset + bs], "big")
+        if i & ((1 << (2 * pad)) - 1):  # pad bits must be zero
+            raise ValueError("Improperly qualified material = {}"
+                             "".format(bytes(qb2[offset:offset + bs])))
+        raw = ((i >> (2 * pad)) & ((1 << (8 * rs)) - 1)).to_bytes(rs, "big")
 
         self._code = code
         self._index = index
@@ -1855,8 +2416,11 @@ class SigMat:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Computed once since material is immutable
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
 
     @property
@@ -1865,8 +2429,11 @@ class SigMat:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Computed once since material is immutable
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -1874,11 +2441,27 @@ class SigMat:
         """
         Property qb2:
         Returns Fully Qualified Binary Version
-        redo to use b64 to binary decode table since faster
         """
-        # rewrite to do direct binary infiltration by
-        # decode self.code as bits and prepend to self.raw
-        return decodeB64(self._infil())
+        return self._binfil()
+
+
+    @property
+    def size(self):
+        """
+        Property size:
+        Returns number of bytes in .qb64b taken from code size table so
+        stream extractors may skip over material without reencoding it
+        """
+        return SigCodeSizes[self._code].fs
+
+
+    @property
+    def bsize(self):
+        """
+        Property bsize:
+        Returns number of bytes in .qb2 taken from code size table
+        """
+        return SigCodeSizes[self._code].fs * 3 // 4
 
 
 class SigCounter(SigMat):
@@ -1902,6 +2485,8 @@ class SigCounter(SigMat):
 
 
     """
+    __slots__ = ()
+
     def __init__(self, raw=None, qb64b =None, qb64=None, qb2=None,
                  code=SigCntDex.Base64, index=None, count=None, **kwa):
         """
@@ -1925,7 +2510,7 @@ class SigCounter(SigMat):
         super(SigCounter, self).__init__(raw=raw, qb64b=qb64b, qb64=qb64, qb2=qb2,
                                          code=code, index=index, **kwa)
 
-        if self.code not in SigCntDex:
+        if self.code not in SigCntCodes:
             raise ValidationError("Invalid code = {} for SigCounter."
                                   "".format(self.code))
 
@@ -1956,6 +2541,8 @@ class Siger(SigMat):
 
 
     """
+    __slots__ = ("_verfer", )
+
     def __init__(self, verfer=None, **kwa):
         """
         Assign verfer to ._verfer
@@ -2003,30 +2590,38 @@ class Serder:
         .size is int of number of bytes in serialed event only
 
     """
-    def __init__(self, raw=b'', ked=None, kind=None):
+    def __init__(self, raw=b'', ked=None, kind=None, offset=0, lazy=False):
         """
         Deserialize if raw provided
         Serialize if ked provided but not raw
         When serilaizing if kind provided then use kind instead of field in ked
 
         Parameters:
-          raw is bytes of serialized event plus any attached signatures
+          raw is bytes, bytearray, or memoryview of serialized event plus any
+            attached signatures
+          offset is int offset into raw of start of serialized event. Allows
+            deserializing from a memoryview over a receive buffer so that the
+            only copy made is that of the event bytes into .raw
           ked is key event dict or None
             if None its deserialized from raw
           kind is serialization kind string value or None (see namedtuple coring.Serials)
             supported kinds are 'json', 'cbor', 'msgpack', 'binary'
             if kind is None then its extracted from ked or raw
           size is int number of bytes in raw if any
+          lazy is Boolean True means when deserializing only sniff the version
+            string of raw so that .ked is not decoded until first accessed.
+            Useful when only .raw, .size, or .dig are needed such as when
+            skipping or forwarding events.
 
 
         Attributes:
           ._raw is bytes of serialized event only
-          ._ked is key event dict
+          ._ked is key event dict or None when not yet decoded from ._raw
           ._kind is serialization kind string value (see namedtuple coring.Serials)
             supported kinds are 'json', 'cbor', 'msgpack', 'binary'
           ._version is Versionage instance of event version
           ._size is int of number of bytes in serialed event only
-          ._diger is Diger instance of digest of .raw
+          ._diger is Diger instance of digest of .raw or None when not yet computed
 
         Properties:
           .raw is bytes of serialized event only
@@ -2034,15 +2629,15 @@ class Serder:
           .kind is serialization kind string value (see namedtuple coring.Serials)
           .version is Versionage instance of event version
           .size is int of number of bytes in serialed event only
-          .diger is Diger instance of digest of .raw
+          .diger is Diger instance of digest of .raw computed on first access
           .dig  is qb64 digest from .diger
           .digb is qb64b digest from .diger
 
         Note:
           loads and jumps of json use str whereas cbor and msgpack use bytes
         """
-        if raw:  # deserialize raw using property
-            self.raw = raw  # raw property setter does the deserialization
+        if raw:  # deserialize raw
+            self._ingest(raw=raw, offset=offset, lazy=lazy)
         elif ked: # serialize ked
             self._kind = kind
             self.ked = ked  # ked property setter does the serialization
@@ -2050,74 +2645,51 @@ class Serder:
             raise ValueError("Improper initialization need raw or ked.")
 
     @staticmethod
-    def _sniff(raw):
+    def _sniff(raw, offset=0):
         """
         Returns serialization kind, version and size from serialized event raw
         by investigating leading bytes that contain version string
 
         Parameters:
-          raw is bytes of serialized event
+          raw is bytes, bytearray, or memoryview of serialized event
+          offset is int offset into raw of start of serialized event
 
         """
-        if len(raw) < MINSNIFFSIZE:
-            raise ShortageError("Need more bytes.")
-
-        match = Rever.search(raw)  #  Rever's regex takes bytes
-        if not match or match.start() > 12:
-            raise ValueError("Invalid version string in raw = {}".format(raw))
-
-        major, minor, kind, size = match.group("major", "minor", "kind", "size")
-        version = Versionage(major=int(major, 16), minor=int(minor, 16))
-        kind = kind.decode("utf-8")
-        if kind not in Serials:
-            raise ValueError("Invalid serialization kind = {}".format(kind))
-        size = int(size, 16)
+        kind, version, size, start = Sniff(raw, offset=offset)
         return(kind, version, size)
 
 
-    def _inhale(self, raw):
+    def _inhale(self, raw, offset=0, lazy=False):
         """
         Parses serilized event ser of serialization kind and assigns to
         instance attributes.
 
         Parameters:
-          raw is bytes of serialized event
-          kind is str of raw serialization kind (see namedtuple Serials)
-          size is int size of raw to be deserialized
+          raw is bytes, bytearray, or memoryview of serialized event
+          offset is int offset into raw of start of serialized event
+          lazy is Boolean True means only sniff and validate version string
+            and size and return None for ked
 
         Note:
           loads and jumps of json use str whereas cbor and msgpack use bytes
+          When raw is a memoryview, backends load directly from the view.
+          Backends are looked up in Serializers by kind.
 
         """
-        kind, version, size = self._sniff(raw)
+        kind, version, size = self._sniff(raw, offset=offset)
         if version != Version:
             raise VersionError("Unsupported version = {}.{}".format(version.major,
                                                                     version.minor))
 
-        if len(raw) < size:
+        if len(raw) - offset < size:
             raise ShortageError("Need more bytes.")
 
-        if kind == Serials.json:
-            try:
-                ked = json.loads(raw[:size].decode("utf-8"))
-            except Exception as ex:
-                raise ex
-
-        elif kind == Serials.mgpk:
-            try:
-                ked = msgpack.loads(raw[:size])
-            except Exception as ex:
-                raise ex
-
-        elif kind ==  Serials.cbor:
-            try:
-                ked = cbor.loads(raw[:size])
-            except Exception as ex:
-                raise ex
-
-        else:
+        if lazy:
             ked = None
 
+        else:  # kind is in Serials so has backend
+            ked = Serializers[kind].loads(raw[offset:offset + size])
+
         return (ked, kind, version, size)
 
 
@@ -2147,32 +2719,33 @@ class Serder:
         if kind not in Serials:
             raise ValueError("Invalid serialization kind = {}".format(kind))
 
-        if kind == Serials.json:
-            raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-
-        elif kind == Serials.mgpk:
-            raw = msgpack.dumps(ked)
-
-        elif kind == Serials.cbor:
-            raw = cbor.dumps(ked)
-
-        else:
-            raise ValueError("Invalid serialization kind = {}".format(kind))
-
-        size = len(raw)
-
-        match = Rever.search(raw)  #  Rever's regex takes bytes
-        if not match or match.start() > 12:
-            raise ValueError("Invalid version string in raw = {}".format(raw))
-
-        fore, back = match.span()  #  full version string
-        # update vs with latest kind version size
-        vs = Versify(version=version, kind=kind, size=size)
-        # replace old version string in raw with new one
-        raw = b'%b%b%b' % (raw[:fore], vs.encode("utf-8"), raw[back:])
-        if size != len(raw):  # substitution messed up
-            raise ValueError("Malformed version string size = {}".format(vs))
-        ked['vs'] = vs  #  update ked
+        # placeholder vs has final kind and version and same length as final
+        # so serialize once and then splice in only the size digits
+        vs = ked['vs']
+        ked['vs'] = Versify(version=version, kind=kind, size=0)
+        try:
+            raw = Serializers[kind].dumps(ked)
+            size = len(raw)
+            if size >= 16 ** VERRAWSIZE:  # size digits would overflow
+                raise ValueError("Serialization size = {} too large for version"
+                                 " string".format(size))
+
+            fore = VERSTARTS[Serials.index(kind)]  # fixed start when vs first field
+            if Unversify(raw, fore) is None:  # not first field so search
+                match = Rever.search(raw)  #  Rever's regex takes bytes
+                if not match or match.start() > 12:
+                    raise ValueError("Invalid version string in raw = {}".format(raw))
+                fore = match.start()
+        except BaseException:
+            ked['vs'] = vs  # leave ked as given on failure
+            raise
+
+        # splice size digits that precede terminator of placeholder version
+        # string in one join so raw is copied only once
+        back = fore + VERFULLSIZE - 1
+        raw = b''.join((raw[:back - VERRAWSIZE], b"%0*x" % (VERRAWSIZE, size),
+                        raw[back:]))
+        ked['vs'] = Versify(version=version, kind=kind, size=size)  #  update ked
 
         return (raw, kind, ked, version)
 
@@ -2184,18 +2757,27 @@ class Serder:
     @raw.setter
     def raw(self, raw):
         """ raw property setter """
-        ked, kind, version, size = self._inhale(raw=raw)
-        self._raw = bytes(raw[:size])  # crypto ops require bytes not bytearray
+        self._ingest(raw=raw)
+
+    def _ingest(self, raw, offset=0, lazy=False):
+        """
+        Deserializes event in raw at offset and assigns instance attributes.
+        The event bytes are copied out of raw exactly once into ._raw
+        When lazy the ked is left undecoded until first accessed.
+        """
+        ked, kind, version, size = self._inhale(raw=raw, offset=offset, lazy=lazy)
+        self._raw = bytes(raw[offset:offset + size])  # crypto ops require bytes not bytearray
         self._ked = ked
         self._kind = kind
         self._version = version
         self._size = size
-        self._diger = Diger(raw=blake3.blake3(self._raw).digest(),
-                            code=CryOneDex.Blake3_256)
+        self._diger = None  # digest computed on demand
 
     @property
     def ked(self):
-        """ ked property getter"""
+        """ ked property getter decodes ._raw on first access when lazy"""
+        if self._ked is None:
+            self._ked, _, _, _ = self._inhale(raw=self._raw)
         return self._ked
 
     @ked.setter
@@ -2208,8 +2790,7 @@ class Serder:
         self._kind = kind
         self._size = size
         self._version = version
-        self._diger = Diger(raw=blake3.blake3(self._raw).digest(),
-                            code=CryOneDex.Blake3_256)
+        self._diger = None  # digest computed on demand
 
     @property
     def kind(self):
@@ -2218,14 +2799,15 @@ class Serder:
 
     @kind.setter
     def kind(self, kind):
-        """ kind property setter Assumes ._ked """
-        raw, kind, ked, version = self._exhale(ked=self._ked, kind=kind)
+        """ kind property setter Assumes .ked """
+        raw, kind, ked, version = self._exhale(ked=self.ked, kind=kind)
         size = len(raw)
         self._raw = raw[:size]
         self._ked = ked
         self._kind = kind
         self._size = size
         self._version = version
+        self._diger = None  # raw changed so digest is stale
 
     @property
     def version(self):
@@ -2242,7 +2824,11 @@ class Serder:
         """
         Returns Diger of digest of self.raw
         diger (digest material) property getter
+        Digest is computed from .raw on first access without decoding .ked
         """
+        if self._diger is None:
+            self._diger = Diger(raw=blake3.blake3(self._raw).digest(),
+                                code=CryOneDex.Blake3_256)
         return self._diger
 
     @property
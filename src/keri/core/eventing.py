@@ -6,12 +6,16 @@ keri.core.eventing module
 
 import re
 import json
+import time
 
 from dataclasses import dataclass, astuple
-from collections import namedtuple, deque
+from collections import namedtuple, deque, OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
 from math import ceil
+from threading import Lock
 
 import cbor2 as cbor
 import msgpack
@@ -28,8 +32,20 @@ from ..db.dbing import dgKey, snKey, Logger
 
 from .coring import Versify, Serials, Ilks, CryOneDex
 from .coring import Signer, Verfer, Diger, Nexter, Prefixer, Serder
-from .coring import CryCounter, Sigver
-from .coring import SigCounter, Siger
+from .coring import CryCounter, Sigver, CryCntDex
+from .coring import SigCounter, Siger, SigCntDex, B64IdxByChr
+
+B2DASH = B64IdxByChr["-"]  # leading sextet of a qb2 counter code
+
+
+def _sniffB2(ims, offset):
+    """
+    Returns True if the material at offset in ims is a qb2 counter.
+    The leading sextet of a qb2 counter is the index of '-' which can not
+    start any qb64 text since every Base64 char is 7 bit ascii.
+    """
+    return (offset < len(ims) and (ims[offset] >> 2) == B2DASH)
+
 
 ICP_LABELS = ["vs", "pre", "sn", "ilk", "sith", "keys", "nxt",
               "toad", "wits", "cnfg"]
@@ -396,6 +412,7 @@ class Kever:
         .EstOnly is Boolean
                 True means allow only establishment events
                 False means allow all events
+        .StateVersion is int version of serialized key state records
 
     Attributes:
         .version is version of current event state
@@ -419,6 +436,7 @@ class Kever:
 
     """
     EstOnly = False
+    StateVersion = 1
 
     def __init__(self, serder, sigers, estOnly=None, logger=None):
         """
@@ -529,7 +547,7 @@ class Kever:
 
         # verify sith given signatures verify
         if not self.verifySith(sigers=sigers):  # uses self.sith
-            self.escrowEvent(self, serder, sigers, self.prefixer.qb64b, self.sn)
+            self.escrowEvent(serder, sigers, self.prefixer.qb64b, self.sn)
 
             raise ValidationError("Failure verifying sith = {} on sigs for {}"
                                   "".format(self.sith, sigers))
@@ -601,7 +619,7 @@ class Kever:
                     if praw is None:
                         raise ValidationError("Invalid recovery attempt: "
                                               " Bad dig = {}.".format(pdig))
-                    pserder = Serder(raw=bytes(praw))  # deserialize prior event raw
+                    pserder = Serder(raw=bytes(praw), lazy=True)  # only dig needed
                     if dig != pserder.dig:  # bad recovery event
                         raise ValidationError("Invalid recovery attempt:"
                                               "Mismatch recovery event prior dig"
@@ -690,7 +708,7 @@ class Kever:
 
             # verify sith given signatures verify
             if not self.verifySith(sigers=sigers, sith=sith):  # uses new sith
-                self.escrowEvent(self, serder, sigers, self.prefixer.qb64b, sn)
+                self.escrowEvent(serder, sigers, self.prefixer.qb64b, sn)
                 raise ValidationError("Failure verifying sith = {} on sigs for {}"
                                       "".format(self.sith, sigers))
 
@@ -748,7 +766,7 @@ class Kever:
 
             # verify sith given signatures verify
             if not self.verifySith(sigers=sigers):  # uses self.sith
-                self.escrowEvent(self, serder, sigers, self.prefixer.qb64b, sn)
+                self.escrowEvent(serder, sigers, self.prefixer.qb64b, sn)
                 raise ValidationError("Failure verifying sith = {} on sigs for {}"
                                       "".format(self.sith, sigers))
 
@@ -773,14 +791,12 @@ class Kever:
             serder is Serder instance
 
         """
-        for siger in sigers:
-            if not siger.verfer.verify(siger.raw, serder.raw):
-                return False
-
         if len(sigers) < 1:  # at least one signature
             return False
 
-        return True
+        # large multisig batches are verified in parallel over thread pool
+        return all(Verfer.verifyBatch((siger.verfer, siger.raw, serder.raw)
+                                      for siger in sigers))
 
     def verifySith(self, sigers, sith=None):
         """
@@ -802,19 +818,83 @@ class Kever:
 
         return True
 
+    def state(self):
+        """
+        Returns bytes serialized versioned key state record of current state.
+        Restore with .fromState
+        """
+        state = dict(v=self.StateVersion,
+                     vs=[self.version.major, self.version.minor],
+                     pre=self.prefixer.qb64,
+                     sn=self.sn,
+                     dig=self.diger.qb64,
+                     ilk=self.ilk,
+                     sith=self.sith,
+                     keys=[verfer.qb64 for verfer in self.verfers],
+                     nxt=self.nexter.qb64 if self.nexter is not None else "",
+                     toad=self.toad,
+                     wits=list(self.wits),
+                     cnfg=self.cnfg,
+                     estOnly=self.estOnly,
+                     lastEst=[self.lastEst.sn, self.lastEst.dig])
+        return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+
+    @classmethod
+    def fromState(cls, state, logger=None):
+        """
+        Returns Kever restored from serialized key state record state as made
+        by .state without replaying or reverifying its KEL.
+        Raises ValidationError if state is not a supported key state record.
+
+        Parameters:
+            state is bytes serialized key state record such as from .logger.stts
+            logger is Logger instance
+        """
+        try:
+            state = json.loads(bytes(state).decode("utf-8"))
+            if state["v"] != cls.StateVersion:
+                raise ValidationError("Unsupported key state version = {}."
+                                      "".format(state["v"]))
+            kever = cls.__new__(cls)
+            kever.logger = logger if logger is not None else Logger()
+            kever.version = Versionage(*state["vs"])
+            kever.prefixer = Prefixer(qb64=state["pre"])
+            kever.sn = state["sn"]
+            kever.diger = Diger(qb64=state["dig"])
+            kever.ilk = state["ilk"]
+            kever.sith = state["sith"]
+            kever.verfers = [Verfer(qb64=key) for key in state["keys"]]
+            kever.nexter = Nexter(qb64=state["nxt"]) if state["nxt"] else None
+            kever.nonTrans = True if kever.nexter is None else False
+            kever.toad = state["toad"]
+            kever.wits = state["wits"]
+            kever.cnfg = state["cnfg"]
+            kever.estOnly = True if state["estOnly"] else False
+            kever.lastEst = LastEstLoc(sn=state["lastEst"][0],
+                                       dig=state["lastEst"][1])
+        except ValidationError:
+            raise
+        except Exception as ex:
+            raise ValidationError("Invalid key state = {}.".format(state))
+        return kever
+
+
     def logEvent(self, serder, sigers):
         """
-        Update associated logs for verified event
+        Update associated logs and persisted key state for verified event
 
         Parameters:
             serder is Serder instance of current event
             sigers is list of Siger instance for current event
         """
-        dgkey = dgKey(self.prefixer.qb64b, self.diger.qb64b)
-        self.logger.putDts(dgkey, nowIso8601().encode("utf-8"))
-        self.logger.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.logger.putEvt(dgkey, serder.raw)
-        self.logger.addKe(snKey(self.prefixer.qb64b, self.sn), self.diger.qb64b)
+        self.logger.logEvt(pre=self.prefixer.qb64b,
+                           dig=self.diger.qb64b,
+                           sn=self.sn,
+                           raw=serder.raw,
+                           sigs=[siger.qb64b for siger in sigers],
+                           idx=self.logger.kels,
+                           state=self.state())
 
     def escrowEvent(self, serder, sigers, pre, sn):
         """
@@ -826,11 +906,177 @@ class Kever:
             pre is str qb64 ofidentifier prefix of event
             sn is int sequence number of event
         """
-        dgkey = dgKey(pre, serder.digb)
-        self.logger.putDts(dgkey, nowIso8601().encode("utf-8"))
-        self.logger.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.logger.putEvt(dgkey, serder.raw)
-        self.logger.addPses(snKey(pre, sn), serder.digb)
+        self.logger.logEvt(pre=pre,
+                           dig=serder.digb,
+                           sn=sn,
+                           raw=serder.raw,
+                           sigs=[siger.qb64b for siger in sigers],
+                           idx=self.logger.pses)
+
+
+class Kevers(MutableMapping):
+    """
+    Kevers is mapping of qb64 prefix to Kever that may replace the kevers dict
+    of Kevery and Habitat. Keeps at most a budget of least recently used Kevers
+    resident and loads others on demand from persisted key state in .logger.
+    Safe to share across threads.
+
+    Every accepted event persists the key state of its Kever with the event
+    in Kever.logEvent so evicted Kevers need no write back. Callers should
+    look up a Kever by prefix each time they need it and not hold evicted ones.
+
+    Class Attributes:
+        .Size is int default max number of resident Kevers
+        .StateFactor is int estimated resident bytes per serialized key state byte
+
+    Attributes:
+        .logger is Logger instance of persisted key states
+        .size is int max number of resident Kevers or None for no limit
+        .maxBytes is int max estimated resident bytes or None for no limit
+        .hits is int count of lookups that found resident Kever
+        .misses is int count of lookups that loaded Kever from .logger
+        .evictions is int count of resident Kevers evicted
+
+    Properties:
+        .resident is int number of resident Kevers
+        .nbytes is int estimated resident bytes of resident Kevers
+        .rate is float hit ratio of lookups or 0.0 before any lookup
+
+    """
+    Size = 65536
+    StateFactor = 5
+
+    def __init__(self, logger=None, size=None, maxBytes=None):
+        """
+        Parameters:
+            logger is Logger instance
+            size is int max number of resident Kevers. Defaults to .Size
+                The most recently used Kever is always resident
+            maxBytes is int max estimated resident bytes or None for no limit
+        """
+        if logger is None:
+            logger = Logger()  # default name = "main"
+        self.logger = logger
+        self.size = size if size is not None else self.Size
+        self.maxBytes = maxBytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._nbytes = 0
+        self._entries = OrderedDict()  # pre to (kever, nbytes) most recent last
+        self._lock = Lock()
+
+    @property
+    def resident(self):
+        """
+        Returns int number of resident Kevers
+        """
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        """
+        Returns int estimated resident bytes of resident Kevers
+        """
+        return self._nbytes
+
+    @property
+    def rate(self):
+        """
+        Returns float hit ratio of lookups
+        """
+        lookups = self.hits + self.misses
+        return (self.hits / lookups) if lookups else 0.0
+
+    def __getitem__(self, pre):
+        """
+        Returns Kever at pre marked most recently used. Loads Kever from
+        persisted key state on miss. Raises KeyError if no key state for pre.
+        """
+        with self._lock:
+            entry = self._entries.get(pre)
+            if entry is not None:
+                self._entries.move_to_end(pre)
+                self.hits += 1
+                return entry[0]
+        state = self.logger.getState(pre)
+        if state is None:
+            raise KeyError(pre)
+        kever = Kever.fromState(state, logger=self.logger)
+        with self._lock:
+            self.misses += 1
+            entry = self._entries.get(pre)
+            if entry is not None:  # loaded meanwhile by other thread
+                self._entries.move_to_end(pre)
+                return entry[0]
+            self._insert(pre, kever, len(state))
+        return kever
+
+    def __setitem__(self, pre, kever):
+        """
+        Makes kever resident at pre as most recently used. Its key state was
+        persisted when its events were logged.
+        """
+        with self._lock:
+            self._insert(pre, kever, len(kever.state()))
+
+    def __delitem__(self, pre):
+        """
+        Removes Kever at pre and its persisted key state
+        Raises KeyError if no Kever at pre
+        """
+        with self._lock:
+            entry = self._entries.pop(pre, None)
+            if entry is not None:
+                self._nbytes -= entry[1]
+        if not self.logger.delState(pre) and entry is None:
+            raise KeyError(pre)
+
+    def __contains__(self, pre):
+        """
+        Returns True if resident or persisted Kever at pre. Does not load it
+        """
+        return pre in self._entries or self.logger.getState(pre) is not None
+
+    def __iter__(self):
+        """
+        Returns iterator of qb64 prefixes of all persisted Kevers
+        """
+        for pre, state in self.logger.getStateItemIter():
+            yield pre.decode("utf-8")
+
+    def __len__(self):
+        """
+        Returns int count of persisted Kevers
+        """
+        return self.logger.cntStates()
+
+    def _insert(self, pre, kever, size):
+        """
+        Inserts kever at pre with serialized key state size and evicts least
+        recently used Kevers over budget. Caller holds ._lock
+        """
+        entry = self._entries.pop(pre, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+        nbytes = size * self.StateFactor
+        self._entries[pre] = (kever, nbytes)
+        self._nbytes += nbytes
+        while len(self._entries) > 1 and \
+                ((self.size is not None and len(self._entries) > self.size) or
+                 (self.maxBytes is not None and self._nbytes > self.maxBytes)):
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
+            self.evictions += 1
+
+    def evict(self):
+        """
+        Evicts all resident Kevers. Counters are kept
+        """
+        with self._lock:
+            self.evictions += len(self._entries)
+            self._entries.clear()
+            self._nbytes = 0
 
 
 class Kevery:
@@ -846,15 +1092,31 @@ class Kevery:
     Attributes:
         .ims is bytearray incoming message stream
         .cues is deque of Cues i.e. notices of events or requests to respond to
-        .kevers is dict of existing kevers indexed by pre (qb64) of each Kever
+        .kevers is dict or Kevers mapping of existing kevers indexed by
+            pre (qb64) of each Kever
         .logs is named tuple of logs
         .framed is Boolean stream is packet framed If True Else not framed
+        .cursored is Boolean If True processAll walks stream with read offset
+            and trims consumed bytes once per batch Else strips each message
+        .pipelined is Boolean If True processAll first parses all available
+            messages then processes the messages of each prefix in order with
+            independent prefixes in parallel over a thread pool
+        .workers is int max threads in pipeline pool or None for default
+            pool is shut down by .close()
+        .sweepPeriod is float min seconds between bounded sweeps of expired
+            escrows in .logger run by processAll. 0.0 means never sweep.
+            Default .SweepPeriod is 0.0 since sweeps delete escrowed data
+            so deployments opt in with a period and .logger escrowTTLs
 
 
     Properties:
 
     """
-    def __init__(self, ims=None, cues=None, kevers=None, logger=None, framed=True):
+    SweepPeriod = 0.0  # default seconds between escrow sweeps, 0.0 never
+
+    def __init__(self, ims=None, cues=None, kevers=None, logger=None,
+                 framed=True, cursored=False, pipelined=False, workers=None,
+                 sweepPeriod=None):
         """
         Set up event stream and logs
 
@@ -862,6 +1124,15 @@ class Kevery:
         self.ims = ims if ims is not None else bytearray()
         self.cues = cues if cues is not None else deque()
         self.framed = True if framed else False  # extract until end-of-stream
+        self.cursored = True if cursored else False  # walk ims with offset
+        self.pipelined = True if pipelined else False  # parse then apply by pre
+        self.workers = workers
+        self._pool = None  # pipeline thread pool created on demand
+        self._touched = set()  # pres accepted in uncommitted .logger batch
+        self._deferred = None  # (dgkey, raw) vres promotions while lanes run
+        self.sweepPeriod = (self.SweepPeriod if sweepPeriod is None
+                            else sweepPeriod)
+        self._sweptAt = None  # monotonic time of last sweep so first sweeps
         self.kevers = kevers if kevers is not None else dict()
 
         if logger is None:
@@ -869,10 +1140,65 @@ class Kevery:
         self.logger = logger
 
 
+    def loadKevers(self):
+        """
+        Restores into .kevers a Kever for every prefix with a persisted key
+        state in .logger without replaying or reverifying KELs. Used on
+        startup instead of reprocessing all events.
+        Returns int count of kevers loaded
+        """
+        count = 0
+        for pre, state in self.logger.getStateItemIter():
+            self.kevers[pre.decode("utf-8")] = Kever.fromState(state,
+                                                               logger=self.logger)
+            count += 1
+        return count
+
+
+    def _reloadKevers(self, pres):
+        """
+        Restores in .kevers the Kever of each prefix in pres from its persisted
+        key state or removes it when none so in memory state never runs ahead
+        of aborted or failed writes to .logger.
+        """
+        for pre in pres:
+            state = self.logger.getState(pre)
+            if state is not None:
+                self.kevers[pre] = Kever.fromState(bytes(state),
+                                                   logger=self.logger)
+            elif pre in self.kevers:
+                del self.kevers[pre]
+
+
+    def close(self):
+        """
+        Shuts down the pipeline thread pool if any, waiting for running lanes
+        to finish. Safe to call more than once. A later pipelined processAll
+        creates a fresh pool on demand.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
     def processAll(self, ims=None):
         """
         Process all messages from incoming message stream, ims, when provided
         Otherwise process all messages from .ims
+
+        When .cursored then walk ims with a read offset instead of stripping
+        each message and attachment off the front of ims as it is extracted.
+        The consumed portion of ims is trimmed once when done so cost is linear
+        in the size of ims not quadratic.
+
+        When .logger has group commit enabled, .logger.batchSize nonzero, the
+        writes of many messages are committed together in one transaction.
+        Not used when .pipelined since lanes write from pool threads.
+        When the batch aborts the Kevers accepted since its last commit are
+        reloaded from persisted key state before the exception is reraised.
+
+        Sweeps expired escrows once done when .sweepPeriod has elapsed since
+        the last sweep so escrows stay bounded without a separate timer.
         """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
             if not isinstance(ims, bytearray):
@@ -880,38 +1206,284 @@ class Kevery:
         else:
             ims = self.ims
 
-        while ims:
-            try:
-                self.processOne(ims=ims, framed=self.framed)
+        if self.pipelined:
+            self._processPipelined(ims)
+            self.sweepEscrows()
+            return
 
-            except ShortageError as ex:  # need more bytes
-                break  # break out of while loop
+        try:
+            self._processBatched(ims)
+        except BaseException:
+            touched, self._touched = self._touched, set()
+            self._reloadKevers(touched)
+            raise
+        self._touched.clear()
+        self.sweepEscrows()
 
-            except Exception as ex:
-                # log diagnostics errors etc
-                #
-                del ims[:]  #  delete rest of stream
-                break
+
+    def sweepEscrows(self, force=False):
+        """
+        Removes expired escrowed events and receipts from .logger with work
+        bounded by .logger.sweepLimit entries per escrow kind when .sweepPeriod
+        seconds have elapsed since the last sweep or force.
+        Returns int count of escrow index entries swept
+        """
+        if not (self.sweepPeriod or force):
+            return 0
+        now = time.monotonic()
+        if (not force and self._sweptAt is not None and
+                now - self._sweptAt < self.sweepPeriod):
+            return 0
+        self._sweptAt = now
+        return self.logger.sweepEscrows()
 
 
-    def processOne(self, ims, framed=True):
+    def _processBatched(self, ims):
+        """
+        Processes all messages from ims in .logger batch if any. Forgets
+        touched prefixes whenever the batch commits.
+        """
+        with self.logger.batched():
+            if self.cursored:
+                offset = 0
+                mims = memoryview(ims)  # zero copy view parsers extract from
+                try:
+                    while offset < len(mims):
+                        try:
+                            offset = self.processOne(ims=mims,
+                                                     framed=self.framed,
+                                                     offset=offset)
+                            if self.logger.flush():
+                                self._touched.clear()
+
+                        except ShortageError as ex:  # need more bytes
+                            break  # break out of while loop leave partial msg in ims
+
+                        except Exception as ex:
+                            # log diagnostics errors etc
+                            #
+                            offset = len(ims)  #  drop rest of stream
+                            break
+                finally:
+                    mims.release()  # release export of ims so may be resized
+                    del ims[:offset]  # trim consumed portion once for whole batch
+                return
+
+            while ims:
+                try:
+                    self.processOne(ims=ims, framed=self.framed)
+                    if self.logger.flush():
+                        self._touched.clear()
+
+                except ShortageError as ex:  # need more bytes
+                    break  # break out of while loop
+
+                except Exception as ex:
+                    # log diagnostics errors etc
+                    #
+                    del ims[:]  #  delete rest of stream
+                    break
+
+
+    def processOne(self, ims, framed=True, offset=None):
         """
         Extract one msg with attached signatures from incoming message stream, ims
         And dispatch processing of message
 
+        Returns int offset into ims just past the extracted message and its
+        attachments.
+
         Parameters:
             ims is bytearray of serialized incoming message stream.
                 May contain one or more sets each of a serialized message with
                 attached cryptographic material such as signatures or receipts.
+                When offset is provided ims may be a memoryview over the stream.
 
             framed is Boolean, If True and no sig counter then extract signatures
                 until end-of-stream. This is useful for framed packets with
                 one event and one set of attached signatures per invocation.
 
+            offset is int read offset into ims of start of message or None.
+                When None the extracted message and its attachments are stripped
+                off the front of ims. Otherwise ims is left untouched and the
+                caller is responsible for trimming ims up to the returned offset.
+
+        """
+        start = offset if offset is not None else 0
+        serder, attachments, cursor = self._extractMsg(ims, start, framed)
+        if offset is None:
+            del ims[:cursor]  # strip off message and attachments from front of ims
+        self._dispatch(serder, attachments)
+        return cursor
+
+
+    def _extractMsg(self, ims, offset, framed=True):
+        """
+        Returns tuple (serder, attachments, offset) of one message extracted
+        from ims at offset, its attachments, and offset just past them.
+        attachments is list of Sigers for events and validator receipts,
+        list of Sigvers for receipts, or None for an unexpected ilk.
+        """
+        serder, cursor = self._extractSerder(ims, offset)
+        ilk = serder.ked['ilk']  # dispatch abased on ilk
+
+        if ilk in [Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt]:  # event msg
+            sigers, cursor = self._extractSigers(ims, cursor, framed)
+            if not sigers:
+                raise ValidationError("Missing attached signature(s).")
+            return (serder, sigers, cursor)
+
+        elif ilk in [Ilks.rct]:  # event receipt msg (nontransferable)
+            sigvers, cursor = self._extractCouplets(ims, cursor, framed)
+            if not sigvers:
+                raise ValidationError("Missing attached receipt couplet(s).")
+            return (serder, sigvers, cursor)
+
+        elif ilk in [Ilks.vrc]:  # validator event receipt msg (transferable)
+            sigers, cursor = self._extractSigers(ims, cursor, framed)
+            if not sigers:
+                raise ValidationError("Missing attached signature(s) to receipt.")
+            return (serder, sigers, cursor)
+
+        return (serder, None, cursor)
+
+
+    def _dispatch(self, serder, attachments):
+        """
+        Dispatch processing of message serder with attachments extracted by
+        ._extractMsg based on ilk
+        """
+        ilk = serder.ked['ilk']
+        if ilk in [Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt]:  # event msg
+            self.processEvent(serder, attachments)
+
+        elif ilk in [Ilks.rct]:  # event receipt msg (nontransferable)
+            self.processReceipt(serder, attachments)
+
+        elif ilk in [Ilks.vrc]:  # validator event receipt msg (transferable)
+            self.processChit(serder, attachments)
+
+        else:
+            raise ValidationError("Unexpected message ilk = {}.".format(ilk))
+
+
+    def _processPipelined(self, ims):
+        """
+        Process all messages in ims in stages.
+        First parse every complete message with its attachments by walking ims
+        with a read offset and trim consumed bytes once.
+        Then group messages by prefix into lanes that keep stream order for each
+        prefix and process the lanes in parallel over the thread pool. The
+        signature verification and database writes of independent prefixes
+        release the GIL so lanes use more than one core.
+
+        Validator receipts (vrc) depend on the key state of the validator
+        prefix so are barriers. All lanes before one finish before it is
+        processed and lanes after it start once it is done. For the same
+        reason escrowed triplets of events accepted by lanes are promoted
+        once the lanes are done since the validator Kevers they verify with
+        may be updated meanwhile by the lanes of the validators.
+
+        An error while parsing drops the rest of the stream as in serial mode.
+        An error while processing drops the rest of the lane of that prefix
+        only so other prefixes are not held up.
+        """
+        offset = 0
+        msgs = []  # (serder, attachments) in stream order
+        mims = memoryview(ims)  # zero copy view parsers extract from
+        try:
+            while offset < len(mims):
+                try:
+                    serder, attachments, cursor = self._extractMsg(mims,
+                                                                   offset,
+                                                                   self.framed)
+                except ShortageError as ex:  # need more bytes
+                    break  # leave partial msg in ims
+
+                except Exception as ex:
+                    # log diagnostics errors etc
+                    #
+                    offset = len(ims)  #  drop rest of stream
+                    break
+
+                if attachments is None:  # unexpected ilk
+                    offset = len(ims)  #  drop rest of stream
+                    break
+
+                offset = cursor
+                msgs.append((serder, attachments))
+        finally:
+            mims.release()  # release export of ims so may be resized
+            del ims[:offset]  # trim consumed portion once for whole batch
+
+        lanes = dict()  # lists of (serder, attachments) keyed by pre
+        for serder, attachments in msgs:
+            ked = serder.ked
+            if ked["ilk"] == Ilks.vrc:  # barrier
+                self._runLanes(lanes)
+                lanes = dict()
+                self._runLane([(serder, attachments)])
+            else:
+                lanes.setdefault(ked.get("pre"), []).append((serder, attachments))
+        self._runLanes(lanes)
+
+
+    def _runLanes(self, lanes):
+        """
+        Process lanes dict of lists of (serder, attachments) keyed by prefix.
+        Lanes run in parallel over thread pool when more than one.
+        Then promotes escrowed triplets of events accepted by lanes, deferred
+        until no lane may update the Kever of any validator.
+        """
+        self._deferred = []
+        try:
+            if len(lanes) > 1:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="kevery")
+                for _ in self._pool.map(self._runLane, lanes.values()):
+                    pass
+            else:
+                for lane in lanes.values():
+                    self._runLane(lane)
+        finally:
+            deferred, self._deferred = self._deferred, None
+
+        for dgkey, raw in deferred:
+            try:
+                self._promoteVres(dgkey, raw=raw)
+            except Exception as ex:
+                # log diagnostics errors etc
+                #
+                continue  # leave escrowed
+
+
+    def _runLane(self, lane):
+        """
+        Process list lane of (serder, attachments) in order.
+        Drops rest of lane on error.
+        """
+        for serder, attachments in lane:
+            try:
+                self._dispatch(serder, attachments)
+            except Exception as ex:
+                # log diagnostics errors etc
+                #
+                break  # drop rest of lane
+
+
+
+    @staticmethod
+    def _extractSerder(ims, offset):
+        """
+        Returns tuple (serder, offset) of message Serder deserialized from ims
+        at offset and offset just past the message.
+
+        ims may be a memoryview in which case only the bytes of the message
+        itself are copied out of ims.
         """
-        # deserialize packet from ims
         try:
-            serder = Serder(raw=ims)
+            serder = Serder(raw=ims, offset=offset)
 
         except ShortageError as ex:  # need more bytes
             raise ex  # reraise
@@ -925,111 +1497,100 @@ class Kevery:
             raise VersionError("Unsupported version = {}, expected {}."
                                   "".format(version, Version))
 
-        del ims[:serder.size]  # strip off event from front of ims
+        return (serder, offset + serder.size)
 
-        ilk = serder.ked['ilk']  # dispatch abased on ilk
 
-        if ilk in [Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt]:  # event msg
-            # extract sig counter if any for attached sigs
-            try:
-                counter = SigCounter(qb64b=ims)  # qb64b
-                nsigs = counter.count
-                del ims[:len(counter.qb64)]  # strip off counter
-            except ValidationError as ex:
-                nsigs = 0  # no signature count
-
-            # extract attached sigs as Sigers
-            sigers = []  # list of Siger instances for attached indexed signatures
-            if nsigs:
+    @staticmethod
+    def _extractSigers(ims, offset, framed=True):
+        """
+        Returns tuple (sigers, offset) of list of attached indexed signatures
+        extracted from ims at offset and offset just past them.
+        """
+        # extract sig counter if any for attached sigs
+        try:
+            if _sniffB2(ims, offset):  # counter itself is qb2
+                counter = SigCounter(qb2=ims, offset=offset)
+                offset += counter.bsize  # skip over counter
+            else:
+                counter = SigCounter(qb64b=ims, offset=offset)  # qb64b
+                offset += counter.size  # skip over counter
+            nsigs = counter.count
+        except ValidationError as ex:
+            nsigs = 0  # no signature count
+
+        # extract attached sigs as Sigers
+        sigers = []  # list of Siger instances for attached indexed signatures
+        if nsigs:
+            if counter.code == SigCntDex.Base2:  # attached signatures are qb2
+                for i in range(nsigs): # extract each attached signature
+                    siger = Siger(qb2=ims, offset=offset)  # qb2
+                    sigers.append(siger)
+                    offset += siger.bsize  # skip over signature
+            else:
                 for i in range(nsigs): # extract each attached signature
-                    # check here for type of attached signatures qb64 or qb2
-                    siger = Siger(qb64b=ims)  # qb64
+                    siger = Siger(qb64b=ims, offset=offset)  # qb64
                     sigers.append(siger)
-                    del ims[:len(siger.qb64)]  # strip off signature
+                    offset += siger.size  # skip over signature
 
-            else:  # no info on attached sigs
-                if framed:  # parse for signatures until end-of-stream
-                    while ims:
-                        # check here for type of attached signatures qb64 or qb2
-                        siger = Siger(qb64b=ims)  # qb64
-                        sigers.append(siger)
-                        del ims[:len(siger.qb64)]  # strip off signature
+        else:  # no info on attached sigs
+            if framed:  # parse for signatures until end-of-stream
+                while offset < len(ims):
+                    # uncounted attachments are always qb64
+                    siger = Siger(qb64b=ims, offset=offset)  # qb64
+                    sigers.append(siger)
+                    offset += siger.size  # skip over signature
 
-            if not sigers:
-                raise ValidationError("Missing attached signature(s).")
+        return (sigers, offset)
 
-            self.processEvent(serder, sigers)
 
-        elif ilk in [Ilks.rct]:  # event receipt msg (nontransferable)
-            # extract cry counter if any for attached receipt couplets
-            try:
-                counter = CryCounter(qb64b=ims)  # qb64
-                ncpts = counter.count
-                del ims[:len(counter.qb64)]  # strip off counter
-            except ValidationError as ex:
-                ncpts = 0  # no couplets count
-
-            # extract attached rct couplets into list of sigvers
-            # verfer property of sigver is the identifier prefix
-            # sigver itself is teh attached signature
-            sigvers = []  # List of sigvers to hold couplets
-            if ncpts:
+    @staticmethod
+    def _extractCouplets(ims, offset, framed=True):
+        """
+        Returns tuple (sigvers, offset) of list of attached receipt couplets
+        extracted from ims at offset and offset just past them.
+        The verfer property of each sigver is the receipter's identifier prefix
+        and the sigver itself is the attached signature.
+        """
+        # extract cry counter if any for attached receipt couplets
+        try:
+            if _sniffB2(ims, offset):  # counter itself is qb2
+                counter = CryCounter(qb2=ims, offset=offset)
+                offset += counter.bsize  # skip over counter
+            else:
+                counter = CryCounter(qb64b=ims, offset=offset)  # qb64
+                offset += counter.size  # skip over counter
+            ncpts = counter.count
+        except ValidationError as ex:
+            ncpts = 0  # no couplets count
+
+        sigvers = []  # List of sigvers to hold couplets
+        if ncpts:
+            if counter.code == CryCntDex.Base2:  # attached couplets are qb2
                 for i in range(ncpts): # extract each attached couplet
-                    # check here for type of attached couplets qb64 or qb2
-                    verfer = Verfer(qb64b=ims)  # qb64
-                    del ims[:len(verfer.qb64)]  # strip off identifier prefix
-                    sigver = Sigver(qb64b=ims, verfer=verfer)  # qb64
+                    verfer = Verfer(qb2=ims, offset=offset)  # qb2
+                    offset += verfer.bsize  # skip over identifier prefix
+                    sigver = Sigver(qb2=ims, offset=offset, verfer=verfer)  # qb2
                     sigvers.append(sigver)
-                    del ims[:len(sigver.qb64)]  # strip off signature
-
-            else:  # no info on attached receipt couplets
-                if framed:  # parse for receipts until end-of-stream
-                    while ims:
-                        # check here for type of attached receipts qb64 or qb2
-                        verfer = Verfer(qb64b=ims)  # qb64
-                    del ims[:len(verfer.qb64)]  # strip off identifier prefix
-                    sigver = Sigver(qb64b=ims, verfer=verfer)  # qb64
+                    offset += sigver.bsize  # skip over signature
+            else:
+                for i in range(ncpts): # extract each attached couplet
+                    verfer = Verfer(qb64b=ims, offset=offset)  # qb64
+                    offset += verfer.size  # skip over identifier prefix
+                    sigver = Sigver(qb64b=ims, offset=offset, verfer=verfer)  # qb64
                     sigvers.append(sigver)
-                    del ims[:len(sigver.qb64)]  # strip off signature
-
-            if not sigvers:
-                raise ValidationError("Missing attached receipt couplet(s).")
-
-            self.processReceipt(serder, sigvers)
-
-        elif ilk in [Ilks.vrc]:  # validator event receipt msg (transferable)
-            # extract sig counter if any for attached sigs
-            try:
-                counter = SigCounter(qb64b=ims)  # qb64
-                nsigs = counter.count
-                del ims[:len(counter.qb64)]  # strip off counter
-            except ValidationError as ex:
-                nsigs = 0  # no signature count
-
-            # extract attached sigs as Sigers
-            sigers = []  # list of Siger instances for attached indexed signatures
-            if nsigs:
-                for i in range(nsigs): # extract each attached signature
-                    # check here for type of attached signatures qb64 or qb2
-                    siger = Siger(qb64b=ims)  # qb64
-                    sigers.append(siger)
-                    del ims[:len(siger.qb64)]  # strip off signature
-
-            else:  # no info on attached sigs
-                if framed:  # parse for signatures until end-of-stream
-                    while ims:
-                        # check here for type of attached signatures qb64 or qb2
-                        siger = Siger(qb64b=ims)  # qb64
-                        sigers.append(siger)
-                        del ims[:len(siger.qb64)]  # strip off signature
-
-            if not sigers:
-                raise ValidationError("Missing attached signature(s) to receipt.")
-
-            self.processChit(serder, sigers)
+                    offset += sigver.size  # skip over signature
+
+        else:  # no info on attached receipt couplets
+            if framed:  # parse for receipts until end-of-stream
+                while offset < len(ims):
+                    # uncounted attachments are always qb64
+                    verfer = Verfer(qb64b=ims, offset=offset)  # qb64
+                    offset += verfer.size  # skip over identifier prefix
+                    sigver = Sigver(qb64b=ims, offset=offset, verfer=verfer)  # qb64
+                    sigvers.append(sigver)
+                    offset += sigver.size  # skip over signature
 
-        else:
-            raise ValidationError("Unexpected message ilk = {}.".format(ilk))
+        return (sigvers, offset)
 
 
     def processEvent(self, serder, sigers):
@@ -1059,10 +1620,21 @@ class Kevery:
             raise ValidationError("Invalid sn = {}".format(sn))
         dig = serder.dig
 
-        if self.logger.getEvt(dgKey(pre, dig)) is not None:
+        if self.logger.hasEvt(dgKey(pre, dig)):
             # performance log duplicate event
             return  # discard duplicate
 
+        if self._acceptEvent(serder, sigers, pre, sn, ilk, dig):
+            self.processReceiptEscrows(serder)  # promote escrowed receipts
+            self.processOutOfOrders(pre, sn)  # replay escrowed successors
+
+
+    def _acceptEvent(self, serder, sigers, pre, sn, ilk, dig):
+        """
+        Verifies and logs event serder with sigers of prefix pre at int sn or
+        logs it to escrow. Returns True if accepted into KEL Else False.
+        Raises exception if invalid.
+        """
         if pre not in self.kevers:  #  first seen event for pre
             if ilk == Ilks.icp:  # first seen and inception so verify event keys
                 # kever init verifies basic inception stuff and signatures
@@ -1073,27 +1645,32 @@ class Kevery:
                               sigers=sigers,
                               logger=self.logger)
                 self.kevers[pre] = kever  # not exception so add to kevers
+                if self.logger.batch is not None:
+                    self._touched.add(pre)
 
                 # create cue for receipt   direct mode for now
                 self.cues.append(dict(pre=pre, serder=serder))
+                return True
 
             else:  # not inception so can't verify, add to escrow
                 # log escrowed
-                dgkey = dgKey(pre, dig)
-                self.logger.putDts(dgkey, nowIso8601().encode("utf-8"))
-                self.logger.putSigs(dgkey, [siger.qb64b for siger in sigers])
-                self.logger.putEvt(dgkey, serder.raw)
-                self.logger.addOoes(snKey(pre, sn), dig)
+                self.logger.logEvt(pre=pre,
+                                   dig=dig,
+                                   sn=sn,
+                                   raw=serder.raw,
+                                   sigs=[siger.qb64b for siger in sigers],
+                                   idx=self.logger.ooes)
 
 
         else:  # already accepted inception event for pre
             if ilk == Ilks.icp:  # inception event so maybe duplicitous
                 # log duplicitous
-                dgkey = dgKey(pre, dig)
-                self.logger.putDts(dgkey, nowIso8601().encode("utf-8"))
-                self.logger.putSigs(dgkey, [siger.qb64b for siger in sigers])
-                self.logger.putEvt(dgkey, serder.raw)
-                self.logger.addLdes(snKey(pre, sn), dig)
+                self.logger.logEvt(pre=pre,
+                                   dig=dig,
+                                   sn=sn,
+                                   raw=serder.raw,
+                                   sigs=[siger.qb64b for siger in sigers],
+                                   idx=self.logger.ldes)
 
             else:  # rot or ixn, so sn matters
                 kever = self.kevers[pre]  # get existing kever for pre
@@ -1101,29 +1678,206 @@ class Kevery:
 
                 if sn > sno:  # sn later than sno so out of order escrow
                     #  log escrowed
-                    dgkey = dgKey(pre, dig)
-                    self.logger.putDts(dgkey, nowIso8601().encode("utf-8"))
-                    self.logger.putSigs(dgkey, [siger.qb64b for siger in sigers])
-                    self.logger.putEvt(dgkey, serder.raw)
-                    self.logger.addOoes(snKey(pre, sn), dig)
+                    self.logger.logEvt(pre=pre,
+                                       dig=dig,
+                                       sn=sn,
+                                       raw=serder.raw,
+                                       sigs=[siger.qb64b for siger in sigers],
+                                       idx=self.logger.ooes)
 
                 elif ((sn == sno) or  # new inorder event
                       (ilk == Ilks.rot and kever.lastEst.sn < sn <= sno )):  # recovery
                     # verify signatures etc and update state if valid
                     # raise exception if problem.
                     # Otherwise adds to KELs
-                    kever.update(serder=serder, sigers=sigers)
+                    try:
+                        kever.update(serder=serder, sigers=sigers)
+                    except ValidationError:
+                        raise  # raised before state update
+                    except Exception:  # state updated but logging failed
+                        self._reloadKevers([pre])
+                        raise
+                    if self.logger.batch is not None:
+                        self._touched.add(pre)
 
                     # create cue for receipt   direct mode for now
                     self.cues.append(dict(pre=pre, serder=serder))
+                    return True
 
                 else:  # maybe duplicitous
                     # log duplicitous
-                    dgkey = dgKey(pre, dig)
-                    self.logger.putDts(dgkey, nowIso8601().encode("utf-8"))
-                    self.logger.putSigs(dgkey, [siger.qb64b for siger in sigers])
-                    self.logger.putEvt(dgkey, serder.raw)
-                    self.logger.addLdes(snKey(pre, sn), dig)
+                    self.logger.logEvt(pre=pre,
+                                       dig=dig,
+                                       sn=sn,
+                                       raw=serder.raw,
+                                       sigs=[siger.qb64b for siger in sigers],
+                                       idx=self.logger.ldes)
+
+        return False
+
+
+    def processOutOfOrders(self, pre, sn):
+        """
+        Replays out of order escrowed events of prefix pre that follow
+        accepted event at int sn. Looks up .logger.ooes at snKey(pre, sn + 1)
+        and cascades forward while a replayed event is accepted so never scans
+        escrow. Runs in the caller's .logger batch or transaction if any.
+        Each replayed escrow entry is removed from .ooes. When its event is
+        invalid its logged event, signatures and datetime stamp are removed
+        too unless it was escrowed as partially signed.
+        Returns int count of replayed events accepted into KEL
+
+        Parameters:
+            pre is str qb64 identifier prefix
+            sn is int sequence number of accepted event
+        """
+        count = 0
+        while True:
+            sn += 1
+            key = snKey(pre, sn)
+            digs = self.logger.getOoes(key)
+            if not digs:
+                break
+            accepted = False
+            for dig in digs:
+                dgkey = dgKey(pre, dig)
+                raw = self.logger.getEvt(dgkey)
+                if raw is None:  # event removed meanwhile so nothing to replay
+                    continue
+                serder = Serder(raw=bytes(raw))
+                sigers = [Siger(qb64b=bytes(sig))
+                          for sig in self.logger.getSigs(dgkey)]
+                try:
+                    if self._acceptEvent(serder, sigers, pre, sn,
+                                         serder.ked["ilk"], serder.dig):
+                        accepted = True
+                        count += 1
+                        self.processReceiptEscrows(serder)
+                except Exception as ex:  # invalid so discard escrowed event
+                    if dig not in self.logger.getPses(key):
+                        self.logger.delEvt(dgkey)
+                        self.logger.delSigs(dgkey)
+                        self.logger.delDts(dgkey)
+            self.logger.delOoes(key)
+            if not accepted:
+                break
+        return count
+
+
+    def processReceiptEscrows(self, serder):
+        """
+        Promotes escrowed receipts made verifiable by accepted event serder.
+        Couplets in .logger.ures and triplets in .logger.vres at dgKey of
+        serder are verified as batch and moved to .logger.rcts and
+        .logger.vrcs. When serder is an establishment event its prefix may be
+        the validator of escrowed triplets so those found by the .logger.vrvs
+        index are promoted too. Looks up escrows by key so never scans escrow.
+        While pipelined lanes run the triplets at dgKey of serder are left
+        for ._runLanes to promote since their validators are other prefixes.
+
+        Parameters:
+            serder is Serder instance of event accepted into KEL
+        """
+        pre = serder.ked["pre"]
+        dgkey = dgKey(pre, serder.dig)
+
+        couplets = [bytes(couplet) for couplet in self.logger.getUres(dgkey)]
+        if couplets:
+            sigvers = []
+            for couplet in couplets:
+                verfer = Verfer(qb64b=couplet)
+                sigvers.append(Sigver(qb64b=couplet[len(verfer.qb64b):],
+                                      verfer=verfer))
+            verifies = Verfer.verifyBatch((sigver.verfer, sigver.raw, serder.raw)
+                                          for sigver in sigvers)
+            rcts, drops = [], []
+            for couplet, verified in zip(couplets, verifies):
+                (rcts if verified else drops).append(couplet)
+            self.logger.promoteUres(dgkey, rcts, drops)
+
+        if self._deferred is not None:  # lanes may update validator kevers
+            self._deferred.append((dgkey, serder.raw))
+        else:
+            self._promoteVres(dgkey, raw=serder.raw)
+
+        if serder.ked["ilk"] in (Ilks.icp, Ilks.rot):  # maybe validator
+            for vdgkey in self.logger.getVrvs(pre):
+                self._promoteVres(bytes(vdgkey), validator=pre)
+
+
+    def _promoteVres(self, dgkey, raw=None, validator=None):
+        """
+        Verifies as batch escrowed triplets in .logger.vres at dgkey whose
+        validator kever is known at the escrowed establishment event and moves
+        verified ones to .logger.vrcs. Drops invalid and stale triplets. Keeps
+        the others escrowed and indexed in .logger.vrvs. Escrow is read and
+        triplets verified outside of any write transaction. Then
+        .logger.promoteVres applies the outcome in one write transaction so
+        triplets escrowed meanwhile by other lanes are kept.
+
+        Parameters:
+            dgkey is bytes dgKey() of receipted event
+            raw is bytes of receipted event when known accepted else None to
+                look it up and leave escrow alone when not yet accepted
+            validator is str qb64 prefix to only consider its triplets or None
+        """
+        triplets = [bytes(triplet) for triplet in self.logger.getVres(dgkey)]
+        if raw is None and triplets:  # is receipted event accepted into KEL
+            raw = self.logger.getEvt(dgkey)
+            if raw is None:
+                return
+            eserder = Serder(raw=bytes(raw), lazy=True)
+            ldig = self.logger.getKeLast(snKey(eserder.ked["pre"],
+                                               int(eserder.ked["sn"], 16)))
+            if ldig is None or bytes(ldig) != eserder.digb:
+                return
+            raw = eserder.raw
+
+        vrcs, drops, checks = [], [], []
+        for triplet in triplets:
+            vprefixer = Prefixer(qb64b=triplet)
+            vdiger = Diger(qb64b=triplet[len(vprefixer.qb64b):])
+            siger = Siger(qb64b=triplet[len(vprefixer.qb64b) + len(vdiger.qb64b):])
+            vpre = vprefixer.qb64
+            if ((validator is not None and vpre != validator) or
+                    vpre not in self.kevers):  # validator not yet known
+                continue  # keep
+            rekever = self.kevers[vpre]
+            if rekever.lastEst.dig != vdiger.qb64:
+                if self._superseded(vpre, vdiger.qb64):
+                    drops.append(triplet)  # stale since not from last est event
+                # else from later est event not yet accepted so keep
+                continue
+            if siger.index >= len(rekever.verfers):  # invalid index
+                drops.append(triplet)
+                continue
+            siger.verfer = rekever.verfers[siger.index]
+            checks.append((triplet, siger))
+
+        verifies = Verfer.verifyBatch((siger.verfer, siger.raw, raw)
+                                      for triplet, siger in checks)
+        for (triplet, siger), verified in zip(checks, verifies):
+            (vrcs if verified else drops).append(triplet)
+
+        if vrcs or drops:
+            self.logger.promoteVres(dgkey, vrcs, drops)
+        elif validator is not None and not triplets:  # stale index entry
+            self.logger.delVrv(validator, dgkey)
+
+
+    def _superseded(self, pre, dig):
+        """
+        Returns True if event at dig of prefix pre is accepted into its KEL
+        but is not its last establishment event so receipts from it are stale
+        or invalid. Returns False when the event is unknown or only escrowed
+        such as an out of order rotation that may yet become last.
+        """
+        raw = self.logger.getEvt(dgKey(pre, dig))
+        if raw is None:
+            return False
+        sn = int(Serder(raw=bytes(raw), lazy=True).ked["sn"], 16)
+        return dig.encode("utf-8") in [bytes(kdig) for kdig in
+                                       self.logger.getKes(snKey(pre, sn))]
 
 
     def processReceipt(self, serder, sigvers):
@@ -1167,12 +1921,14 @@ class Kevery:
                 raise ValidationError("Stale receipt at sn = {}".format(ked["sn"]))
 
             # assumes db ensures that if ldig == dig then raw must not be none
-            eserder = Serder(raw=bytes(raw))  # deserialize event raw
-            # process each couplet verify sig and write to db
-            for sigver in sigvers:
-                if not sigver.verfer.nontrans:# check that verfer is non-transferable
-                    continue  # skip invalid couplets
-                if sigver.verfer.verify(sigver.raw, eserder.raw):
+            eserder = Serder(raw=bytes(raw), lazy=True)  # only raw needed
+            # verify couplets as batch then write each verified couplet to db
+            # skip invalid couplets whose verfer is transferable
+            sigvers = [sigver for sigver in sigvers if sigver.verfer.nontrans]
+            verifies = Verfer.verifyBatch((sigver.verfer, sigver.raw, eserder.raw)
+                                          for sigver in sigvers)
+            for sigver, verified in zip(sigvers, verifies):
+                if verified:
                     # write receipt couplet to database
                     couplet = sigver.verfer.qb64b + sigver.qb64b
                     self.logger.addRct(key=dgkey, val=couplet)
@@ -1186,7 +1942,7 @@ class Kevery:
                 if not sigver.verfer.nontrans:# check that verfer is non-transferable
                     continue  # skip invalid couplets
                 couplet = sigver.verfer.qb64b + sigver.qb64b
-                self.logger.addUre(key=dgkey, val=couplet)
+                self.logger.logRct(key=dgkey, val=couplet, idx=self.logger.ures)
 
 
     def processChit(self, serder, sigers):
@@ -1247,13 +2003,18 @@ class Kevery:
                                       "validator = {}.".format(pre, dig, seal.pre))
 
             raw = bytes(raw)
-            for siger in sigers:  # verify sigs
+            for siger in sigers:  # assign verfers
                 if siger.index >= len(rekever.verfers):
                     raise ValidationError("Index = {} to large for keys."
                                           "".format(siger.index))
 
                 siger.verfer = rekever.verfers[siger.index]  # assign verfer
-                if siger.verfer.verify(siger.raw, raw):  # verify sig
+
+            # verify sigs as batch
+            verifies = Verfer.verifyBatch((siger.verfer, siger.raw, raw)
+                                          for siger in sigers)
+            for siger, verified in zip(sigers, verifies):
+                if verified:
                     # good sig so write receipt truplet to database
                     triplet = sealet + siger.qb64b
                     self.logger.addVrc(key=dgkey, val=triplet)
@@ -1261,7 +2022,9 @@ class Kevery:
         else:  # escrow  either receiptor or event not yet in database
             for siger in sigers:  # escrow triplets one for each sig
                 triplet = sealet + siger.qb64b
-                self.logger.addVre(key=dgkey, val=triplet)
+                self.logger.logRct(key=dgkey, val=triplet, idx=self.logger.vres)
+            # index by validator to promote when its est event is accepted
+            self.logger.addVrv(seal.pre, dgkey)
 
 
     def duplicity(self, serder, sigers):
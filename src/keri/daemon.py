@@ -6,14 +6,18 @@ Background Server Daemon for keri
 
 import argparse
 
+from keri.cli import addDatabaserArgs
+
 parser = argparse.ArgumentParser(description='Command description.')
 parser.add_argument('names', metavar='NAME', nargs=argparse.ZERO_OR_MORE,
                     help="A name of something.")
+addDatabaserArgs(parser)
 
 
 def main(args=None):
     args = parser.parse_args(args=args)
     print(args.names)
+    return args
 
 
 if __name__ == '__main__':
@@ -47,8 +47,15 @@ l
 import os
 import shutil
 import tempfile
+import time
+import datetime
+import functools
 
-from contextlib import contextmanager
+from base64 import urlsafe_b64encode as encodeB64
+from base64 import urlsafe_b64decode as decodeB64
+
+from contextlib import contextmanager, nullcontext
+from threading import Condition, get_ident
 
 import lmdb
 
@@ -58,6 +65,8 @@ except ImportError:
     import json
 
 from  ..kering import KeriError
+from ..help.helping import BloomFilter, nowIso8601
+from ..core.coring import CryMat
 
 class DatabaseError(KeriError):
     """
@@ -69,6 +78,57 @@ class DatabaseError(KeriError):
 MaxHexDigits =  6
 MaxForks = int("f"*MaxHexDigits, 16)  # 16777215
 
+# Key and value layout versions of Databaser sub dbs
+# 1 is text. dgKey is pre.dig, snKey is pre.32 hex digit sn, and dup
+#   insertion ordinal prefix is 6 hex digits plus '.'
+# 2 is binary. dgKey is pre+dig, snKey is pre plus 8 byte big endian sn,
+#   and dup insertion ordinal prefix is 3 byte big endian. Optionally pre
+#   and dig in keys are qb2 instead of qb64.
+Layouts = (1, 2)
+SnSize = 8  # bytes of big endian sn in layout 2 snKey
+OrdSize = 3  # bytes of big endian ordinal in layout 2 dup values
+TimeSize = 8  # bytes of big endian microseconds since epoch in escKey
+Epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Durability levels of commits traded for write throughput.
+# Values are lmdb.open flags. Only full survives power loss with no lost commits.
+# meta may lose the last commit, lazy and async may lose recent commits on
+# system crash but not on process crash. async with writemap may also corrupt
+# the database on system crash.
+Durabilities = {
+                 "full": dict(sync=True, metasync=True, map_async=False),
+                 "meta": dict(sync=True, metasync=False, map_async=False),
+                 "lazy": dict(sync=False, metasync=False, map_async=False),
+                 "async": dict(sync=False, metasync=False, map_async=True),
+               }
+
+
+def mapGrowing(f):
+    """
+    Decorator for Databaser write methods that begin their own transaction.
+    When the write fails with lmdb.MapFullError grows the map with .growMap()
+    and retries the method. Does not retry when the write is within a caller
+    supplied txn keyword argument since only the owner of that transaction
+    may abort and redo it. Within an open .batch the failed write was in a
+    nested transaction so commits the earlier writes of .batch, grows the map
+    and retries in a new .batch. Not with .writemap which does not nest.
+    """
+    @functools.wraps(f)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            try:
+                return f(self, *pa, **kwa)
+            except lmdb.MapFullError:
+                if kwa.get("txn") is not None:
+                    raise
+                if self._batched():
+                    if self.writemap:
+                        raise
+                    self._regrow()
+                else:
+                    self.growMap()
+    return wrapper
+
 
 def dgKey(pre, dig):
     """
@@ -94,6 +154,25 @@ def snKey(pre, sn):
     return (b'%s.%032x' % (pre, sn))
 
 
+def escKey(kind, dts):
+    """
+    Returns bytes escrow time index DB key from concatenation of escrow kind
+    name and datetime stamp dts as 8 byte big endian int microseconds since
+    epoch so keys of a kind sort by time.
+    dts is ISO 8601 str or bytes or datetime. If kind is str converts to bytes
+    """
+    if hasattr(kind, "encode"):
+        kind = kind.encode("utf-8")  # convert str to bytes
+    if not isinstance(dts, datetime.datetime):
+        if hasattr(dts, "decode"):
+            dts = dts.decode("utf-8")  # convert bytes to str
+        dts = datetime.datetime.fromisoformat(dts)
+    if dts.tzinfo is None:  # naive so assume utc
+        dts = dts.replace(tzinfo=datetime.timezone.utc)
+    micros = (dts - Epoch) // datetime.timedelta(microseconds=1)
+    return (kind + max(0, micros).to_bytes(TimeSize, "big"))
+
+
 def clearDatabaserDir(path):
     """
     Remove directory path
@@ -103,7 +182,7 @@ def clearDatabaserDir(path):
 
 
 @contextmanager
-def openDatabaser(name="test", cls=None):
+def openDatabaser(name="test", cls=None, **kwa):
     """
     Wrapper to enable temporary (test) Databaser instances
     When used in with statement calls .clearDirPath() on exit of with block
@@ -112,6 +191,7 @@ def openDatabaser(name="test", cls=None):
         name is str name of temporary Databaser dirPath  extended name so
                  can have multiple temporary databasers is use differen name
         cls is Class instance of subclass instance
+        kwa is dict of other cls init keyword arguments such as batchSize
 
     Usage:
 
@@ -124,7 +204,7 @@ def openDatabaser(name="test", cls=None):
     if cls is None:
         cls = Databaser
     try:
-        databaser = cls(name=name, temp=True)
+        databaser = cls(name=name, temp=True, **kwa)
 
         yield databaser
 
@@ -142,6 +222,19 @@ class Databaser:
         .name is LMDB database name did2offer
         .env is LMDB main (super) database environment
         .path is LMDB main (super) database directory path
+        .batchSize is int max units of work per group commit in .batched()
+            0 means no group commit so each write commits on its own
+        .batchTime is float max seconds per group commit in .batched()
+        .batch is open group commit write transaction or None
+        .batchCount is int units of work in .batch so far
+        .commits is int count of group commits
+        .mapSize is int current size in bytes of LMDB memory map
+        .mapMax is int max size in bytes .growMap() may grow map to or None
+        .mapGrowth is float factor .growMap() multiplies map size by
+        .grows is int count of map growths
+        .layout is int key and value layout version in Layouts
+        .qb2 is Boolean True means layout 2 keys use qb2 pre and dig
+        .meta is named sub DB of database metadata records such as layout
 
     Properties:
 
@@ -151,9 +244,21 @@ class Databaser:
     TailDirPath = "keri/db"
     AltHeadDirPath = "~"  #  put in ~ when /var not permitted
     AltTailDirPath = ".keri/db"
-    MaxNamedDBs = 16
-
-    def __init__(self, headDirPath=None, name='main', temp=False):
+    MaxNamedDBs = 32
+    BatchSize = 0  # default units of work per group commit, 0 means disabled
+    BatchTime = 0.05  # default max seconds to hold open a group commit
+    MapSize = 10485760  # default initial map size 10 MiB
+    MapMax = None  # default max map size, None means no max
+    MapGrowth = 2.0  # default geometric map growth factor
+    MapHeadroom = 0.25  # grow map before group commit when less room free
+    MaxReaders = 126  # default max concurrent read transactions
+    Durability = "full"  # default durability level in Durabilities
+    Layout = 1  # default key and value layout version of new database
+
+    def __init__(self, headDirPath=None, name='main', temp=False,
+                 batchSize=None, batchTime=None, mapSize=None, mapMax=None,
+                 mapGrowth=None, durability=None, writemap=False,
+                 readahead=True, maxReaders=None, layout=None, qb2=False):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .dirpath.
@@ -166,9 +271,43 @@ class Databaser:
                 differentiating each instance by name
             temp is boolean If True then use temporary head pathname  instead of
                 headDirPath if any or default headDirPath
+            batchSize is int max units of work per group commit. Default
+                .BatchSize. 0 disables group commit
+            batchTime is float max seconds per group commit. Default .BatchTime
+            mapSize is int initial map size in bytes. Default .MapSize
+                Existing database larger than mapSize keeps its size
+            mapMax is int max map size in bytes automatic growth may reach
+                Default .MapMax
+            mapGrowth is float factor map grows by when full. Default .MapGrowth
+            durability is str level in Durabilities. Default .Durability
+            writemap is Boolean True means write through writeable memory map
+                Faster writes but stray pointer writes can corrupt database
+                and nested transactions are not available
+            readahead is Boolean False means turn off OS readahead. Better
+                for random reads of databases much larger than RAM
+            maxReaders is int max concurrent read transactions. Default
+                .MaxReaders
+            layout is int layout version in Layouts of new database. Default
+                .Layout. Existing database keeps layout in its .meta record.
+                Raises DatabaseError when it differs. See convertLogger.
+            qb2 is Boolean True means layout 2 keys use qb2 pre and dig
         """
         self.name = name
         self.temp = True if temp else False
+        self.batchSize = self.BatchSize if batchSize is None else batchSize
+        self.batchTime = self.BatchTime if batchTime is None else batchTime
+        self.batch = None
+        self.batchCount = 0
+        self.commits = 0
+        self._batchStart = 0.0
+        self._batchUsed = 0
+        self._unitBytes = 0.0  # most map bytes per unit of work seen by commits
+        self._batchLost = False
+        self._batchHeld = False  # .batch counted in ._txns
+        self._batchThread = None
+        self._txns = {}  # open transaction count by thread ident
+        self._growing = False  # .growMap waiting for or resizing map
+        self._txnCond = Condition()
 
         if temp:
             headDirPath = tempfile.mkdtemp(prefix="keri_lmdb_", suffix="_test", dir="/tmp")
@@ -211,9 +350,311 @@ class Databaser:
                     if not os.path.exists(self.path):
                         os.makedirs(self.path)
 
+        durability = self.Durability if durability is None else durability
+        if durability not in Durabilities:
+            raise DatabaseError("Invalid durability = {}.".format(durability))
+        self.durability = durability
+        self.writemap = True if writemap else False
+        self.mapMax = self.MapMax if mapMax is None else mapMax
+        self.mapGrowth = self.MapGrowth if mapGrowth is None else mapGrowth
+        if self.mapGrowth <= 1.0:
+            raise DatabaseError("Invalid mapGrowth = {}.".format(self.mapGrowth))
+        self.grows = 0
+
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
-        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs)
+        self.env = lmdb.open(self.path,
+                             max_dbs=self.MaxNamedDBs,
+                             map_size=self.MapSize if mapSize is None else mapSize,
+                             writemap=self.writemap,
+                             readahead=True if readahead else False,
+                             max_readers=self.MaxReaders if maxReaders is None else maxReaders,
+                             **Durabilities[durability])
+        self.mapSize = self.env.info()["map_size"]
+        self._loadLayout(layout=layout, qb2=qb2)
+
+
+    def _loadLayout(self, layout=None, qb2=False):
+        """
+        Sets .layout and .qb2 from .meta layout record when database exists
+        else from layout and qb2 and writes .meta layout record.
+        Database without .meta predates layouts so is layout 1.
+        """
+        fresh = self.env.stat()["entries"] == 0  # no named sub dbs yet
+        self.meta = self.env.open_db(key=b'meta.')
+        with self.env.begin(db=self.meta, write=False) as txn:
+            record = txn.get(b'layout')
+        if record is not None:
+            record = json.loads(record)
+        elif not fresh:
+            record = dict(version=1, qb2=False)
+
+        if record is None:
+            record = dict(version=self.Layout if layout is None else layout,
+                          qb2=True if qb2 else False)
+            if record["version"] not in Layouts:
+                raise DatabaseError("Invalid layout = {}."
+                                    "".format(record["version"]))
+            if record["version"] == 1:
+                record["qb2"] = False
+            with self.env.begin(db=self.meta, write=True) as txn:
+                txn.put(b'layout', json.dumps(record).encode("utf-8"))
+        elif layout is not None and (record["version"], record["qb2"]) != \
+                (layout, (True if qb2 else False) and layout != 1):
+            raise DatabaseError("Database layout = {} qb2 = {} not requested "
+                                "layout = {} qb2 = {}. Use convertLogger."
+                                "".format(record["version"], record["qb2"],
+                                          layout, qb2))
+        self.layout = record["version"]
+        self.qb2 = record["qb2"]
+        self._ordSize = 7 if self.layout == 1 else OrdSize
+
+
+    def _ordinal(self, cnt):
+        """
+        Returns bytes dup insertion ordinal prefix for int cnt in .layout
+        """
+        if self.layout == 1:
+            return (b'%06x.' % (cnt))
+        return cnt.to_bytes(OrdSize, "big")
+
+
+    def _pre(self, qb):
+        """
+        Returns bytes of qb64 pre or dig qb in .layout key form
+        """
+        if hasattr(qb, "encode"):
+            qb = qb.encode("utf-8")  # convert str to bytes
+        return decodeB64(bytes(qb)) if self.qb2 else bytes(qb)
+
+
+    def _snKey(self, pre, sn):
+        """
+        Returns bytes snKey in .layout of qb64 pre and int sn
+        """
+        if self.layout == 1:
+            return snKey(pre, sn)
+        if not 0 <= sn < 1 << (8 * SnSize):
+            raise DatabaseError("Invalid sn = {} for layout = {}."
+                                "".format(sn, self.layout))
+        return self._pre(pre) + sn.to_bytes(SnSize, "big")
+
+
+    def _dgk(self, key):
+        """
+        Returns bytes key in .layout of dgKey() key
+        """
+        if self.layout == 1:
+            return key
+        pre, _, dig = bytes(key).partition(b'.')
+        return self._pre(pre) + self._pre(dig)
+
+
+    def _snk(self, key):
+        """
+        Returns bytes key in .layout of snKey() key
+        """
+        if self.layout == 1:
+            return key
+        pre, _, sn = bytes(key).rpartition(b'.')
+        return self._snKey(pre, int(sn, 16))
+
+
+    def _dgKeyOf(self, key):
+        """
+        Returns dgKey() key of bytes key in .layout. Inverse of ._dgk
+        """
+        if self.layout == 1:
+            return bytes(key)
+        key = bytes(key)
+        if self.qb2:
+            pre = CryMat(qb2=key)
+            return dgKey(pre.qb64b, encodeB64(key[len(pre.qb2):]))
+        pre = CryMat(qb64b=key).qb64b
+        return dgKey(pre, key[len(pre):])
+
+
+    def _snKeyOf(self, key):
+        """
+        Returns snKey() key of bytes key in .layout. Inverse of ._snk
+        """
+        if self.layout == 1:
+            return bytes(key)
+        key = bytes(key)
+        pre = encodeB64(key[:-SnSize]) if self.qb2 else key[:-SnSize]
+        return snKey(pre, int.from_bytes(key[-SnSize:], "big"))
+
+
+    def _preOf(self, key):
+        """
+        Returns bytes qb64 pre of bytes key in .layout. Inverse of ._pre
+        """
+        return encodeB64(bytes(key)) if self.qb2 else bytes(key)
+
+
+    def _ordOf(self, val):
+        """
+        Returns int dup insertion ordinal of bytes dup val in .layout
+        """
+        if self.layout == 1:
+            return int(bytes(val[:6]), 16)
+        return int.from_bytes(val[:OrdSize], "big")
+
+
+    def growMap(self, size=None):
+        """
+        Grows LMDB memory map to size or else to .mapGrowth times current
+        size capped at .mapMax. Returns new map size.
+        Raises DatabaseError when map is already at .mapMax or when this
+        thread has an open transaction. LMDB resizes only when the process
+        has no open transaction so blocks new transactions of other threads
+        and waits until their open ones end. When another thread grows the
+        map meanwhile returns its new size without growing again.
+        """
+        with self._txnCond:
+            if self._txns.get(get_ident()):
+                raise DatabaseError("Can not grow map with open transaction.")
+            seen = self.mapSize
+            while self._growing:
+                self._txnCond.wait()
+            if size is None and self.mapSize != seen:  # grown by other thread
+                return self.mapSize
+            self._growing = True
+            try:
+                while self._txns:  # only other threads
+                    self._txnCond.wait()
+                mapSize = self.env.info()["map_size"]
+                if size is None:
+                    size = int(mapSize * self.mapGrowth)
+                if self.mapMax is not None:
+                    size = min(size, self.mapMax)
+                if size <= mapSize:
+                    raise DatabaseError("Map full at max size = {}.".format(mapSize))
+                self.env.set_mapsize(size)
+                self.mapSize = self.env.info()["map_size"]
+                self.grows += 1
+            finally:
+                self._growing = False
+                self._txnCond.notify_all()
+        return self.mapSize
+
+
+    def _enter(self):
+        """
+        Counts a transaction opened by this thread. A thread opening its first
+        transaction waits while .growMap resizes the map.
+        """
+        ident = get_ident()
+        with self._txnCond:
+            count = self._txns.get(ident, 0)
+            if not count:
+                while self._growing:
+                    self._txnCond.wait()
+            self._txns[ident] = count + 1
+
+
+    def _exit(self):
+        """
+        Uncounts a transaction ended by this thread and wakes .growMap
+        """
+        ident = get_ident()
+        with self._txnCond:
+            count = self._txns.get(ident, 0) - 1
+            if count > 0:
+                self._txns[ident] = count
+            else:
+                self._txns.pop(ident, None)
+                self._txnCond.notify_all()
+
+
+    @contextmanager
+    def _txn(self, **kwa):
+        """
+        Context manager that yields transaction begun with kwa and counted
+        so .growMap waits until it ends
+        """
+        self._enter()
+        try:
+            with self.env.begin(**kwa) as txn:
+                yield txn
+        finally:
+            self._exit()
+
+
+    def mapUsed(self):
+        """
+        Returns int bytes of memory map used by database pages
+        """
+        return (self.env.info()["last_pgno"] + 1) * self.env.stat()["psize"]
+
+
+    def _headroom(self):
+        """
+        Grows map ahead of need when free room left is less than .MapHeadroom
+        fraction of map. Group commits can not be retried on MapFullError
+        since their writes are not replayable so grow before one begins.
+        """
+        if self.mapUsed() > self.mapSize * (1.0 - self.MapHeadroom):
+            try:
+                self.growMap()
+            except DatabaseError:  # at max so may still fit
+                pass
+
+
+    def _treePages(self, txn):
+        """
+        Returns int count of pages in the trees of all sub dbs seen by txn
+        """
+        pages = 0
+        for db in vars(self).values():
+            if isinstance(db, lmdb._Database):
+                stat = txn.stat(db)
+                pages += (stat["branch_pages"] + stat["leaf_pages"] +
+                          stat["overflow_pages"])
+        return pages
+
+
+    def _crowded(self):
+        """
+        Returns True when the pages .batch may have allocated plus one more
+        unit of work would leave less than .MapHeadroom fraction of map free.
+        The batch must then be committed before the map can grow since
+        a failed commit loses all its writes. LMDB does not expose the pages
+        allocated by an open transaction so estimates them from the most
+        bytes per unit seen by earlier commits or else, with copy on write,
+        bounds them by all the pages in its trees.
+        """
+        if self._unitBytes:
+            pending = (self.batchCount + 1) * self._unitBytes
+        else:
+            pending = self._treePages(self.batch) * self.env.stat()["psize"]
+        return self.mapUsed() + pending > self.mapSize * (1.0 - self.MapHeadroom)
+
+
+    def _regrow(self, strict=True):
+        """
+        Commits .batch, grows map and begins new .batch so a write that
+        overflowed its nested transaction may be retried. Raises
+        DatabaseError when map is already at .mapMax if strict or when .batch
+        is too full to commit. Then its writes are lost so .batched() aborts
+        on exit.
+        """
+        try:
+            self._commit()
+        except lmdb.MapFullError as ex:
+            self._batchLost = True
+            try:
+                self.growMap()
+            finally:
+                self._renew()  # fresh batch for reads until .batched() exits
+            raise DatabaseError("Group commit lost on full map.") from ex
+        try:
+            self.growMap()
+        except DatabaseError:  # at max
+            if strict:
+                raise
+        finally:
+            self._renew()
 
 
     def clearDirPath(self):
@@ -230,7 +671,167 @@ class Databaser:
             shutil.rmtree(self.path)
 
 
-    def putVal(self, db, key, val):
+    @contextmanager
+    def transact(self, write=True):
+        """
+        Context manager that yields one LMDB transaction over all sub dbs
+        Commits on normal exit of with block and aborts on exception.
+        Pass the yielded txn as the txn parameter of the methods that accept
+        one so that all their reads and writes happen atomically together
+        Inside .batched() yields a nested transaction of .batch so its writes
+        are all or none within the group commit. With .writemap yields .batch
+        itself since LMDB does not nest transactions with writemap.
+
+        Usage:
+
+        with logger.transact() as txn:
+            logger.putEvt(key, val, txn=txn)
+            logger.addKe(snkey, dig, txn=txn)
+
+        Parameters:
+            write is Boolean True means write transaction
+        """
+        if self._batched():
+            if not write:
+                yield self.batch
+                return
+            if self.writemap:  # no nested transactions with writemap
+                yield self.batch
+                return
+            with self._txn(parent=self.batch, write=True) as txn:
+                yield txn
+            return
+        with self._txn(write=write, buffers=True) as txn:
+            yield txn
+
+
+    def _batched(self):
+        """
+        Returns True if .batch is open and owned by current thread
+        """
+        return self.batch is not None and self._batchThread == get_ident()
+
+
+    def _begin(self, db, write=False, txn=None):
+        """
+        Returns context manager of transaction for methods to read or write db
+        Uses txn when provided else .batch when open in this thread else
+        begins a new transaction on db. Writes in .batch use a nested
+        transaction, unless .writemap, so a write that fails leaves .batch
+        usable.
+        """
+        if txn is not None:
+            return nullcontext(txn)
+        if self._batched():
+            if write and not self.writemap:
+                return self._txn(db=db, parent=self.batch, write=True)
+            return nullcontext(self.batch)
+        return self._txn(db=db, write=write, buffers=True)
+
+
+    @contextmanager
+    def batched(self):
+        """
+        Context manager for group commit of the writes of many units of work
+        such as events. Opens .batch write transaction that all methods called
+        from this thread use so later reads see earlier writes in the batch.
+        Call .flush() after each unit of work to commit and begin a new .batch
+        once .batchSize units or .batchTime seconds have accumulated.
+        Commits on normal exit and aborts uncommitted writes on exception.
+        Raises DatabaseError on exit when a commit to grow the map failed.
+        No op when .batchSize is 0 or when already batched.
+
+        Values read inside .batch are bytes copies not memoryview buffers
+        since buffers of write transactions go stale on later writes.
+
+        Usage:
+
+        with logger.batched():
+            for event in events:
+                process(event)
+                logger.flush()
+        """
+        if not self.batchSize or self.batch is not None:
+            yield self.batch
+            return
+        self._batchThread = get_ident()
+        self._batchLost = False
+        self._renew()
+        try:
+            yield self.batch
+        except BaseException:
+            self.batch.abort()
+            raise
+        else:
+            if self._batchLost:
+                self.batch.abort()
+                raise DatabaseError("Group commit lost on full map.")
+            self._commit()
+        finally:
+            self._release()
+            self.batch = None
+            self._batchThread = None
+
+
+    def flush(self, force=False):
+        """
+        Counts one unit of work in .batch. Commits and begins new .batch when
+        .batchSize units or .batchTime seconds have accumulated or force or
+        when .batch crowds the map so the map may grow before it fills.
+        Returns True if committed Else False. No op when not batched.
+        """
+        if not self._batched() or self._batchLost:  # lost aborts on exit
+            return False
+        self.batchCount += 1
+        if (force or self.batchCount >= self.batchSize or
+                time.monotonic() - self._batchStart >= self.batchTime):
+            self._commit()
+            self._renew()
+            return True
+        if self._crowded():
+            self._regrow(strict=False)  # at max so may still fit
+            return True
+        return False
+
+
+    def _renew(self):
+        """
+        Begins new .batch write transaction after making map headroom
+        """
+        self._headroom()
+        self._enter()
+        self._batchHeld = True
+        self.batch = self.env.begin(write=True, buffers=False)
+        self.batchCount = 0
+        self._batchStart = time.monotonic()
+        self._batchUsed = self.mapUsed()
+
+
+    def _commit(self):
+        """
+        Commits .batch and updates most map bytes used per unit of work
+        """
+        try:
+            self.batch.commit()
+        finally:
+            self._release()
+        self.commits += 1
+        if self.batchCount:
+            self._unitBytes = max(self._unitBytes, (self.mapUsed() -
+                                  self._batchUsed) / self.batchCount)
+
+
+    def _release(self):
+        """
+        Uncounts .batch once when committed or aborted
+        """
+        if self._batchHeld:
+            self._batchHeld = False
+            self._exit()
+
+
+    @mapGrowing
+    def putVal(self, db, key, val, txn=None):
         """
         Write serialized bytes val to location key in db
         Does not overwrite.
@@ -241,12 +842,14 @@ class Databaser:
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
+            txn is optional write transaction from .transact() to write within
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.put(key, val, overwrite=False))
+        with self._begin(db, write=True, txn=txn) as txn:
+            return (txn.put(key, val, overwrite=False, db=db))
 
 
-    def setVal(self, db, key, val):
+    @mapGrowing
+    def setVal(self, db, key, val, txn=None):
         """
         Write serialized bytes val to location key in db
         Overwrites existing val if any
@@ -256,12 +859,13 @@ class Databaser:
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
+            txn is optional write transaction from .transact() to write within
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.put(key, val))
+        with self._begin(db, write=True, txn=txn) as txn:
+            return (txn.put(key, val, db=db))
 
 
-    def getVal(self, db, key):
+    def getVal(self, db, key, txn=None):
         """
         Return val at key in db
         Returns None if no entry at key
@@ -269,12 +873,14 @@ class Databaser:
         Parameters:
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
+            txn is optional transaction from .transact() to read within
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            return( txn.get(key))
+        with self._begin(db, txn=txn) as txn:
+            return( txn.get(key, db=db))
 
 
+    @mapGrowing
     def delVal(self, db, key):
         """
         Deletes value at key in db.
@@ -284,11 +890,12 @@ class Databaser:
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        with self._begin(db, write=True) as txn:
+            return (txn.delete(key, db=db))
 
 
-    def putVals(self, db, key, vals):
+    @mapGrowing
+    def putVals(self, db, key, vals, txn=None):
         """
         Write each entry from list of bytes vals to key in db
         Adds to existing values at key if any
@@ -303,14 +910,16 @@ class Databaser:
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
+            txn is optional write transaction from .transact() to write within
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db, write=True, txn=txn) as txn:
             result = True
             for val in vals:
-                result = result and txn.put(key, val, dupdata=True)
+                result = result and txn.put(key, val, dupdata=True, db=db)
             return result
 
 
+    @mapGrowing
     def addVal(self, db, key, val):
         """
         Add val bytes as dup to key in db
@@ -333,8 +942,8 @@ class Databaser:
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
-                result = txn.put(key, val, dupdata=True)
+            with self._begin(db, write=True) as txn:
+                result = txn.put(key, val, dupdata=True, db=db)
         return result
 
 
@@ -350,8 +959,8 @@ class Databaser:
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 vals = [val for val in cursor.iternext_dup()]
@@ -368,8 +977,8 @@ class Databaser:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -384,14 +993,15 @@ class Databaser:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db) as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             if cursor.set_key(key):  # moves to first_dup
                 count = cursor.count()
             return count
 
 
+    @mapGrowing
     def delVals(self,db, key, dupdata=True):
         """
         Deletes all values at key in db.
@@ -401,11 +1011,12 @@ class Databaser:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        with self._begin(db, write=True) as txn:
+            return (txn.delete(key, db=db))
 
 
-    def putIoVals(self, db, key, vals):
+    @mapGrowing
+    def putIoVals(self, db, key, vals, txn=None):
         """
         Write each entry from list of bytes vals to key in db in insertion order
         Adds to existing values at key if any
@@ -418,64 +1029,105 @@ class Databaser:
         to each value changes duplicate ordering. Prefix is 7 characters long.
         With 6 character hex string followed by '.' for a max
         of 2**24 = 16,777,216 duplicates. With prepended ordinal must explicity
-        check for duplicate values before insertion. Uses a python set for the
-        duplicate inclusion test. Set inclusion scales with O(1) whereas list
-        inclusion scales with O(n).
+        check for duplicate values before insertion. Checks with one cursor
+        scan of the existing dups inside the write transaction that drops
+        matches from a python dict of pending vals. Repeats within vals are
+        added once.
 
         Parameters:
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
+            txn is optional write transaction from .transact() to write within
         """
-        dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        pending = dict.fromkeys(bytes(val) for val in vals)  # ordered unique
+        with self._begin(db, write=True, txn=txn) as txn:
             cnt = 0
-            cursor = txn.cursor()
-            if cursor.set_key(key):
-                cnt = cursor.count()
-            result = False
-            for val in vals:
-                if val not in dups:
-                    if cnt > MaxForks:
-                        raise DatabaseError("Too many recovery forks at key = "
-                                            "{}.".format(key))
-                    result = True
-                    val = (b'%06x.' % (cnt)) +  val  # prepend ordering prefix
-                    txn.put(key, val, dupdata=True)
-                    cnt += 1
-            return result
+            cursor = txn.cursor(db=db)
+            if cursor.set_key(key):  # moves to first_dup
+                sizes = set(len(val) + self._ordSize for val in pending)
+                for dup in cursor.iternext_dup():  # drop preexisting dups
+                    if len(dup) in sizes:
+                        pending.pop(bytes(dup[self._ordSize:]), None)
+                        if not pending:
+                            break
+                cnt = self._nextOrd(cursor, key)
+            for val in pending:
+                if cnt > MaxForks:
+                    raise DatabaseError("Too many recovery forks at key = "
+                                        "{}.".format(key))
+                val = self._ordinal(cnt) +  val  # prepend ordering prefix
+                txn.put(key, val, dupdata=True, db=db)
+                cnt += 1
+            return (True if pending else False)
 
 
-    def addIoVal(self, db, key, val):
+    @mapGrowing
+    def addIoVal(self, db, key, val, txn=None):
         """
         Add val bytes as dup in insertion order to key in db
         Adds to existing values at key if any
         Returns True if written else False if val is already a dup
 
         Duplicates preserve insertion order.
+        Checks for duplicate with one cursor scan of the existing dups inside
+        the write transaction that stops at the first match.
 
         Parameters:
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
+            txn is optional write transaction from .transact() to write within
         """
-        dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        size = len(val) + self._ordSize  # size of dup with ordering prefix
+        with self._begin(db, write=True, txn=txn) as txn:
             cnt = 0
-            cursor = txn.cursor()
-            if cursor.set_key(key):
-                cnt = cursor.count()
-            result = False
-            if val not in dups:
-                if cnt > MaxForks:
-                    raise DatabaseError("Too many recovery forks at key = "
-                                        "{}.".format(key))
-                val = (b'%06x.' % (cnt)) +  val  # prepend ordering prefix
-                result = txn.put(key, val, dupdata=True)
-            return result
+            cursor = txn.cursor(db=db)
+            if cursor.set_key(key):  # moves to first_dup
+                for dup in cursor.iternext_dup():
+                    if len(dup) == size and dup[self._ordSize:] == val:
+                        return False  # already a dup
+                cnt = self._nextOrd(cursor, key)
+            if cnt > MaxForks:
+                raise DatabaseError("Too many recovery forks at key = "
+                                    "{}.".format(key))
+            val = self._ordinal(cnt) +  val  # prepend ordering prefix
+            return (txn.put(key, val, dupdata=True, db=db))
+
+
+    def _nextOrd(self, cursor, key):
+        """
+        Returns int insertion ordinal after last dup at key. Not the count of
+        dups since dups may have been deleted with .delIoVal
+        """
+        cursor.set_key(key)
+        cursor.last_dup()
+        return self._ordOf(cursor.value()) + 1
+
+
+    @mapGrowing
+    def delIoVal(self, db, key, val, txn=None):
+        """
+        Deletes dup val at key in db ignoring its insertion ordering prefix
+        Returns True If val was a dup at key Else False
+        Remaining dups keep their insertion order.
+
+        Parameters:
+            db is opened named sub db with dupsort=True
+            key is bytes of key within sub db's keyspace
+            val is bytes of value to be deleted
+            txn is optional write transaction from .transact() to write within
+        """
+        with self._begin(db, write=True, txn=txn) as txn:
+            cursor = txn.cursor(db=db)
+            if cursor.set_key(key):  # moves to first_dup
+                for dup in cursor.iternext_dup():
+                    if dup[self._ordSize:] == val:
+                        return cursor.delete()
+            return False
 
 
-    def getIoVals(self, db, key):
+    def getIoVals(self, db, key, txn=None):
         """
         Return list of values at key in db in insertion order
         Returns empty list if no entry at key
@@ -491,14 +1143,14 @@ class Databaser:
         Parameters:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
+            txn is optional transaction from .transact() to read within
         """
-
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db, txn=txn) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 # slice off prepended ordering prefix
-                vals = [val[7:] for val in cursor.iternext_dup()]
+                vals = [val[self._ordSize:] for val in cursor.iternext_dup()]
             return vals
 
 
@@ -520,12 +1172,12 @@ class Databaser:
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db) as txn:
+            cursor = txn.cursor(db=db)
             val = None
             if cursor.set_key(key):  # move to first_dup
                 if cursor.last_dup(): # move to last_dup
-                    val = cursor.value()[7:]  # slice off prepended ordering prefix
+                    val = cursor.value()[self._ordSize:]  # slice off ordering prefix
             return val
 
 
@@ -537,14 +1189,15 @@ class Databaser:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db) as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             if cursor.set_key(key):  # moves to first_dup
                 count = cursor.count()
             return count
 
 
+    @mapGrowing
     def delIoVals(self,db, key, dupdata=True):
         """
         Deletes all values at key in db.
@@ -554,15 +1207,73 @@ class Databaser:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        with self._begin(db, write=True) as txn:
+            return (txn.delete(key, db=db))
+
+
+    def _preSnIter(self, cursor, pre, fromSn=0, toSn=None, reverse=False,
+                   gaps=False):
+        """
+        Returns generator that positions cursor at each snKey entry of pre in
+        sequence number order and yields its int sn. Positions cursor once
+        and then advances with next_nodup or prev_nodup while the key prefix
+        is pre instead of a set_key B-tree descent per sequence number.
+        Caller may move cursor among the dups at each key between yields.
+
+        Parameters:
+            cursor is cursor of transaction on opened named sub db with dupsort
+            pre is bytes of itdentifier prefix prepended to sn in key
+            fromSn is int lowest sn inclusive
+            toSn is int highest sn inclusive or None for no bound
+            reverse is Boolean True means walk from highest sn to lowest sn
+            gaps is Boolean True means skip missing sns. False means stop at
+                first missing sn. Forward walk must then start at fromSn and
+                reverse walk at toSn when given.
+        """
+        if self.layout == 1:
+            front = pre + b'.'
+            size = len(front) + 32  # snKey sn is 32 hex digits
+            limit = 1 << 128
+        else:
+            front = self._pre(pre)
+            size = len(front) + SnSize
+            limit = 1 << (8 * SnSize)
+        if reverse:
+            if toSn is None or toSn + 1 >= limit:
+                # past last sn of pre
+                found = cursor.set_range(front + b'\xff' * (size - len(front) + 1))
+            else:
+                found = cursor.set_range(self._snKey(pre, toSn + 1))
+            found = cursor.prev_nodup() if found else cursor.last()
+        else:
+            found = cursor.set_range(self._snKey(pre, fromSn))
+        expect = (toSn if reverse else fromSn) if not gaps else None
+
+        while found:
+            key = cursor.key()
+            if len(key) != size or key[:len(front)] != front:
+                break  # different pre
+            if self.layout == 1:
+                sn = int(bytes(key[len(front):]), 16)
+            else:
+                sn = int.from_bytes(key[len(front):], "big")
+            if (sn < fromSn) if reverse else (toSn is not None and sn > toSn):
+                break  # past bound
+            if expect is not None and sn != expect:
+                break  # gap
+            yield sn
+            if not gaps:
+                expect = sn - 1 if reverse else sn + 1
+            found = cursor.prev_nodup() if reverse else cursor.next_nodup()
 
 
-    def getIoValsAllPreIter(self, db, pre):
+    def getIoValsAllPreIter(self, db, pre, fromSn=0, toSn=None, reverse=False):
         """
         Returns iterator of all dup vals in insertion order for all entries
         with same prefix across all sequence numbers in order without gaps
-        starting with zero. Stops if gap or different pre.
+        starting with fromSn. Stops if gap or different pre or past toSn.
+        When reverse then starts with toSn if given else the last sn and
+        yields dups in reverse insertion order down to fromSn.
         Assumes that key is combination of prefix and sequence number given
         by .snKey().
 
@@ -580,22 +1291,32 @@ class Databaser:
             db is opened named sub db with dupsort=True
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
-        """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            key = snKey(pre, cnt:=0)
-            while cursor.set_key(key):  # moves to first_dup
-                for val in cursor.iternext_dup():
-                    # slice off prepended ordering prefix
-                    yield val[7:]
-                key = snKey(pre, cnt:=cnt+1)
-
-
-    def getIoValsLastAllPreIter(self, db, pre):
+            fromSn is int lowest sn inclusive
+            toSn is int highest sn inclusive or None for no bound
+            reverse is Boolean True means from highest sn to lowest sn
+        """
+        with self._begin(db) as txn:
+            cursor = txn.cursor(db=db)
+            for sn in self._preSnIter(cursor, pre, fromSn=fromSn, toSn=toSn,
+                                      reverse=reverse):
+                if reverse:
+                    for val in cursor.iterprev_dup():
+                        # slice off prepended ordering prefix
+                        yield val[self._ordSize:]
+                else:
+                    for val in cursor.iternext_dup():
+                        # slice off prepended ordering prefix
+                        yield val[self._ordSize:]
+
+
+    def getIoValsLastAllPreIter(self, db, pre, fromSn=0, toSn=None,
+                                reverse=False):
         """
         Returns iterator of last only dup vals in insertion order for all entries
         with same prefix across all sequence numbers in order without gaps
-        starting with zero. Stops if gap or different pre.
+        starting with fromSn. Stops if gap or different pre or past toSn.
+        When reverse then starts with toSn if given else the last sn and
+        walks down to fromSn.
         Assumes that key is combination of prefix and sequence number given
         by .snKey().
 
@@ -613,21 +1334,25 @@ class Databaser:
             db is opened named sub db with dupsort=True
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
-        """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            key = snKey(pre, cnt:=0)
-            while cursor.set_key(key):  # moves to first_dup
+            fromSn is int lowest sn inclusive
+            toSn is int highest sn inclusive or None for no bound
+            reverse is Boolean True means from highest sn to lowest sn
+        """
+        with self._begin(db) as txn:
+            cursor = txn.cursor(db=db)
+            for sn in self._preSnIter(cursor, pre, fromSn=fromSn, toSn=toSn,
+                                      reverse=reverse):
                 if cursor.last_dup(): # move to last_dup
-                    yield cursor.value()[7:]  # slice off prepended ordering prefix
-                key = snKey(pre, cnt:=cnt+1)
+                    yield cursor.value()[self._ordSize:]  # slice off ordering prefix
 
 
-    def getIoValsAnyPreIter(self, db, pre):
+    def getIoValsAnyPreIter(self, db, pre, fromSn=0, toSn=None, reverse=False):
         """
         Returns iterator of all dup vals in insertion order for any entries
         with same prefix across all sequence numbers in order including gaps.
-        Stops when pre is different.
+        Stops when pre is different or past toSn.
+        When reverse then walks from highest sn to lowest sn and yields dups
+        in reverse insertion order.
         Assumes that key is combination of prefix and sequence number given
         by .snKey().
 
@@ -645,28 +1370,85 @@ class Databaser:
             db is opened named sub db with dupsort=True
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
-        """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            key = snKey(pre, cnt:=0)
-            while cursor.set_range(key):  #  moves to first dup of key >= key
-                key = cursor.key()  # actual key
-                front, back = bytes(key).split(sep=b'.', maxsplit=1)
-                if front != pre:
-                    break
-                for val in cursor.iternext_dup():
-                    # slice off prepended ordering prefix
-                    yield val[7:]
-                cnt = int(back, 16)
-                key = snKey(pre, cnt:=cnt+1)
-
-
+            fromSn is int lowest sn inclusive
+            toSn is int highest sn inclusive or None for no bound
+            reverse is Boolean True means from highest sn to lowest sn
+        """
+        with self._begin(db) as txn:
+            cursor = txn.cursor(db=db)
+            for sn in self._preSnIter(cursor, pre, fromSn=fromSn, toSn=toSn,
+                                      reverse=reverse, gaps=True):
+                if reverse:
+                    for val in cursor.iterprev_dup():
+                        # slice off prepended ordering prefix
+                        yield val[self._ordSize:]
+                else:
+                    for val in cursor.iternext_dup():
+                        # slice off prepended ordering prefix
+                        yield val[self._ordSize:]
+
+
+
+def convertLogger(src, dst, chunk=10000):
+    """
+    Offline converter between layouts. Copies every record of Logger src
+    into empty Logger dst converting keys and dup insertion ordinals from
+    src.layout to dst.layout. Commits dst every chunk records.
+    Returns int count of records copied.
+    Neither src nor dst may be in use by anything else while converting.
 
-def openLogger(name="test"):
+    Parameters:
+        src is Logger instance to convert from
+        dst is Logger instance of new database to convert to
+        chunk is int records per commit of dst
+    """
+    with dst.env.begin(write=False) as txn:
+        for name in dst.DgKeyDBs + dst.SnKeyDBs + dst.PreKeyDBs + dst.TimeKeyDBs:
+            if txn.stat(getattr(dst, name))["entries"]:
+                raise DatabaseError("Target database {} not empty.".format(dst.path))
+
+    if dst.mapSize < 2 * src.mapUsed():  # room for converted records
+        try:
+            dst.growMap(2 * src.mapUsed())
+        except DatabaseError:  # at max so may still fit
+            pass
+
+    count = 0
+    with src.env.begin(write=False, buffers=True) as stxn:
+        dtxn = dst.env.begin(write=True)
+        try:
+            for name in src.DgKeyDBs + src.SnKeyDBs + src.PreKeyDBs + src.TimeKeyDBs:
+                sdb, ddb = getattr(src, name), getattr(dst, name)
+                ioed = name in src.SnKeyDBs  # insertion ordered dups
+                for key, val in stxn.cursor(db=sdb).iternext():
+                    if ioed:
+                        key = dst._snk(src._snKeyOf(key))
+                        val = dst._ordinal(src._ordOf(val)) + val[src._ordSize:]
+                    elif name in src.PreKeyDBs:
+                        key = dst._pre(src._preOf(key))
+                    elif name in src.DgKeyDBs:
+                        key = dst._dgk(src._dgKeyOf(key))
+                    dtxn.put(key, val, db=ddb)
+                    count += 1
+                    if count % chunk == 0:
+                        dtxn.commit()
+                        dst._headroom()
+                        dtxn = dst.env.begin(write=True)
+            dtxn.commit()
+        except BaseException:
+            dtxn.abort()
+            raise
+
+    if dst.evtFilter is not None:
+        dst.loadEvtFilter(capacity=dst.evtFilter.capacity)
+    return count
+
+
+def openLogger(name="test", **kwa):
     """
     Returns contextmanager generated by openDatabaser but with Logger instance
     """
-    return openDatabaser(name=name, cls=Logger)
+    return openDatabaser(name=name, cls=Logger, **kwa)
 
 
 class Logger(Databaser):
@@ -729,6 +1511,14 @@ class Logger(Databaser):
             SB is keyed by identifer prefix plus digest of serialized event
             More than one value per DB key is allowed
 
+        .vrvs is named sub DB indexing .vres escrowed triplets by validator
+            so they may be found when validator establishment event is accepted
+            preKey
+            Values are dgKey() keys of receipted events in .vres whose
+            escrowed triplets are from validator
+            DB is keyed by validator identifer prefix
+            More than one value per DB key is allowed
+
         .kels is named sub DB of key event log tables that map sequence numbers
             to serialized event digests.
             snKey
@@ -764,16 +1554,57 @@ class Logger(Databaser):
             DB is keyed by identifer prefix plus sequence number of key event
             More than one value per DB key is allowed
 
+        .stts is named sub DB of key state records of accepted KELs so Kevers
+            may be restored without replaying and reverifying their KELs
+            preKey
+            Values are serialized versioned key state records
+            DB is keyed by identifer prefix
+            Only one value per DB key is allowed
+
+        .escs is named sub DB time index of escrowed entries in .EscrowDBs
+            escKey
+            Values are locators of escrowed entries. dgKey() of event plus
+            '.' plus hex sn for event escrows or dgKey() plus '.' plus
+            escrowed couplet or triplet for receipt escrows
+            DB is keyed by escrow kind name plus binary time first escrowed
+            More than one value per DB key is allowed
+
+        .escrowTTLs is dict of escrow kind name to float seconds escrowed
+            entries live before .sweepEscrows removes them. None means forever
+        .sweepLimit is int max index entries per kind per .sweepEscrows call
+
+        .evtFilter is BloomFilter over .evts keys or None when not enabled
+            Rebuilt from .evts on init and updated by .putEvt and .setEvt
+            so .hasEvt may skip the database probe for new events
+
 
     Properties:
 
 
     """
-    def __init__(self, **kwa):
+    EvtFilterFPR = 0.001  # target false positive rate of .evtFilter
+    # names of sub dbs by key kind for layout conversion
+    DgKeyDBs = ("evts", "dtss", "sigs", "rcts", "ures", "vrcs", "vres")
+    SnKeyDBs = ("kels", "pses", "ooes", "dels", "ldes")  # insertion ordered
+    PreKeyDBs = ("stts", "vrvs")
+    TimeKeyDBs = ("escs", )  # keys and vals independent of layout
+    EscrowDBs = ("ooes", "pses", "ldes", "ures", "vres")  # swept by time
+    EscrowTTLs = dict(ooes=1200.0, pses=3600.0, ldes=3600.0, ures=3600.0,
+                      vres=3600.0)  # seconds
+    SweepLimit = 1000  # index entries per kind per sweep
+
+    def __init__(self, bloom=0, escrowTTLs=None, sweepLimit=None, **kwa):
         """
         Setup named sub databases.
 
         Parameters:
+            bloom is int expected number of events. When nonzero enables
+                .evtFilter sized for the larger of bloom and twice the number
+                of events already in .evts
+            escrowTTLs is dict of escrow kind name to seconds that overrides
+                .EscrowTTLs
+            sweepLimit is int max index entries per kind per sweep.
+                Defaults to .SweepLimit
 
         Notes:
 
@@ -800,14 +1631,211 @@ class Logger(Databaser):
         self.ures = self.env.open_db(key=b'ures.', dupsort=True)
         self.vrcs = self.env.open_db(key=b'vrcs.', dupsort=True)
         self.vres = self.env.open_db(key=b'vres.', dupsort=True)
+        self.vrvs = self.env.open_db(key=b'vrvs.', dupsort=True)
         self.kels = self.env.open_db(key=b'kels.', dupsort=True)
         self.pses = self.env.open_db(key=b'pses.', dupsort=True)
         self.ooes = self.env.open_db(key=b'ooes.', dupsort=True)
         self.dels = self.env.open_db(key=b'dels.', dupsort=True)
         self.ldes = self.env.open_db(key=b'ldes.', dupsort=True)
+        self.stts = self.env.open_db(key=b'stts.')
+        self.escs = self.env.open_db(key=b'escs.', dupsort=True)
 
+        self.escrowTTLs = dict(self.EscrowTTLs)
+        if escrowTTLs:
+            self.escrowTTLs.update(escrowTTLs)
+        self.sweepLimit = sweepLimit if sweepLimit is not None else self.SweepLimit
 
-    def putEvt(self, key, val):
+        self.evtFilter = None
+        if bloom:
+            self.loadEvtFilter(capacity=bloom)
+
+
+    def loadEvtFilter(self, capacity=65536):
+        """
+        Creates .evtFilter and fills it with all keys in .evts
+        Capacity is at least twice the number of keys in .evts
+        """
+        with self._txn(db=self.evts, write=False) as txn:
+            count = txn.stat(self.evts)["entries"]
+            evtFilter = BloomFilter(capacity=max(capacity, 2 * count),
+                                    fpr=self.EvtFilterFPR)
+            cursor = txn.cursor()
+            for key in cursor.iternext(keys=True, values=False):
+                evtFilter.add(key)
+        self.evtFilter = evtFilter
+        return evtFilter
+
+
+    @mapGrowing
+    def logEvt(self, pre, dig, sn, raw, sigs, idx=None, dts=None, state=None):
+        """
+        Writes event with its datetime stamp, signatures, sequence number
+        index entry, and key state in one write transaction so all or none
+        are logged.
+        Returns True if dig added to index Else False
+
+        Parameters:
+            pre is bytes or str qb64 identifier prefix of event
+            dig is bytes or str qb64 digest of serialized event raw
+            sn is int sequence number of event
+            raw is bytes serialized event
+            sigs is list of bytes qb64b fully qualified event signatures
+            idx is named sub db of event index tables keyed by snKey such as
+                .kels, .pses, .ooes, or .ldes. Defaults to .kels
+            dts is bytes ISO 8601 datetime stamp. Defaults to now
+            state is bytes serialized key state of pre after event or None
+                to leave .stts unchanged
+        """
+        if idx is None:
+            idx = self.kels
+        if dts is None:
+            dts = nowIso8601().encode("utf-8")
+        if hasattr(dig, "encode"):
+            dig = dig.encode("utf-8")
+        dgkey = dgKey(pre, dig)
+        with self.transact() as txn:
+            self.putDts(dgkey, dts, txn=txn)
+            self.putSigs(dgkey, sigs, txn=txn)
+            self.putEvt(dgkey, raw, txn=txn)
+            if state is not None:
+                self.setState(pre, state, txn=txn)
+            for kind in self.EscrowDBs:  # escrow so index by time
+                if idx is getattr(self, kind):
+                    self.addEsc(kind, dts, dgkey + b'.%x' % sn, txn=txn)
+                    break
+            return self.addIoVal(idx, self._snKey(pre, sn), dig, txn=txn)
+
+
+    @mapGrowing
+    def logRct(self, key, val, idx=None, dts=None):
+        """
+        Use dgKey()
+        Adds escrowed receipt val as dup at key in idx and indexes it by time
+        in .escs with locator key.val in one write transaction so each val
+        expires on its own. Returns True if written Else False if val already
+        a dup
+
+        Parameters:
+            key is bytes dgKey() of receipted event
+            val is bytes receipt couplet or triplet
+            idx is named sub db of receipt escrows .ures or .vres.
+                Defaults to .ures
+            dts is bytes ISO 8601 datetime stamp. Defaults to now
+        """
+        if idx is None:
+            idx = self.ures
+        if dts is None:
+            dts = nowIso8601().encode("utf-8")
+        dgk = self._dgk(key)
+        with self.transact() as txn:
+            if not txn.put(dgk, val, dupdata=False, db=idx):
+                return False  # already escrowed and indexed
+            kind = "ures" if idx is self.ures else "vres"
+            self.addEsc(kind, dts, bytes(key) + b'.' + bytes(val), txn=txn)
+            return True
+
+
+    def addEsc(self, kind, dts, val, txn=None):
+        """
+        Use escKey()
+        Adds escrowed entry locator val as dup at escKey(kind, dts) in .escs
+        Returns True if written Else False if val already a dup
+        """
+        with self._begin(self.escs, write=True, txn=txn) as txn:
+            return txn.put(escKey(kind, dts), val, dupdata=False, db=self.escs)
+
+
+    def getEscItemIter(self, kind):
+        """
+        Returns iterator of (key, val) duples in time order of escrowed entry
+        locators val and their escKey() key for escrow kind name
+        """
+        kind = kind.encode("utf-8")
+        with self._begin(self.escs) as txn:
+            cursor = txn.cursor(db=self.escs)
+            if cursor.set_range(kind):
+                for key, val in cursor.iternext():
+                    if not bytes(key).startswith(kind):
+                        break
+                    yield (bytes(key), bytes(val))
+
+
+    @mapGrowing
+    def sweepEscrows(self, now=None, limit=None, quarantine=False):
+        """
+        Removes escrowed entries of each kind in .EscrowDBs that were indexed
+        in .escs more than .escrowTTLs of the kind seconds before now. Walks
+        .escs from the oldest entry of each kind and sweeps at most limit
+        index entries per kind so work per call is bounded. Call periodically.
+        For event escrows also removes the logged event, its signatures, and
+        datetime stamp unless quarantine or the event is in .kels. Entries
+        already gone from escrow, such as replayed ones, only lose their
+        index entry.
+        Returns int count of index entries swept
+
+        Parameters:
+            now is datetime of sweep. Defaults to now
+            limit is int max index entries per kind. Defaults to .sweepLimit
+            quarantine is Boolean True means keep the logged events of swept
+                event escrows for inspection
+        """
+        if now is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+        limit = limit if limit is not None else self.sweepLimit
+        count = 0
+        with self.transact() as txn:
+            cursor = txn.cursor(db=self.escs)
+            for kind in self.EscrowDBs:
+                ttl = self.escrowTTLs.get(kind)
+                if ttl is None:  # never expires
+                    continue
+                cutoff = escKey(kind, now - datetime.timedelta(seconds=ttl))
+                entries = []
+                if cursor.set_range(kind.encode("utf-8")):
+                    for key, val in cursor.iternext():  # other kinds sort after
+                        key = bytes(key)
+                        if key >= cutoff or len(entries) >= limit:
+                            break
+                        entries.append((key, bytes(val)))
+                for key, val in entries:
+                    self._sweepEsc(kind, val, quarantine, txn)
+                    txn.delete(key, val, db=self.escs)
+                    count += 1
+        return count
+
+
+    def _sweepEsc(self, kind, loc, quarantine, txn):
+        """
+        Removes escrowed entry at locator loc from escrow kind within txn
+        """
+        db = getattr(self, kind)
+        if kind in self.SnKeyDBs:
+            dgkey, _, sn = loc.rpartition(b'.')
+            pre, _, dig = dgkey.partition(b'.')
+            key = self._snKey(pre, int(sn, 16))
+            if not self.delIoVal(db, key, dig, txn=txn):
+                return  # already gone
+            if quarantine or dig in self.getIoVals(self.kels, key, txn=txn):
+                return  # keep logged event
+            dgk = self._dgk(dgkey)
+            for sdb in (self.evts, self.sigs, self.dtss):
+                txn.delete(dgk, db=sdb)
+        else:  # receipt escrow locator is dgkey.val
+            dgkey, _, val = loc.rpartition(b'.')
+            dgk = self._dgk(dgkey)
+            if not txn.delete(dgk, val, db=db):
+                return  # already gone such as promoted
+            if kind == "vres":  # remove validator index entry when last
+                vpre = CryMat(qb64b=val).qb64b
+                cursor = txn.cursor(db=db)
+                if cursor.set_key(dgk):
+                    for triplet in cursor.iternext_dup():
+                        if CryMat(qb64b=bytes(triplet)).qb64b == vpre:
+                            return
+                txn.delete(self._pre(vpre), dgkey, db=self.vrvs)
+
+
+    def putEvt(self, key, val, txn=None):
         """
         Use dgKey()
         Write serialized event bytes val to key
@@ -815,7 +1843,11 @@ class Logger(Databaser):
         Returns True If val successfully written Else False
         Return False if key already exists
         """
-        return self.putVal(self.evts, key, val)
+        key = self._dgk(key)
+        result = self.putVal(self.evts, key, val, txn=txn)
+        if self.evtFilter is not None:
+            self.evtFilter.add(bytes(key))
+        return result
 
     def setEvt(self, key, val):
         """
@@ -824,7 +1856,28 @@ class Logger(Databaser):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
-        return self.setVal(self.evts, key, val)
+        key = self._dgk(key)
+        result = self.setVal(self.evts, key, val)
+        if self.evtFilter is not None:
+            self.evtFilter.add(bytes(key))
+        return result
+
+    def hasEvt(self, key):
+        """
+        Use dgKey()
+        Returns True if event at key Else False
+        When .evtFilter says key definitely absent returns False without
+        probing database. Otherwise probes database and records any false
+        positive on .evtFilter
+        """
+        key = self._dgk(key)
+        if self.evtFilter is not None and bytes(key) not in self.evtFilter:
+            return False
+        if self.getVal(self.evts, key) is None:
+            if self.evtFilter is not None:
+                self.evtFilter.falsed()
+            return False
+        return True
 
     def getEvt(self, key):
         """
@@ -832,7 +1885,7 @@ class Logger(Databaser):
         Return event at key
         Returns None if no entry at key
         """
-        return self.getVal(self.evts, key)
+        return self.getVal(self.evts, self._dgk(key))
 
 
     def delEvt(self, key):
@@ -841,10 +1894,10 @@ class Logger(Databaser):
         Deletes value at key.
         Returns True If key exists in database Else False
         """
-        return self.delVal(self.evts, key)
+        return self.delVal(self.evts, self._dgk(key))
 
 
-    def putDts(self, key, val):
+    def putDts(self, key, val, txn=None):
         """
         Use dgKey()
         Write serialized event datetime stamp val to key
@@ -852,7 +1905,7 @@ class Logger(Databaser):
         Returns True If val successfully written Else False
         Returns False if key already exists
         """
-        return self.putVal(self.dtss, key, val)
+        return self.putVal(self.dtss, self._dgk(key), val, txn=txn)
 
 
     def setDts(self, key, val):
@@ -862,7 +1915,7 @@ class Logger(Databaser):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
-        return self.setVal(self.dtss, key, val)
+        return self.setVal(self.dtss, self._dgk(key), val)
 
 
     def getDts(self, key):
@@ -871,7 +1924,7 @@ class Logger(Databaser):
         Return datetime stamp at key
         Returns None if no entry at key
         """
-        return self.getVal(self.dtss, key)
+        return self.getVal(self.dtss, self._dgk(key))
 
 
     def delDts(self, key):
@@ -880,7 +1933,7 @@ class Logger(Databaser):
         Deletes value at key.
         Returns True If key exists in database Else False
         """
-        return self.delVal(self.dtss, key)
+        return self.delVal(self.dtss, self._dgk(key))
 
 
     def getSigs(self, key):
@@ -890,7 +1943,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.sigs, key)
+        return self.getVals(self.sigs, self._dgk(key))
 
 
     def getSigsIter(self, key):
@@ -900,10 +1953,10 @@ class Logger(Databaser):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.sigs, key)
+        return self.getValsIter(self.sigs, self._dgk(key))
 
 
-    def putSigs(self, key, vals):
+    def putSigs(self, key, vals, txn=None):
         """
         Use dgKey()
         Write each entry from list of bytes signatures vals to key
@@ -912,7 +1965,7 @@ class Logger(Databaser):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.sigs, key, vals)
+        return self.putVals(self.sigs, self._dgk(key), vals, txn=txn)
 
 
     def addSig(self, key, val):
@@ -923,7 +1976,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.sigs, key, val)
+        return self.addVal(self.sigs, self._dgk(key), val)
 
 
     def getSigs(self, key):
@@ -933,7 +1986,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.sigs, key)
+        return self.getVals(self.sigs, self._dgk(key))
 
 
     def cntSigs(self, key):
@@ -942,7 +1995,7 @@ class Logger(Databaser):
         Return count of signatures at key
         Returns zero if no entry at key
         """
-        return self.cntVals(self.sigs, key)
+        return self.cntVals(self.sigs, self._dgk(key))
 
 
     def delSigs(self, key):
@@ -951,7 +2004,7 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delVals(self.sigs, key)
+        return self.delVals(self.sigs, self._dgk(key))
 
 
     def putRcts(self, key, vals):
@@ -963,7 +2016,7 @@ class Logger(Databaser):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.rcts, key, vals)
+        return self.putVals(self.rcts, self._dgk(key), vals)
 
 
     def addRct(self, key, val):
@@ -974,7 +2027,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.rcts, key, val)
+        return self.addVal(self.rcts, self._dgk(key), val)
 
 
     def getRcts(self, key):
@@ -984,7 +2037,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.rcts, key)
+        return self.getVals(self.rcts, self._dgk(key))
 
 
     def getRctsIter(self, key):
@@ -994,7 +2047,7 @@ class Logger(Databaser):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.rcts, key)
+        return self.getValsIter(self.rcts, self._dgk(key))
 
 
     def cntRcts(self, key):
@@ -1003,7 +2056,7 @@ class Logger(Databaser):
         Return count of receipt couplets at key
         Returns zero if no entry at key
         """
-        return self.cntVals(self.rcts, key)
+        return self.cntVals(self.rcts, self._dgk(key))
 
 
     def delRcts(self, key):
@@ -1012,7 +2065,7 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delVals(self.rcts, key)
+        return self.delVals(self.rcts, self._dgk(key))
 
 
     def putUres(self, key, vals):
@@ -1024,7 +2077,7 @@ class Logger(Databaser):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.ures, key, vals)
+        return self.putVals(self.ures, self._dgk(key), vals)
 
 
     def addUre(self, key, val):
@@ -1035,7 +2088,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.ures, key, val)
+        return self.addVal(self.ures, self._dgk(key), val)
 
 
     def getUres(self, key):
@@ -1045,7 +2098,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.ures, key)
+        return self.getVals(self.ures, self._dgk(key))
 
 
     def getUresIter(self, key):
@@ -1055,7 +2108,7 @@ class Logger(Databaser):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.ures, key)
+        return self.getValsIter(self.ures, self._dgk(key))
 
 
     def cntUres(self, key):
@@ -1064,7 +2117,7 @@ class Logger(Databaser):
         Return count of receipt couplets at key
         Returns zero if no entry at key
         """
-        return self.cntVals(self.ures, key)
+        return self.cntVals(self.ures, self._dgk(key))
 
 
     def delUres(self, key):
@@ -1073,7 +2126,7 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delVals(self.ures, key)
+        return self.delVals(self.ures, self._dgk(key))
 
 
     def putVrcs(self, key, vals):
@@ -1085,7 +2138,7 @@ class Logger(Databaser):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.vrcs, key, vals)
+        return self.putVals(self.vrcs, self._dgk(key), vals)
 
 
     def addVrc(self, key, val):
@@ -1096,7 +2149,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.vrcs, key, val)
+        return self.addVal(self.vrcs, self._dgk(key), val)
 
 
     def getVrcs(self, key):
@@ -1106,7 +2159,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.vrcs, key)
+        return self.getVals(self.vrcs, self._dgk(key))
 
 
     def getVrcsIter(self, key):
@@ -1116,7 +2169,7 @@ class Logger(Databaser):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.vrcs, key)
+        return self.getValsIter(self.vrcs, self._dgk(key))
 
 
     def cntVrcs(self, key):
@@ -1125,7 +2178,7 @@ class Logger(Databaser):
         Return count of receipt triplets at key
         Returns zero if no entry at key
         """
-        return self.cntVals(self.vrcs, key)
+        return self.cntVals(self.vrcs, self._dgk(key))
 
 
     def delVrcs(self, key):
@@ -1134,7 +2187,7 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delVals(self.vrcs, key)
+        return self.delVals(self.vrcs, self._dgk(key))
 
 
     def putVres(self, key, vals):
@@ -1146,7 +2199,7 @@ class Logger(Databaser):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.vres, key, vals)
+        return self.putVals(self.vres, self._dgk(key), vals)
 
 
     def addVre(self, key, val):
@@ -1157,7 +2210,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.vres, key, val)
+        return self.addVal(self.vres, self._dgk(key), val)
 
 
     def getVres(self, key):
@@ -1167,7 +2220,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.vres, key)
+        return self.getVals(self.vres, self._dgk(key))
 
 
     def getVresIter(self, key):
@@ -1177,7 +2230,7 @@ class Logger(Databaser):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.vres, key)
+        return self.getValsIter(self.vres, self._dgk(key))
 
 
     def cntVres(self, key):
@@ -1186,7 +2239,7 @@ class Logger(Databaser):
         Return count of receipt triplets at key
         Returns zero if no entry at key
         """
-        return self.cntVals(self.vres, key)
+        return self.cntVals(self.vres, self._dgk(key))
 
 
     def delVres(self, key):
@@ -1195,7 +2248,87 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delVals(self.vres, key)
+        return self.delVals(self.vres, self._dgk(key))
+
+
+    def addVrv(self, pre, val):
+        """
+        Add dgKey() val of receipted event with escrowed triplet from
+        validator prefix pre as dup at pre in .vrvs if not already there
+        Returns True if written else False if dup val already exists
+        """
+        return self.addVal(self.vrvs, self._pre(pre), val)
+
+
+    def getVrvs(self, pre):
+        """
+        Return list of dgKey() vals of receipted events with escrowed triplets
+        from validator prefix pre
+        Returns empty list if no entry at pre
+        """
+        return self.getVals(self.vrvs, self._pre(pre))
+
+
+    @mapGrowing
+    def delVrv(self, pre, val):
+        """
+        Deletes dup val at validator prefix pre in .vrvs
+        Returns True If dup val existed Else False
+        """
+        with self._begin(self.vrvs, write=True) as txn:
+            return txn.delete(self._pre(pre), val, db=self.vrvs)
+
+
+    @mapGrowing
+    def promoteUres(self, key, rcts, drops):
+        """
+        Use dgKey()
+        Moves escrowed receipt couplets in rcts from .ures to .rcts and removes
+        couplets in drops from .ures at key in one write transaction. Couplets
+        no longer escrowed, such as ones promoted by another thread, are not
+        moved and couplets escrowed meanwhile are kept.
+        Returns int count of couplets moved
+        """
+        dgk = self._dgk(key)
+        count = 0
+        with self.transact() as txn:
+            for couplet in rcts:
+                if txn.delete(dgk, couplet, db=self.ures):  # still escrowed
+                    txn.put(dgk, couplet, dupdata=True, db=self.rcts)
+                    count += 1
+            for couplet in drops:
+                txn.delete(dgk, couplet, db=self.ures)
+        return count
+
+
+    @mapGrowing
+    def promoteVres(self, key, vrcs, drops):
+        """
+        Use dgKey()
+        Moves escrowed receipt triplets in vrcs from .vres to .vrcs and removes
+        triplets in drops from .vres at key in one write transaction. Triplets
+        no longer escrowed are not moved and triplets escrowed meanwhile are
+        kept. Removes the .vrvs index entry at key of each validator of vrcs
+        and drops with no triplet left escrowed at key.
+        Returns int count of triplets moved
+        """
+        dgk = self._dgk(key)
+        count = 0
+        with self.transact() as txn:
+            for triplet in vrcs:
+                if txn.delete(dgk, triplet, db=self.vres):  # still escrowed
+                    txn.put(dgk, triplet, dupdata=True, db=self.vrcs)
+                    count += 1
+            for triplet in drops:
+                txn.delete(dgk, triplet, db=self.vres)
+            vpres = set(CryMat(qb64b=triplet).qb64b for triplet in vrcs + drops)
+            cursor = txn.cursor(db=self.vres)
+            if cursor.set_key(dgk):
+                for triplet in cursor.iternext_dup():
+                    vpres.discard(CryMat(qb64b=bytes(triplet)).qb64b)
+            for vpre in vpres:
+                txn.delete(self._pre(vpre), bytes(key), db=self.vrvs)
+        return count
 
 
     def putKes(self, key, vals):
@@ -1206,10 +2339,10 @@ class Logger(Databaser):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.kels, key, vals)
+        return self.putIoVals(self.kels, self._snk(key), vals)
 
 
-    def addKe(self, key, val):
+    def addKe(self, key, val, txn=None):
         """
         Use snKey()
         Add key event val bytes as dup to key in db
@@ -1217,7 +2350,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.kels, key, val)
+        return self.addIoVal(self.kels, self._snk(key), val, txn=txn)
 
 
     def getKes(self, key):
@@ -1227,7 +2360,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.kels, key)
+        return self.getIoVals(self.kels, self._snk(key))
 
 
     def getKeLast(self, key):
@@ -1237,7 +2370,7 @@ class Logger(Databaser):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsLast(self.kels, key)
+        return self.getIoValsLast(self.kels, self._snk(key))
 
 
     def cntKes(self, key):
@@ -1246,7 +2379,7 @@ class Logger(Databaser):
         Return count of dup key event dig val at key
         Returns zero if no entry at key
         """
-        return self.cntIoVals(self.kels, key)
+        return self.cntIoVals(self.kels, self._snk(key))
 
 
     def delKes(self, key):
@@ -1255,9 +2388,9 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.kels, key)
+        return self.delIoVals(self.kels, self._snk(key))
 
-    def getKelIter(self, pre):
+    def getKelIter(self, pre, fromSn=0, toSn=None, reverse=False):
         """
         Returns iterator of all dup vals in insertion order for all entries
         with same prefix across all sequence numbers without gaps. Stops if
@@ -1272,13 +2405,18 @@ class Logger(Databaser):
             db is opened named sub db with dupsort=True
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
+            fromSn is int lowest sn inclusive
+            toSn is int highest sn inclusive or None for no bound
+            reverse is Boolean True means from highest sn to lowest sn
         """
         if hasattr(pre, "encode"):
             pre = pre.encode("utf-8")  # convert str to bytes
-        return self.getIoValsAllPreIter(self.kels, pre)
+        return self.getIoValsAllPreIter(self.kels, pre,
+                                        fromSn=fromSn, toSn=toSn,
+                                        reverse=reverse)
 
 
-    def getKelEstIter(self, pre):
+    def getKelEstIter(self, pre, fromSn=0, toSn=None, reverse=False):
         """
         Returns iterator of last dup vals in insertion order for all entries
         with same prefix across all sequence numbers without gaps. Stops if
@@ -1293,10 +2431,15 @@ class Logger(Databaser):
             db is opened named sub db with dupsort=True
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
+            fromSn is int lowest sn inclusive
+            toSn is int highest sn inclusive or None for no bound
+            reverse is Boolean True means from highest sn to lowest sn
         """
         if hasattr(pre, "encode"):
             pre = pre.encode("utf-8")  # convert str to bytes
-        return self.getIoValsLastAllPreIter(self.kels, pre)
+        return self.getIoValsLastAllPreIter(self.kels, pre,
+                                            fromSn=fromSn, toSn=toSn,
+                                            reverse=reverse)
 
 
     def putPses(self, key, vals):
@@ -1307,10 +2450,10 @@ class Logger(Databaser):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.pses, key, vals)
+        return self.putIoVals(self.pses, self._snk(key), vals)
 
 
-    def addPse(self, key, val):
+    def addPse(self, key, val, txn=None):
         """
         Use snKey()
         Add Partial signed escrow val bytes as dup to key in db
@@ -1318,7 +2461,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.pses, key, val)
+        return self.addIoVal(self.pses, self._snk(key), val, txn=txn)
 
 
     def getPses(self, key):
@@ -1328,7 +2471,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.pses, key)
+        return self.getIoVals(self.pses, self._snk(key))
 
 
     def getPsesLast(self, key):
@@ -1338,7 +2481,7 @@ class Logger(Databaser):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsLast(self.pses, key)
+        return self.getIoValsLast(self.pses, self._snk(key))
 
 
     def cntPses(self, key):
@@ -1347,7 +2490,7 @@ class Logger(Databaser):
         Return count of dup event dig vals at key
         Returns zero if no entry at key
         """
-        return self.cntIoVals(self.pses, key)
+        return self.cntIoVals(self.pses, self._snk(key))
 
 
     def delPses(self, key):
@@ -1356,7 +2499,7 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.pses, key)
+        return self.delIoVals(self.pses, self._snk(key))
 
 
     def putOoes(self, key, vals):
@@ -1367,10 +2510,10 @@ class Logger(Databaser):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.ooes, key, vals)
+        return self.putIoVals(self.ooes, self._snk(key), vals)
 
 
-    def addOoe(self, key, val):
+    def addOoe(self, key, val, txn=None):
         """
         Use snKey()
         Add out of order escrow val bytes as dup to key in db
@@ -1378,7 +2521,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.ooes, key, val)
+        return self.addIoVal(self.ooes, self._snk(key), val, txn=txn)
 
 
     def getOoes(self, key):
@@ -1388,7 +2531,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.ooes, key)
+        return self.getIoVals(self.ooes, self._snk(key))
 
 
     def getOoesLast(self, key):
@@ -1398,7 +2541,7 @@ class Logger(Databaser):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsLast(self.ooes, key)
+        return self.getIoValsLast(self.ooes, self._snk(key))
 
 
     def cntOoes(self, key):
@@ -1407,7 +2550,7 @@ class Logger(Databaser):
         Return count of dup event dig at key
         Returns zero if no entry at key
         """
-        return self.cntIoVals(self.ooes, key)
+        return self.cntIoVals(self.ooes, self._snk(key))
 
 
     def delOoes(self, key):
@@ -1416,7 +2559,7 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.ooes, key)
+        return self.delIoVals(self.ooes, self._snk(key))
 
 
     def putDes(self, key, vals):
@@ -1427,7 +2570,7 @@ class Logger(Databaser):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.dels, key, vals)
+        return self.putIoVals(self.dels, self._snk(key), vals)
 
 
     def addDe(self, key, val):
@@ -1438,7 +2581,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.dels, key, val)
+        return self.addIoVal(self.dels, self._snk(key), val)
 
 
     def getDes(self, key):
@@ -1448,7 +2591,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.dels, key)
+        return self.getIoVals(self.dels, self._snk(key))
 
 
     def getDesLast(self, key):
@@ -1459,7 +2602,7 @@ class Logger(Databaser):
 
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsLast(self.dels, key)
+        return self.getIoValsLast(self.dels, self._snk(key))
 
 
     def cntDes(self, key):
@@ -1468,7 +2611,7 @@ class Logger(Databaser):
         Return count of dup event dig vals at key
         Returns zero if no entry at key
         """
-        return self.cntIoVals(self.dels, key)
+        return self.cntIoVals(self.dels, self._snk(key))
 
 
     def delDes(self, key):
@@ -1477,10 +2620,10 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.dels, key)
+        return self.delIoVals(self.dels, self._snk(key))
 
 
-    def getDelIter(self, pre):
+    def getDelIter(self, pre, fromSn=0, toSn=None, reverse=False):
         """
         Returns iterator of all dup vals  in insertion order for any entries
         with same prefix across all sequence numbers including gaps.
@@ -1494,10 +2637,15 @@ class Logger(Databaser):
             db is opened named sub db with dupsort=True
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
+            fromSn is int lowest sn inclusive
+            toSn is int highest sn inclusive or None for no bound
+            reverse is Boolean True means from highest sn to lowest sn
         """
         if hasattr(pre, "encode"):
             pre = pre.encode("utf-8")  # convert str to bytes
-        return self.getIoValsAnyPreIter(self.dels, pre)
+        return self.getIoValsAnyPreIter(self.dels, pre,
+                                        fromSn=fromSn, toSn=toSn,
+                                        reverse=reverse)
 
 
     def putLdes(self, key, vals):
@@ -1508,10 +2656,10 @@ class Logger(Databaser):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.ldes, key, vals)
+        return self.putIoVals(self.ldes, self._snk(key), vals)
 
 
-    def addLde(self, key, val):
+    def addLde(self, key, val, txn=None):
         """
         Use snKey()
         Add likely duplicitous escrow val bytes as dup to key in db
@@ -1519,7 +2667,7 @@ class Logger(Databaser):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.ldes, key, val)
+        return self.addIoVal(self.ldes, self._snk(key), val, txn=txn)
 
 
     def getLdes(self, key):
@@ -1529,7 +2677,7 @@ class Logger(Databaser):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.ldes, key)
+        return self.getIoVals(self.ldes, self._snk(key))
 
 
     def getLdesLast(self, key):
@@ -1539,7 +2687,7 @@ class Logger(Databaser):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsLast(self.ldes, key)
+        return self.getIoValsLast(self.ldes, self._snk(key))
 
 
     def cntLdes(self, key):
@@ -1548,7 +2696,7 @@ class Logger(Databaser):
         Return count of dup event dig at key
         Returns zero if no entry at key
         """
-        return self.cntIoVals(self.ldes, key)
+        return self.cntIoVals(self.ldes, self._snk(key))
 
 
     def delLdes(self, key):
@@ -1557,6 +2705,60 @@ class Logger(Databaser):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.ldes, key)
+        return self.delIoVals(self.ldes, self._snk(key))
+
+
+
+
+    def putState(self, pre, val, txn=None):
+        """
+        Write serialized key state bytes val for identifier prefix pre
+        Does not overwrite existing val if any
+        Returns True If val successfully written Else False
+        Returns False if key already exists
+        """
+        return self.putVal(self.stts, self._pre(pre), val, txn=txn)
+
+
+    def setState(self, pre, val, txn=None):
+        """
+        Write serialized key state bytes val for identifier prefix pre
+        Overwrites existing val if any
+        Returns True If val successfully written Else False
+        """
+        return self.setVal(self.stts, self._pre(pre), val, txn=txn)
 
 
+    def getState(self, pre):
+        """
+        Return serialized key state for identifier prefix pre
+        Returns None if no entry at pre
+        """
+        return self.getVal(self.stts, self._pre(pre))
+
+
+    def delState(self, pre):
+        """
+        Deletes key state for identifier prefix pre
+        Returns True If key exists in database Else False
+        """
+        return self.delVal(self.stts, self._pre(pre))
+
+
+    def getStateItemIter(self):
+        """
+        Returns iterator of (pre, val) duples of bytes qb64 identifier prefix
+        and bytes serialized key state for every prefix in .stts
+        """
+        with self._begin(self.stts) as txn:
+            cursor = txn.cursor(db=self.stts)
+            for key, val in cursor.iternext():
+                yield (self._preOf(key), bytes(val))
+
+
+    def cntStates(self):
+        """
+        Return count of prefixes with key state in .stts
+        """
+        with self._begin(self.stts) as txn:
+            return txn.stat(self.stts)["entries"]
@@ -10,9 +10,10 @@ import argparse
 
 from keri import __version__
 from keri.base import directing
+from keri.cli import addDatabaserArgs, databaserKwa
 
 
-def runDemo(name="bob", remote=5621, local=5620, expire=0.0):
+def runDemo(name="bob", remote=5621, local=5620, expire=0.0, **kwa):
     """
     Setup and run one demo controller for Bob
     """
@@ -33,7 +34,8 @@ def runDemo(name="bob", remote=5621, local=5620, expire=0.0):
                            role="initiator",
                            remotePort=remote,
                            localPort=local,
-                           limit=expire)
+                           limit=expire,
+                           **kwa)
 
 
 
@@ -62,6 +64,7 @@ def parseArgs(version=__version__):
                    action='store',
                    default="bob",
                    help="Name of controller. Default is bob.")
+    addDatabaserArgs(p)
 
 
     args = p.parse_args()
@@ -75,7 +78,8 @@ def main():
     runDemo(name=args.name,
             remote=args.remote,
             local=args.local,
-            expire=args.expire)
+            expire=args.expire,
+            **databaserKwa(args))
 
 
 if __name__ == "__main__":
@@ -10,9 +10,10 @@ import argparse
 
 from keri import __version__
 from keri.base import directing
+from keri.cli import addDatabaserArgs, databaserKwa
 
 
-def runDemo(name="eve", remote=5620, local=5621, expire=0.0):
+def runDemo(name="eve", remote=5620, local=5621, expire=0.0, **kwa):
     """
     Setup and run one demo controller for Eve
     """
@@ -32,7 +33,8 @@ def runDemo(name="eve", remote=5620, local=5621, expire=0.0):
                            role="validator",
                            remotePort=remote,
                            localPort=local,
-                           limit=expire)
+                           limit=expire,
+                           **kwa)
 
 
 
@@ -61,6 +63,7 @@ def parseArgs(version=__version__):
                    action='store',
                    default="eve",
                    help="Name of controller. Default is eve.")
+    addDatabaserArgs(p)
 
 
     args = p.parse_args()
@@ -74,7 +77,8 @@ def main():
     runDemo(name=args.name,
             remote=args.remote,
             local=args.local,
-            expire=args.expire)
+            expire=args.expire,
+            **databaserKwa(args))
 
 
 if __name__ == "__main__":
@@ -8,8 +8,12 @@ import shutil
 import tempfile
 import base64
 import datetime
+import hashlib
+import math
 
+from collections import OrderedDict
 from collections.abc import Iterable, Sequence,  Mapping
+from threading import Lock
 
 import pysodium
 
@@ -162,6 +166,209 @@ class mdict(MultiDict):
         return [(k, self.nabone(k)) for k in keys]
 
 
+class LruCache:
+    """
+    Bounded least recently used cache with hit and miss counters.
+    Safe to share across threads.
+
+    Attributes:
+        .size is int max number of entries. Least recently used entry is
+            evicted when full. 0 means cache nothing.
+        .hits is int count of .get calls that found key
+        .misses is int count of .get calls that did not find key
+
+    Methods:
+        get(key [,default]) returns value at key and marks it most recent
+        put(key, value) adds or replaces value at key as most recent
+        pop(key [,default]) removes and returns value at key
+        clear() removes all entries and resets counters
+    """
+
+    def __init__(self, size=1024):
+        """
+        Parameters:
+            size is int max number of entries
+        """
+        self.size = max(0, size)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """
+        Returns True if key in cache. Does not count or refresh entry
+        """
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Returns value at key and marks it most recently used
+        Returns default if key not in cache
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Adds or replaces value at key as most recently used and evicts least
+        recently used entries over .size
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """
+        Removes and returns value at key. Returns default if key not in cache
+        """
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self):
+        """
+        Removes all entries and resets hit and miss counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class BloomFilter:
+    """
+    Probabilistic set membership filter over bytes keys.
+    No false negatives. False positives at about .fpr once .capacity keys
+    have been added. Keys can not be removed. Safe to share across threads.
+
+    Attributes:
+        .capacity is int number of keys sized for at target .fpr
+        .fpr is float target false positive rate at .capacity keys
+        .m is int number of bits in filter
+        .k is int number of hash probes per key
+        .count is int number of keys added, repeated adds are counted
+        .hits is int count of lookups that found key maybe present
+        .misses is int count of lookups that found key definitely absent
+        .falses is int count of hits reported false by caller via .falsed()
+
+    Properties:
+        .nbytes is int memory size in bytes of bit array
+        .rate is float estimated false positive rate at current .count
+        .observed is float measured false positive rate from .falses
+
+    Methods:
+        add(key) adds bytes key to filter
+        falsed() records that last maybe present lookup was absent in fact
+        clear() removes all keys and resets counters
+    """
+
+    def __init__(self, capacity=65536, fpr=0.001):
+        """
+        Parameters:
+            capacity is int number of keys expected
+            fpr is float target false positive rate at capacity
+        """
+        self.capacity = max(1, capacity)
+        self.fpr = min(max(fpr, 1e-9), 0.5)
+        m = -self.capacity * math.log(self.fpr) / (math.log(2) ** 2)
+        self.m = max(64, int(math.ceil(m / 8)) * 8)
+        self.k = max(1, int(round(self.m / self.capacity * math.log(2))))
+        self._bits = bytearray(self.m // 8)
+        self._lock = Lock()
+        self.count = 0
+        self.hits = 0
+        self.misses = 0
+        self.falses = 0
+
+    def _probes(self, key):
+        """
+        Returns generator of .k bit indices for key using double hashing
+        of two 64 bit halves of blake2b digest
+        """
+        dig = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(dig[:8], "little")
+        h2 = int.from_bytes(dig[8:], "little") | 1
+        return ((h1 + i * h2) % self.m for i in range(self.k))
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        """
+        Returns False if key definitely not added else True
+        """
+        bits = self._bits
+        for i in self._probes(key):
+            if not bits[i >> 3] & (1 << (i & 7)):
+                with self._lock:
+                    self.misses += 1
+                return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def add(self, key):
+        """
+        Adds bytes key to filter
+        """
+        probes = list(self._probes(key))
+        with self._lock:
+            bits = self._bits
+            for i in probes:
+                bits[i >> 3] |= 1 << (i & 7)
+            self.count += 1
+
+    def falsed(self):
+        """
+        Records that a maybe present lookup was found absent by exact check
+        """
+        with self._lock:
+            self.falses += 1
+
+    def clear(self):
+        """
+        Removes all keys and resets counters
+        """
+        with self._lock:
+            self._bits = bytearray(self.m // 8)
+            self.count = self.hits = self.misses = self.falses = 0
+
+    @property
+    def nbytes(self):
+        """
+        Returns memory size in bytes of bit array
+        """
+        return len(self._bits)
+
+    @property
+    def rate(self):
+        """
+        Returns estimated false positive rate given .count keys added
+        """
+        return (1.0 - math.exp(-self.k * self.count / self.m)) ** self.k
+
+    @property
+    def observed(self):
+        """
+        Returns measured false positive rate as .falses over lookups of
+        absent keys, that is .falses plus .misses. 0.0 when no such lookups
+        """
+        absent = self.falses + self.misses
+        return (self.falses / absent) if absent else 0.0
+
+
 def nonStringIterable(obj):
     """
     Returns True if obj is non-string iterable, False otherwise
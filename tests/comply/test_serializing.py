@@ -0,0 +1,144 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.comply.test_serializing module
+
+Conformance of serializer backends in Serializers registry to default output
+"""
+import pytest
+
+import timeit
+
+from keri.core.coring import Serials, Serializers, DefaultSerializers
+from keri.core.coring import registerSerializer, fastSerializers
+from keri.core.coring import Serder, Signer, Nexter, CryOneDex
+from keri.core.eventing import incept, rotate, interact
+
+
+def sampleKeds():
+    """
+    Returns list of key event dicts that exercise field ordering, nesting,
+    empty lists, and non ascii and control characters in str values
+    """
+    signers = [Signer(raw=bytes([i]) * 32) for i in range(3)]
+    keys = [signer.verfer.qb64 for signer in signers]
+    icp = incept(keys=keys[:2], sith=1, nxt=Nexter(keys=[keys[2]]).qb64,
+                 code=CryOneDex.Blake3_256)
+    rot = rotate(pre=icp.ked["pre"], keys=[keys[2]], dig=icp.dig, sn=1,
+                 data=[dict(pre=icp.ked["pre"], dig=icp.dig)])
+    ixn = interact(pre=icp.ked["pre"], dig=rot.dig, sn=2,
+                   data=[dict(note="Grüße   \x1f \"quoted\" back\\slash")])
+    return [dict(serder.ked) for serder in (icp, rot, ixn)]
+
+
+def test_serializer_registry():
+    """
+    Test registerSerializer swaps and restores backends
+    """
+    assert set(Serializers) == set(Serials)
+    assert Serializers == DefaultSerializers
+
+    with pytest.raises(ValueError):
+        registerSerializer("XXXX", dumps=lambda ked: b'')
+
+    calls = []
+    def dumps(ked):
+        calls.append(ked)
+        return DefaultSerializers[Serials.json].dumps(ked)
+
+    prior = registerSerializer(Serials.json, dumps=dumps)
+    try:
+        assert prior == DefaultSerializers[Serials.json]
+        assert Serializers[Serials.json].loads is prior.loads
+        ked = sampleKeds()[0]
+        serder = Serder(ked=ked)
+        assert calls
+        assert serder.raw == Serder(ked=ked, kind=Serials.json).raw
+    finally:
+        registerSerializer(Serials.json, *prior)
+
+    assert Serializers == DefaultSerializers
+    """Done Test"""
+
+
+def test_serializer_conformance():
+    """
+    Test that fast backends produce byte for byte the default serializations
+    and load them back to the same key event dicts
+    """
+    fasts = fastSerializers()
+    assert Serials.mgpk in fasts  # msgpack is a hard dependency
+
+    for kind, codec in fasts.items():
+        default = DefaultSerializers[kind]
+        for ked in sampleKeds():
+            ked["vs"] = ked["vs"].replace(Serials.json, kind)
+            raw = default.dumps(ked)
+            assert codec.dumps(ked) == raw
+            assert codec.loads(raw) == default.loads(raw) == ked
+            assert codec.loads(memoryview(b'x' + raw)[1:]) == ked
+
+        # events and digests through Serder are the same with backend registered
+        digs = [Serder(ked=ked, kind=kind).dig for ked in sampleKeds()]
+        prior = registerSerializer(kind, *codec)
+        try:
+            for ked, dig in zip(sampleKeds(), digs):
+                serder = Serder(ked=ked, kind=kind)
+                assert serder.dig == dig
+                assert Serder(raw=serder.raw).ked == serder.ked
+        finally:
+            registerSerializer(kind, *prior)
+
+    assert Serializers == DefaultSerializers
+    """Done Test"""
+
+
+def test_serializer_threads():
+    """
+    Test fast msgpack backend packs correctly from many threads at once
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    codec = fastSerializers()[Serials.mgpk]
+    keds = sampleKeds()
+    for ked in keds:
+        ked["vs"] = ked["vs"].replace(Serials.json, Serials.mgpk)
+    raws = [DefaultSerializers[Serials.mgpk].dumps(ked) for ked in keds]
+
+    def packAll(i):
+        return [codec.dumps(ked) for ked in keds for _ in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for packed in pool.map(packAll, range(16)):
+            assert packed == [raw for raw in raws for _ in range(200)]
+    """Done Test"""
+
+
+def test_serializer_benchmark():
+    """
+    Benchmark default and fast backends on sample events.
+    Run with pytest -s to see the timings.
+    """
+    number = 200
+    fasts = fastSerializers()
+    keds = sampleKeds()
+    for kind in Serials:
+        for ked in keds:
+            ked["vs"] = ked["vs"][:6] + kind + ked["vs"][10:]
+        raws = [DefaultSerializers[kind].dumps(ked) for ked in keds]
+        for name, codec in (("default", DefaultSerializers[kind]),
+                            ("fast", fasts.get(kind))):
+            if codec is None:
+                continue
+            dumps = timeit.timeit(lambda: [codec.dumps(ked) for ked in keds],
+                                  number=number)
+            loads = timeit.timeit(lambda: [codec.loads(raw) for raw in raws],
+                                  number=number)
+            per = number * len(keds)
+            print("\n{} {:8} dumps {:8.2f} us loads {:8.2f} us"
+                  "".format(kind, name, dumps / per * 1e6, loads / per * 1e6))
+            assert dumps > 0 and loads > 0
+    """Done Test"""
+
+
+if __name__ == "__main__":
+    test_serializer_benchmark()
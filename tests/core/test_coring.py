@@ -9,6 +9,8 @@ import pysodium
 import blake3
 import json
 
+from dataclasses import astuple
+
 import msgpack
 import cbor2 as cbor
 
@@ -32,10 +34,16 @@ from keri.core.coring import (SigSelDex, SigCntDex, SigCntSizes, SigCntRawSizes,
                               SigFourDex, SigFourSizes, SigFourRawSizes,
                               SigFiveDex, SigFiveSizes, SigFiveRawSizes,
                               SigSizes, SigRawSizes, MINSIGSIZE)
-from keri.core.coring import IntToB64, B64ToInt
+from keri.core.coring import IntToB64, B64ToInt, B64ToB2, B2ToB64
+from keri.core.coring import VERCACHESIZE
+from keri.core.coring import (Sizage, CryOneCodes, CryTwoCodes, CryFourCodes,
+                              CryCntCodes, CryNonTransCodes, CryCodeSizes)
+from keri.core.coring import (SigTwoCodes, SigFourCodes, SigFiveCodes,
+                              SigCntCodes, SigCodeSizes)
 from keri.core.coring import SigMat, SigCounter, Siger
 from keri.core.coring import Serialage, Serials, Mimes, Vstrings
 from keri.core.coring import Versify, Deversify, Rever, VERFULLSIZE, MINSNIFFSIZE
+from keri.core.coring import Unversify, Sniff, VERSTARTS
 from keri.core.coring import Serder
 from keri.core.coring import Ilkage, Ilks
 
@@ -129,6 +137,22 @@ def test_cryderivationcodes():
 
     assert MINCRYSIZE == 4
 
+    # compiled tables in sync with codexes
+    assert CryOneCodes == frozenset(astuple(CryOneDex))
+    assert CryTwoCodes == frozenset(astuple(CryTwoDex))
+    assert CryFourCodes == frozenset(astuple(CryFourDex))
+    assert CryCntCodes == frozenset(astuple(CryCntDex))
+    assert CryNonTransCodes == frozenset(['B', '1AAA', '1AAC'])
+    assert set(CryCodeSizes) == set(CrySizes) == set(CryRawSizes)
+    for code, sizes in CryCodeSizes.items():
+        assert sizes.fs == CrySizes[code]
+        assert sizes.rs == CryRawSizes[code]
+        assert (sizes.hs + sizes.ss + sizes.rs * 4 // 3 + 3) // 4 * 4 == sizes.fs
+    assert CryCodeSizes['B'] == Sizage(hs=1, ss=0, rs=32, fs=44)
+    assert CryCodeSizes['0C'] == Sizage(hs=2, ss=0, rs=64, fs=88)
+    assert CryCodeSizes['1AAE'] == Sizage(hs=4, ss=0, rs=114, fs=156)
+    assert CryCodeSizes['-A'] == Sizage(hs=2, ss=2, rs=0, fs=4)
+
     """Done Test"""
 
 def test_sigderivationcodes():
@@ -176,6 +200,16 @@ def test_sigderivationcodes():
         assert x in SigRawSizes
 
     assert MINSIGSIZE == 4
+
+    # compiled tables in sync with codexes
+    assert SigTwoCodes == frozenset(astuple(SigTwoDex))
+    assert SigFourCodes == frozenset(astuple(SigFourDex))
+    assert SigFiveCodes == frozenset(astuple(SigFiveDex))
+    assert SigCntCodes == frozenset(astuple(SigCntDex))
+    assert set(SigCodeSizes) == set(SigSizes) == set(SigRawSizes)
+    assert SigCodeSizes['A'] == Sizage(hs=1, ss=1, rs=64, fs=88)
+    assert SigCodeSizes['0A'] == Sizage(hs=2, ss=2, rs=114, fs=156)
+    assert SigCodeSizes['-A'] == Sizage(hs=2, ss=2, rs=0, fs=4)
     """Done Test"""
 
 def test_crymat():
@@ -302,6 +336,73 @@ def test_crymat():
     assert crymat.raw == sig
     assert crymat.code == CryTwoDex.Ed25519
 
+    # extract in place from memoryview over stream at offset
+    stream = bytearray(b'junk' + prefixb + qsig64b)
+    view = memoryview(stream)
+    crymat = CryMat(qb64b=view, offset=4)
+    assert crymat.code == CryOneDex.Ed25519N
+    assert crymat.raw == verkey
+    assert isinstance(crymat.raw, bytes)
+    assert crymat.size == len(prefixb) == len(crymat.qb64b)
+    assert crymat.bsize == len(prebin) == len(crymat.qb2)
+    crymat = CryMat(qb64b=view, offset=4 + crymat.size)
+    assert crymat.size == len(qsig64b)
+    assert crymat.bsize == len(qsigB2)
+    assert crymat.code == CryTwoDex.Ed25519
+    assert crymat.raw == sig
+    with pytest.raises(ShortageError):
+        crymat = CryMat(qb64b=view[:-1], offset=4 + len(prefixb))
+    view.release()
+    del stream[:4]  # no lingering exports of stream
+
+    # extract qb2 in place from memoryview over binary stream at offset
+    stream = bytearray(b'\xff' + prebin + qsigB2)
+    view = memoryview(stream)
+    crymat = CryMat(qb2=view, offset=1)
+    assert crymat.code == CryOneDex.Ed25519N
+    assert crymat.raw == verkey
+    assert crymat.qb2 == prebin
+    crymat = CryMat(qb2=view, offset=1 + crymat.bsize)
+    assert crymat.code == CryTwoDex.Ed25519
+    assert crymat.raw == sig
+    assert crymat.qb2 == qsigB2
+    with pytest.raises(ShortageError):
+        crymat = CryMat(qb2=view[:-1], offset=1 + len(prebin))
+    view.release()
+    del stream[:1]  # no lingering exports of stream
+
+    # binary is same as decode of qb64 for every code size
+    for code, sizes in CryCodeSizes.items():
+        raw = bytes(range(sizes.rs))
+        crymat = CryMat(raw=raw, code=code, index=3)
+        assert len(crymat.qb64b) == crymat.size
+        assert crymat.qb2 == decodeB64(crymat.qb64b)
+        assert len(crymat.qb2) == crymat.bsize
+        crymat = CryMat(qb2=crymat.qb2)
+        assert crymat.code == code
+        assert crymat.raw == raw
+
+    # nonzero pad bits are not proper binary
+    with pytest.raises(ValueError):
+        crymat = CryMat(qb2=prebin[:-1] + bytes([prebin[-1] | 0x01]))
+
+    assert B64ToB2('-B') == b'\xf8\x10'
+    assert B64ToB2('-BAB') == b'\xf8\x10\x01'
+    assert B2ToB64(b'\xf8\x10\x01', 4) == '-BAB'
+    assert B2ToB64(b'\x00\xf8\x10\x01', 2, offset=1) == '-B'
+
+    # qualified encodings are memoized and kept from parse
+    crymat = CryMat(raw=verkey)
+    assert crymat.qb64b is crymat.qb64b
+    assert crymat.qb64 is crymat.qb64
+    assert crymat.qb64b == prefixb
+    crymat = CryMat(qb64b=memoryview(b'junk' + prefixb), offset=4)
+    assert isinstance(crymat.qb64b, bytes)
+    assert crymat.qb64b == prefixb
+    assert not hasattr(crymat, "__dict__")
+    with pytest.raises(AttributeError):
+        crymat.junk = True
+
     """ Done Test """
 
 def test_crycounter():
@@ -501,6 +602,54 @@ def test_verfer():
 
     with pytest.raises(ValueError):
         verfer = Verfer(raw=verkey, code=CryOneDex.Blake3_256)
+
+    # batch verify inline and over thread pool preserves order of results
+    sers = [ser + bytes([i]) for i in range(8)]
+    sigs = [pysodium.crypto_sign_detached(s, seed + verkey) for s in sers]
+    sigs[5] = sigs[4]  # bad sig
+    triples = [(verfer, sig, s) for sig, s in zip(sigs, sers)]
+    expected = [True] * 5 + [False] + [True] * 2
+    assert Verfer.verifyBatch(triples[:3]) == expected[:3]  # inline
+    assert Verfer.verifyBatch([]) == []
+
+    Verfer.setPool(workers=2, batchMin=2)
+    try:
+        assert Verfer.Workers == 2
+        assert Verfer.verifyBatch(iter(triples)) == expected
+        assert Verfer._pool is not None
+        assert Verfer._pool._max_workers == 2
+    finally:
+        Verfer.setPool(workers=None, batchMin=4)  # restore defaults
+    assert Verfer._pool is None
+    assert Verfer.verifyBatch(triples) == expected  # new default pool
+
+    # successful verifications are cached
+    Verfer.setCache(size=4)
+    try:
+        cache = Verfer.Cache
+        assert cache.size == 4
+        assert verfer.verify(sigs[0], sers[0])
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert verfer.verify(sigs[0], sers[0])
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert not verfer.verify(sigs[5], sers[5])  # failure not cached
+        assert not verfer.verify(sigs[5], sers[5])
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert len(cache) == 1
+        # same sig on other ser or key misses
+        assert not verfer.verify(sigs[0], sers[1])
+        other = Verfer(raw=verkey, code=CryOneDex.Ed25519N)
+        assert other.verify(sigs[0], sers[0])
+        assert (cache.hits, cache.misses) == (1, 5)
+        assert Verfer.verifyBatch(triples) == expected
+        assert len(cache) == 4  # bounded
+
+        Verfer.setCache(size=0)  # off
+        assert Verfer.Cache is None
+        assert verfer.verify(sigs[0], sers[0])
+    finally:
+        Verfer.setCache()  # restore default
+    assert Verfer.Cache.size == VERCACHESIZE
     """ Done Test """
 
 def test_sigver():
@@ -1128,6 +1277,31 @@ def test_sigmat():
     assert sigmat.raw == sig
     assert sigmat.code == SigTwoDex.Ed25519
     assert sigmat.index == 5
+
+    sigmat = SigMat(qb2=memoryview(b'\x00\x00' + qbin), offset=2)
+    assert sigmat.raw == sig
+    assert sigmat.code == SigTwoDex.Ed25519
+    assert sigmat.index == 5
+    assert sigmat.bsize == len(qbin)
+
+    # binary is same as decode of qb64 for every code size
+    for code, sizes in SigCodeSizes.items():
+        raw = bytes(range(sizes.rs))
+        sigmat = SigMat(raw=raw, code=code, index=3)
+        assert len(sigmat.qb64b) == sigmat.size
+        assert sigmat.qb2 == decodeB64(sigmat.qb64b)
+        sigmat = SigMat(qb2=sigmat.qb2)
+        assert sigmat.code == code
+        assert sigmat.index == 3
+        assert sigmat.raw == raw
+
+    # qualified encodings are memoized and kept from parse
+    sigmat = SigMat(raw=sig, code=SigTwoDex.Ed25519, index=5)
+    assert sigmat.qb64b is sigmat.qb64b
+    assert sigmat.qb64 is sigmat.qb64 == qsig64
+    sigmat = SigMat(qb64=qsig64)
+    assert sigmat.qb64b == qsig64.encode("utf-8")
+    assert not hasattr(sigmat, "__dict__")
     """ Done Test """
 
 def test_sigcounter():
@@ -1255,6 +1429,24 @@ def test_siger():
 
     siger = Siger(qb64=qsig64, verfer=verfer)
     assert  siger.verfer == verfer
+
+    # extract in place from memoryview over stream at offset
+    stream = bytearray(SigCounter(count=2).qb64b + qsig64b + qsig64b)
+    view = memoryview(stream)
+    counter = SigCounter(qb64b=view)
+    assert counter.count == 2
+    assert counter.size == 4
+    assert counter.bsize == 3 == len(counter.qb2)
+    siger = Siger(qb64b=view, offset=counter.size)
+    assert siger.qb64 == qsig64
+    assert siger.size == len(qsig64b)
+    assert siger.bsize == len(siger.qb2) == 66
+    siger = Siger(qb64b=view, offset=4 + len(qsig64b))
+    assert siger.qb64 == qsig64
+    with pytest.raises(ShortageError):
+        siger = Siger(qb64b=view, offset=5 + len(qsig64b))
+    view.release()
+    del stream[:4]  # no lingering exports of stream
     """ Done Test """
 
 
@@ -1434,6 +1626,37 @@ def test_versify():
     assert kind == Serials.cbor
     assert version == Version
     assert size == 65
+
+    with pytest.raises(ValueError):
+        Deversify("KERI10XXXX000041_")  # unknown kind
+    with pytest.raises(ValueError):
+        Deversify("KERI10CBOR00004G_")  # not hex
+
+    # fixed layout parse without regex
+    assert Unversify(b"KERI10JSON00012c_") == (Serials.json, Version, 300)
+    assert Unversify(b"xxKERI10MGPK00012c_", start=2) == (Serials.mgpk, Version, 300)
+    assert Unversify(b"KERI10JSON00012C_") is None  # upper case hex
+    assert Unversify(b"KERI10JSoN00012c_") is None  # lower case kind
+    assert Unversify(b"KERI10JSON00012c-") is None  # bad terminator
+    assert Unversify(b"KERI10JSON00012c") is None  # short
+
+    ked = dict(vs=Versify(kind=Serials.json, size=0), pre="ABCDEFG", sn="0001",
+               ilk="rot")
+    for kind in Serials:
+        raw = Serder(ked=dict(ked), kind=kind).raw
+        assert Sniff(raw) == (kind, Version, len(raw), VERSTARTS[Serials.index(kind)])
+        assert Sniff(memoryview(b'junk' + raw), offset=4)[3] == 4 + VERSTARTS[Serials.index(kind)]
+
+    # falls back on search when vs is not at fixed start
+    raw = b'{"vs" : "KERI10JSON000022_"}'
+    assert Sniff(raw + bytes(4)) == (Serials.json, Version, 34, 9)
+    raw = b'{"abcdefghijklmnop":"b","vs":"KERI10JSON000020_"}'
+    with pytest.raises(ValueError):
+        Sniff(raw)  # too far in
+    with pytest.raises(ShortageError):
+        Sniff(b'{"vs":"KERI10JSON000020_"}')
+    with pytest.raises(ValueError):
+        Sniff(b'{"vs":"KERI10JSOX000020_","a":"b"}')
     """End Test"""
 
 
@@ -1473,6 +1696,22 @@ def test_serder():
     assert kind1 == Serials.json
     assert size1 == 66
     e1ss = e1s + b'extra attached at the end.'
+
+    # deserialize from memoryview over stream at offset
+    stream = bytearray(b'lead' + e1ss)
+    view = memoryview(stream)
+    kind1, vers1, size1 = serder._sniff(view, offset=4)
+    assert kind1 == Serials.json
+    assert size1 == 66
+    evt = Serder(raw=view, offset=4)
+    assert evt.ked == e1
+    assert evt.raw == e1s
+    assert isinstance(evt.raw, bytes)
+    with pytest.raises(ShortageError):
+        evt = Serder(raw=view[:size1 + 3], offset=4)
+    view.release()
+    del stream[:4]  # no lingering exports of stream
+
     ked1, knd1, vrs1, siz1 = serder._inhale(e1ss)
     assert ked1 == e1
     assert knd1 == kind1
@@ -1659,6 +1898,55 @@ def test_serder():
     assert evt2.kind == Serials.json
     knd, version, size = Deversify(evt2.ked['vs'])
     assert knd == Serials.json
+    assert evt2.dig == Serder(raw=evt2.raw).dig  # digest follows new raw
+
+    # lazy only sniffs so ked and diger are computed on first access
+    for kind in Serials:
+        evt1 = Serder(ked=dict(ked1), kind=kind)  # exhale updates vs in ked
+        evt2 = Serder(raw=memoryview(b'junk' + evt1.raw + e1ss[size1:]),
+                      offset=4, lazy=True)
+        assert evt2._ked is None
+        assert evt2._diger is None
+        assert evt2.raw == evt1.raw
+        assert evt2.kind == evt1.kind
+        assert evt2.size == evt1.size
+        assert evt2.version == evt1.version
+        assert evt2.dig == evt1.dig
+        assert evt2._ked is None  # digest does not need ked
+        assert evt2.ked == evt1.ked
+
+    # lazy does not decode body so malformed body is found on access
+    bad = e1s.replace(b'"pre"', b'"pre"}')[:size1]
+    evt2 = Serder(raw=bad, lazy=True)
+    assert evt2.size == size1
+    with pytest.raises(ValueError):
+        ked = evt2.ked
+    with pytest.raises(ValueError):
+        evt2 = Serder(raw=bad)
+
+    with pytest.raises(ShortageError):
+        evt2 = Serder(raw=e1s[:-1], lazy=True)
+
+    # size is spliced in whatever the stale vs in ked
+    ked = dict(vs=Versify(kind=Serials.cbor, size=999), pre="ABCDEFG", sn="0001")
+    evt2 = Serder(ked=ked, kind=Serials.json)
+    assert evt2.raw == (b'{"vs":"KERI10JSON000036_","pre":"ABCDEFG","sn":"0001"}')
+    assert evt2.ked["vs"] == "KERI10JSON000036_"
+    assert ked["vs"] == evt2.ked["vs"]
+
+    # vs not first field falls back on search
+    ked = dict(sn="1", vs=Versify(kind=Serials.cbor, size=0), pre="ABCDEFG")
+    evt2 = Serder(ked=ked)
+    assert evt2.raw == b'\xa3bsna1bvsqKERI10CBOR000027_cpregABCDEFG'
+    assert evt2.size == len(evt2.raw) == 0x27
+    assert Serder(raw=evt2.raw).ked == ked
+
+    # failed serialization leaves vs in ked as given
+    vs = Versify(kind=Serials.json, size=999)
+    ked = dict(vs=vs, pre="ABCDEFG", sn={"1"})  # set not json serializable
+    with pytest.raises(TypeError):
+        evt2 = Serder(ked=ked)
+    assert ked["vs"] == vs
     """Done Test """
 
 
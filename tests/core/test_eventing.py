@@ -7,6 +7,7 @@ import os
 
 import pytest
 
+import lmdb
 import pysodium
 import blake3
 from math import ceil
@@ -26,7 +27,7 @@ from keri.core.coring import SigFourDex, SigFourSizes, SigFourRawSizes
 from keri.core.coring import SigFiveDex, SigFiveSizes, SigFiveRawSizes
 from keri.core.coring import SigSizes, SigRawSizes
 from keri.core.coring import IntToB64, B64ToInt
-from keri.core.coring import SigMat, SigCounter
+from keri.core.coring import SigMat, SigCounter, SigCntDex
 from keri.core.coring import Serialage, Serials, Mimes, Vstrings
 from keri.core.coring import Versify, Deversify, Rever
 from keri.core.coring import Serder
@@ -35,9 +36,9 @@ from keri.core.coring import Ilkage, Ilks
 from keri.core.eventing import TraitDex, LastEstLoc
 from keri.core.eventing import SealDigest, SealRoot, SealEvent, SealLocation
 from keri.core.eventing import incept, rotate, interact, receipt, chit
-from keri.core.eventing import Kever, Kevery
+from keri.core.eventing import Kever, Kevery, Kevers
 
-from keri.db.dbing import dgKey, snKey, openLogger, Logger
+from keri.db.dbing import dgKey, snKey, openLogger, Logger, DatabaseError
 
 
 def test_lastestloc():
@@ -1020,6 +1021,786 @@ def test_kevery():
     """ Done Test """
 
 
+def test_kevery_cursored():
+    """
+    Test Kevery processAll in cursored mode that walks the stream with a
+    read offset and trims the stream once per batch
+    """
+    secrets = [
+                'ArwXoACJgOleVZ2PY7kXn7rA0II0mHYDhc6WrBH8fDAc',
+                'A6zz7M08-HQSFq92sJ8KJOT2cZ47x7pXFQLPB0pckB3Q',
+                'AcwFTk-wgk3ZT2buPRIbK-zxgPx-TKbaegQvPEivN90Y',
+                'Alntkt3u6dDgiQxTATr01dy8M72uuaZEf9eTdM-70Gk8',
+              ]
+
+    with openLogger("controller") as conlgr, openLogger("validator") as vallgr:
+        event_digs = [] # list of event digs in sequence
+        kes = bytearray()
+        signers = [Signer(qb64=secret) for secret in secrets]  # faster
+
+        # Event 0  Inception Transferable (nxt digest not empty)
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64)
+        event_digs.append(serder.dig)
+        siger = signers[0].sign(serder.raw, index=0)  # return siger
+        kever = Kever(serder=serder, sigers=[siger], logger=conlgr)
+        kes.extend(serder.raw)
+        kes.extend(SigCounter().qb64b)
+        kes.extend(siger.qb64b)
+
+        # Event 1 Rotation Transferable
+        serder = rotate(pre=kever.prefixer.qb64,
+                        keys=[signers[1].verfer.qb64],
+                        dig=kever.diger.qb64,
+                        nxt=Nexter(keys=[signers[2].verfer.qb64]).qb64,
+                        sn=1)
+        event_digs.append(serder.dig)
+        siger = signers[1].sign(serder.raw, index=0)  # returns siger
+        kever.update(serder=serder, sigers=[siger])
+        kes.extend(serder.raw)
+        kes.extend(SigCounter().qb64b)
+        kes.extend(siger.qb64b)
+
+        # Event 2 Interaction
+        serder = interact(pre=kever.prefixer.qb64,
+                          dig=kever.diger.qb64,
+                          sn=2)
+        event_digs.append(serder.dig)
+        siger = signers[1].sign(serder.raw, index=0)
+        kever.update(serder=serder, sigers=[siger])
+        kes.extend(serder.raw)
+        kes.extend(SigCounter().qb64b)
+        kes.extend(siger.qb64b)
+
+        pre = kever.prefixer.qb64
+        kevery = Kevery(logger=vallgr, cursored=True)
+        assert kevery.cursored
+
+        # partial last message is left in stream until more bytes arrive
+        ims = bytearray(kes[:-20])
+        kevery.processAll(ims=ims)
+        assert pre in kevery.kevers
+        assert kevery.kevers[pre].sn == 1
+        assert ims == kes[len(kes) - 20 - len(ims): -20]  # only partial remains
+        assert len(ims) < len(kes) // 3
+
+        ims.extend(kes[-20:])  # rest of partial msg arrives
+        kevery.processAll(ims=ims)
+        assert len(ims) == 0
+        assert kevery.kevers[pre].sn == kever.sn == 2
+
+        db_digs = [bytes(val).decode("utf-8") for val in kevery.logger.getKelIter(pre)]
+        assert db_digs == event_digs
+
+        # processOne with offset leaves stream untouched and returns new offset
+        ims = bytearray(kes)
+        offset = kevery.processOne(ims=ims, offset=0)  # duplicate so discarded
+        assert len(ims) == len(kes)
+        assert Serder(raw=ims[offset:]).dig == event_digs[1]
+
+    assert not os.path.exists(kevery.logger.path)
+
+    """ Done Test """
+
+
+def test_kevery_qb2():
+    """
+    Test Kevery processing of events with qb2 binary attached signatures
+    and counters
+    """
+    secrets = [
+                'ArwXoACJgOleVZ2PY7kXn7rA0II0mHYDhc6WrBH8fDAc',
+                'A6zz7M08-HQSFq92sJ8KJOT2cZ47x7pXFQLPB0pckB3Q',
+                'AcwFTk-wgk3ZT2buPRIbK-zxgPx-TKbaegQvPEivN90Y',
+              ]
+
+    with openLogger("controller") as conlgr, openLogger("validator") as vallgr:
+        event_digs = [] # list of event digs in sequence
+        kes = bytearray()
+        signers = [Signer(qb64=secret) for secret in secrets]  # faster
+
+        # Event 0  Inception qb2 counter and qb2 signature
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64)
+        event_digs.append(serder.dig)
+        siger = signers[0].sign(serder.raw, index=0)  # return siger
+        kever = Kever(serder=serder, sigers=[siger], logger=conlgr)
+        counter = SigCounter(code=SigCntDex.Base2)
+        assert counter.qb2 == b'\xf8\x10\x01'
+        kes.extend(serder.raw)
+        kes.extend(counter.qb2)
+        kes.extend(siger.qb2)
+        assert len(siger.qb2) == siger.bsize == 66
+
+        # Event 1 Rotation qb64 counter of qb2 signatures
+        serder = rotate(pre=kever.prefixer.qb64,
+                        keys=[signers[1].verfer.qb64],
+                        dig=kever.diger.qb64,
+                        nxt=Nexter(keys=[signers[2].verfer.qb64]).qb64,
+                        sn=1)
+        event_digs.append(serder.dig)
+        siger = signers[1].sign(serder.raw, index=0)  # returns siger
+        kever.update(serder=serder, sigers=[siger])
+        kes.extend(serder.raw)
+        kes.extend(SigCounter(code=SigCntDex.Base2).qb64b)
+        kes.extend(siger.qb2)
+
+        # Event 2 Interaction qb64 counter and qb64 signature
+        serder = interact(pre=kever.prefixer.qb64,
+                          dig=kever.diger.qb64,
+                          sn=2)
+        event_digs.append(serder.dig)
+        siger = signers[1].sign(serder.raw, index=0)
+        kever.update(serder=serder, sigers=[siger])
+        kes.extend(serder.raw)
+        kes.extend(SigCounter().qb64b)
+        kes.extend(siger.qb64b)
+
+        pre = kever.prefixer.qb64
+        kevery = Kevery(logger=vallgr, framed=False)
+        kevery.processAll(ims=bytearray(kes))
+        assert kevery.kevers[pre].sn == kever.sn == 2
+        db_digs = [bytes(val).decode("utf-8") for val in kevery.logger.getKelIter(pre)]
+        assert db_digs == event_digs
+
+    with openLogger("validator") as vallgr:
+        kevery = Kevery(logger=vallgr, framed=False, cursored=True)
+        ims = bytearray(kes)
+        kevery.processAll(ims=ims)
+        assert len(ims) == 0
+        assert kevery.kevers[pre].sn == 2
+
+    """ Done Test """
+
+
+def test_kevery_pipelined():
+    """
+    Test Kevery processAll in pipelined mode that parses the whole stream
+    then processes each prefix in order with prefixes in parallel
+    """
+    secrets = generateSecrets(root=b'pipelinedkeveryp', count=8)
+    signers = [Signer(qb64=secret) for secret in secrets]
+
+    with openLogger("controller") as conlgr:
+        kevers = []  # one kever per controller of 4 prefixes
+        msgs = []  # lists of messages one list per prefix
+        digs = []  # lists of event digs one list per prefix
+        for k in range(4):
+            cur, nxt = signers[2 * k], signers[2 * k + 1]
+            serder = incept(keys=[cur.verfer.qb64],
+                            nxt=Nexter(keys=[nxt.verfer.qb64]).qb64,
+                            code=CryOneDex.Blake3_256)
+            siger = cur.sign(serder.raw, index=0)
+            kever = Kever(serder=serder, sigers=[siger], logger=conlgr)
+            kevers.append(kever)
+            msgs.append([serder.raw + SigCounter().qb64b + siger.qb64b])
+            digs.append([serder.dig])
+            for sn in range(1, 4):  # interactions
+                serder = interact(pre=kever.prefixer.qb64,
+                                  dig=kever.diger.qb64,
+                                  sn=sn)
+                siger = cur.sign(serder.raw, index=0)
+                kever.update(serder=serder, sigers=[siger])
+                msgs[k].append(serder.raw + SigCounter().qb64b + siger.qb64b)
+                digs[k].append(serder.dig)
+
+        # bad sig on sn 2 of prefix 3 drops rest of its lane only
+        bad = bytearray(msgs[3][2])
+        bad[-2:] = b'AA' if bad[-2:] != b'AA' else b'BB'
+        msgs[3][2] = bytes(bad)
+
+        # interleave prefixes in stream
+        kes = bytearray()
+        for sn in range(4):
+            for k in range(4):
+                kes.extend(msgs[k][sn])
+
+    with openLogger("validator") as vallgr:
+        kevery = Kevery(logger=vallgr, framed=False, pipelined=True, workers=4)
+        assert kevery.pipelined
+        ims = bytearray(kes[:-10])  # partial last message left in stream
+        kevery.processAll(ims=ims)
+        assert ims == kes[-len(msgs[3][3]):-10]
+        for k in range(3):
+            pre = kevers[k].prefixer.qb64
+            assert kevery.kevers[pre].sn == 3
+            assert [bytes(dig).decode("utf-8")
+                    for dig in vallgr.getKelIter(pre)] == digs[k]
+        pre = kevers[3].prefixer.qb64
+        assert kevery.kevers[pre].sn == 1  # bad sig dropped rest of lane
+        assert [bytes(dig).decode("utf-8")
+                for dig in vallgr.getKelIter(pre)] == digs[3][:2]
+        assert len(kevery.cues) == 3 * 4 + 2
+        assert kevery._pool is not None
+        kevery.close()
+        assert kevery._pool is None
+        kevery.close()  # idempotent
+
+    """ Done Test """
+
+
+def test_kevery_batched():
+    """
+    Test Kevery processAll with Logger group commit of many events
+    """
+    secrets = generateSecrets(root=b'batchedkeverybat', count=4)
+    signers = [Signer(qb64=secret) for secret in secrets]
+
+    with openLogger("controller") as conlgr:
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64)
+        siger = signers[0].sign(serder.raw, index=0)
+        kever = Kever(serder=serder, sigers=[siger], logger=conlgr)
+        kes = bytearray(serder.raw + SigCounter().qb64b + siger.qb64b)
+        msgs = [bytes(kes)]
+        digs = [serder.dig]
+        for sn in range(1, 8):
+            if sn in (2, 5):  # rotations
+                cur = signers[1 if sn == 2 else 2]
+                nxt = signers[2 if sn == 2 else 3]
+                serder = rotate(pre=kever.prefixer.qb64,
+                                keys=[cur.verfer.qb64],
+                                dig=kever.diger.qb64,
+                                nxt=Nexter(keys=[nxt.verfer.qb64]).qb64,
+                                sn=sn)
+            else:
+                serder = interact(pre=kever.prefixer.qb64,
+                                  dig=kever.diger.qb64,
+                                  sn=sn)
+            siger = signers[0 if sn < 2 else 1 if sn < 5 else 2].sign(serder.raw,
+                                                                       index=0)
+            kever.update(serder=serder, sigers=[siger])
+            msgs.append(serder.raw + SigCounter().qb64b + siger.qb64b)
+            kes.extend(msgs[-1])
+            digs.append(serder.dig)
+        pre = kever.prefixer.qb64
+
+    for cursored in (False, True):
+        vallgr = Logger(name="validator", temp=True, batchSize=3, batchTime=60.0)
+        try:
+            kevery = Kevery(logger=vallgr, framed=False, cursored=cursored)
+            kevery.processAll(ims=bytearray(kes))
+            assert vallgr.batch is None
+            assert vallgr.commits == 3  # after 3 and 6 events and at end
+            assert kevery.kevers[pre].sn == 7
+            assert [bytes(dig).decode("utf-8")
+                    for dig in vallgr.getKelIter(pre)] == digs
+            assert len(kevery.cues) == 8
+        finally:
+            vallgr.clearDirPath()
+
+    def abort():  # batch commit fails
+        vallgr.batch.abort()
+        raise lmdb.MapFullError("full")
+
+    # aborted batch reloads Kevers it touched from persisted key state
+    vallgr = Logger(name="validator", temp=True, batchSize=100, batchTime=60.0)
+    try:
+        kevery = Kevery(logger=vallgr, framed=False)
+        vallgr._commit = abort
+        with pytest.raises(lmdb.MapFullError):
+            kevery.processAll(ims=bytearray(b"".join(msgs[:3])))
+        assert pre not in kevery.kevers  # inception never committed
+        assert list(vallgr.getKelIter(pre)) == []
+        del vallgr._commit
+
+        kevery.processAll(ims=bytearray(b"".join(msgs[:3])))
+        assert kevery.kevers[pre].sn == 2
+        vallgr._commit = abort
+        with pytest.raises(lmdb.MapFullError):
+            kevery.processAll(ims=bytearray(b"".join(msgs[3:])))
+        assert kevery._touched == set()
+        assert kevery.kevers[pre].sn == 2  # not ahead of KEL
+        assert [bytes(dig).decode("utf-8")
+                for dig in vallgr.getKelIter(pre)] == digs[:3]
+        del vallgr._commit
+
+        kevery.processAll(ims=bytearray(b"".join(msgs[3:])))
+        assert kevery.kevers[pre].sn == 7
+        assert [bytes(dig).decode("utf-8")
+                for dig in vallgr.getKelIter(pre)] == digs
+    finally:
+        vallgr.clearDirPath()
+
+    """ Done Test """
+
+
+def test_kevery_batched_growth():
+    """
+    Test Kevery processAll with group commit batch larger than Logger map
+    """
+    secrets = generateSecrets(root=b'overflowbatchmap', count=2)
+    signers = [Signer(qb64=secret) for secret in secrets]
+
+    with openLogger("controller") as conlgr:
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64)
+        siger = signers[0].sign(serder.raw, index=0)
+        kever = Kever(serder=serder, sigers=[siger], logger=conlgr)
+        kes = bytearray(serder.raw + SigCounter().qb64b + siger.qb64b)
+        for sn in range(1, 400):
+            serder = interact(pre=kever.prefixer.qb64, dig=kever.diger.qb64,
+                              sn=sn)
+            siger = signers[0].sign(serder.raw, index=0)
+            kever.update(serder=serder, sigers=[siger])
+            kes.extend(serder.raw + SigCounter().qb64b + siger.qb64b)
+        pre = kever.prefixer.qb64
+
+    vallgr = Logger(name="validator", temp=True, mapSize=256 * 1024,
+                    batchSize=10000, batchTime=600.0)
+    try:
+        kevery = Kevery(logger=vallgr, framed=False)
+        ims = bytearray(kes)
+        kevery.processAll(ims=ims)
+        assert not ims
+        assert vallgr.grows > 0
+        assert kevery.kevers[pre].sn == 399
+        assert len([dig for dig in vallgr.getKelIter(pre)]) == 400
+    finally:
+        vallgr.clearDirPath()
+
+    # batch too full to commit is lost and its Kevers dropped
+    vallgr = Logger(name="validator", temp=True, mapSize=256 * 1024,
+                    batchSize=10000, batchTime=600.0)
+    try:
+        vallgr._crowded = lambda: False  # no early commit
+        kevery = Kevery(logger=vallgr, framed=False)
+        with pytest.raises(DatabaseError):
+            kevery.processAll(ims=bytearray(kes))
+        assert pre not in kevery.kevers
+        assert list(vallgr.getKelIter(pre)) == []
+    finally:
+        vallgr.clearDirPath()
+
+    """ Done Test """
+
+
+def test_kevery_sweep():
+    """
+    Test Kevery processAll sweeps expired escrows at most once per period
+    """
+    pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+    raw = b'{"vs":"KERI10JSON000000_","pre":"","sn":"0","ilk":"ixn"}'
+    old = b'2020-08-22T17:50:09.988921+00:00'
+
+    lgr = Logger(name="sweep", temp=True)
+    try:
+        for sn in (3, 4, 5):
+            lgr.logEvt(pre=pre, dig=b'E%043d' % sn, sn=sn, raw=raw,
+                       sigs=[b'sig'], dts=old, idx=lgr.ooes)
+        kevery = Kevery(logger=lgr, sweepPeriod=3600.0)
+        assert kevery.sweepPeriod == 3600.0
+        assert Kevery.SweepPeriod == 0.0  # opt in since sweeps delete
+        assert Kevery(logger=lgr).sweepPeriod == Kevery.SweepPeriod
+        kevery.processAll(ims=bytearray())  # first call sweeps
+        assert lgr.getOoes(snKey(pre, 3)) == []
+        assert lgr.getEvt(dgKey(pre, b'E%043d' % 3)) is None
+
+        lgr.logEvt(pre=pre, dig=b'E%043d' % 6, sn=6, raw=raw, sigs=[b'sig'],
+                   dts=old, idx=lgr.ooes)
+        kevery.processAll(ims=bytearray())  # within period so no sweep
+        assert lgr.getOoes(snKey(pre, 6)) == [b'E%043d' % 6]
+        assert kevery.sweepEscrows() == 0
+        assert kevery.sweepEscrows(force=True) == 1
+        assert lgr.getOoes(snKey(pre, 6)) == []
+
+        lgr.logEvt(pre=pre, dig=b'E%043d' % 7, sn=7, raw=raw, sigs=[b'sig'],
+                   dts=old, idx=lgr.ooes)
+        kevery = Kevery(logger=lgr)  # never sweeps by default
+        kevery.processAll(ims=bytearray())
+        assert lgr.getOoes(snKey(pre, 7)) == [b'E%043d' % 7]
+    finally:
+        lgr.clearDirPath()
+
+    """ Done Test """
+
+
+def test_kevery_escrow():
+    """
+    Test Kevery logs out of order and likely duplicitous events to escrows
+    """
+    secrets = [
+                'ArwXoACJgOleVZ2PY7kXn7rA0II0mHYDhc6WrBH8fDAc',
+                'A6zz7M08-HQSFq92sJ8KJOT2cZ47x7pXFQLPB0pckB3Q',
+              ]
+    signers = [Signer(qb64=secret) for secret in secrets]
+
+    with openLogger("controller") as conlgr, openLogger("validator") as vallgr:
+        icp = incept(keys=[signers[0].verfer.qb64],
+                     nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64)
+        kever = Kever(serder=icp,
+                      sigers=[signers[0].sign(icp.raw, index=0)],
+                      logger=conlgr)
+        pre = kever.prefixer.qb64b
+        ixn = interact(pre=kever.prefixer.qb64, dig=kever.diger.qb64, sn=1)
+        dup = interact(pre=kever.prefixer.qb64, dig=kever.diger.qb64, sn=1,
+                       data=[dict(note="fork")])
+        ooo = interact(pre=kever.prefixer.qb64, dig=ixn.dig, sn=3)
+
+        msgs = bytearray()
+        for serder in (icp, ixn, dup, ooo):
+            msgs.extend(serder.raw)
+            msgs.extend(SigCounter().qb64b)
+            msgs.extend(signers[0].sign(serder.raw, index=0).qb64b)
+
+        kevery = Kevery(logger=vallgr)
+        kevery.processAll(ims=msgs)
+        assert kevery.kevers[kever.prefixer.qb64].sn == 1
+
+        assert vallgr.getKes(snKey(pre, 1)) == [ixn.digb]
+        assert vallgr.getLdes(snKey(pre, 1)) == [dup.digb]
+        assert vallgr.getOoes(snKey(pre, 3)) == [ooo.digb]
+        assert [val for key, val in vallgr.getEscItemIter("ooes")] == \
+               [dgKey(pre, ooo.digb) + b'.3']
+        assert [val for key, val in vallgr.getEscItemIter("ldes")] == \
+               [dgKey(pre, dup.digb) + b'.1']
+        for serder in (dup, ooo):  # escrowed event logs written with index
+            dgkey = dgKey(pre, serder.digb)
+            assert bytes(vallgr.getEvt(dgkey)) == serder.raw
+            assert vallgr.getDts(dgkey) is not None
+            assert vallgr.cntSigs(dgkey) == 1
+
+    assert not os.path.exists(vallgr.path)
+    """ Done Test """
+
+
+def test_kevery_outoforder():
+    """
+    Test Kevery replays out of order escrowed events once their predecessor
+    is accepted
+    """
+    secrets = generateSecrets(root=b'outoforderevents', count=2)
+    signers = [Signer(qb64=secret) for secret in secrets]
+
+    with openLogger("controller") as conlgr, openLogger("validator") as vallgr:
+        icp = incept(keys=[signers[0].verfer.qb64],
+                     nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64)
+        kever = Kever(serder=icp,
+                      sigers=[signers[0].sign(icp.raw, index=0)],
+                      logger=conlgr)
+        pre = kever.prefixer.qb64
+        serders = [icp]
+        for sn in range(1, 5):
+            serder = interact(pre=pre, dig=kever.diger.qb64, sn=sn)
+            kever.update(serder=serder,
+                         sigers=[signers[0].sign(serder.raw, index=0)])
+            serders.append(serder)
+        bad = interact(pre=pre, dig=kever.diger.qb64, sn=5)  # wrong signer
+
+        msgs = bytearray()
+        for serder in serders[:0:-1]:  # sn 4, 3, 2, 1 before inception
+            msgs.extend(serder.raw + SigCounter().qb64b +
+                        signers[0].sign(serder.raw, index=0).qb64b)
+        msgs.extend(bad.raw + SigCounter().qb64b +
+                    signers[1].sign(bad.raw, index=0).qb64b)
+
+        kevery = Kevery(logger=vallgr)
+        kevery.processAll(ims=bytearray(msgs))
+        assert pre not in kevery.kevers
+        for sn in range(1, 6):
+            assert len(vallgr.getOoes(snKey(pre, sn))) == 1
+
+        kevery.processAll(ims=bytearray(icp.raw + SigCounter().qb64b +
+                                        signers[0].sign(icp.raw, index=0).qb64b))
+        assert kevery.kevers[pre].sn == 4
+        assert [bytes(dig) for dig in vallgr.getKelIter(pre)] == \
+               [serder.digb for serder in serders]
+        assert len(kevery.cues) == 5
+        for sn in range(1, 6):
+            assert vallgr.getOoes(snKey(pre, sn)) == []
+        assert not vallgr.hasEvt(dgKey(pre, bad.digb))  # invalid discarded
+        assert vallgr.getSigs(dgKey(pre, bad.digb)) == []
+
+        # resend of discarded event with valid signature is accepted
+        kevery.processAll(ims=bytearray(bad.raw + SigCounter().qb64b +
+                                        signers[0].sign(bad.raw, index=0).qb64b))
+        assert kevery.kevers[pre].sn == 5
+
+    """ Done Test """
+
+
+def test_kevery_receipt_escrows():
+    """
+    Test Kevery promotes escrowed receipts once receipted event and validator
+    establishment event are accepted
+    """
+    secrets = generateSecrets(root=b'receiptescrowsre', count=5)
+    coeSigners = [Signer(qb64=secret) for secret in secrets[:2]]
+    valSigners = [Signer(qb64=secret) for secret in secrets[2:4]]
+    witSigner = Signer(qb64=secrets[4], transferable=False)
+
+    coeIcp = incept(keys=[coeSigners[0].verfer.qb64],
+                    nxt=Nexter(keys=[coeSigners[1].verfer.qb64]).qb64)
+    valIcp = incept(keys=[valSigners[0].verfer.qb64],
+                    nxt=Nexter(keys=[valSigners[1].verfer.qb64]).qb64)
+    coepre, valpre = coeIcp.ked["pre"], valIcp.ked["pre"]
+    dgkey = dgKey(coepre, coeIcp.dig)
+
+    # receipts arrive before events
+    rct = receipt(pre=coepre, sn=0, dig=coeIcp.dig)
+    couplet = witSigner.verfer.qb64b + witSigner.sign(ser=coeIcp.raw).qb64b
+    bad = witSigner.verfer.qb64b + witSigner.sign(ser=valIcp.raw).qb64b
+    rmsg = bytearray(rct.raw + CryCounter(count=2).qb64b + couplet + bad)
+    vrc = chit(pre=coepre, sn=0, dig=coeIcp.dig,
+               seal=SealEvent(pre=valpre, dig=valIcp.dig))
+    siger = valSigners[0].sign(ser=coeIcp.raw, index=0)
+    triplet = valpre.encode("utf-8") + valIcp.digb + siger.qb64b
+    vmsg = bytearray(vrc.raw + SigCounter(count=1).qb64b + siger.qb64b)
+
+    with openLogger("validator") as lgr:
+        kevery = Kevery(logger=lgr)
+        kevery.processAll(ims=rmsg)
+        kevery.processAll(ims=vmsg)
+        assert [bytes(val) for val in lgr.getUres(dgkey)] == sorted([couplet, bad])
+        assert [bytes(val) for val in lgr.getVres(dgkey)] == [triplet]
+        assert [bytes(val) for val in lgr.getVrvs(valpre)] == [dgkey]
+
+        # receipted event promotes verified couplets but validator unknown
+        kevery.processAll(ims=bytearray(coeIcp.raw + SigCounter().qb64b +
+                          coeSigners[0].sign(coeIcp.raw, index=0).qb64b))
+        assert [bytes(val) for val in lgr.getRcts(dgkey)] == [couplet]
+        assert lgr.getUres(dgkey) == []
+        assert [bytes(val) for val in lgr.getVres(dgkey)] == [triplet]
+        assert lgr.getVrcs(dgkey) == []
+
+        # validator inception promotes its escrowed triplets by index
+        kevery.processAll(ims=bytearray(valIcp.raw + SigCounter().qb64b +
+                          valSigners[0].sign(valIcp.raw, index=0).qb64b))
+        assert [bytes(val) for val in lgr.getVrcs(dgkey)] == [triplet]
+        assert lgr.getVres(dgkey) == []
+        assert lgr.getVrvs(valpre) == []
+
+    # triplet from validator rotation escrowed out of order is kept not stale
+    nxtSigner = Signer(qb64=generateSecrets(root=b'receiptescrowsnx', count=1)[0])
+    valIxn = interact(pre=valpre, dig=valIcp.dig, sn=1)
+    valRot = rotate(pre=valpre, keys=[valSigners[1].verfer.qb64],
+                    dig=valIxn.dig, nxt=Nexter(keys=[nxtSigner.verfer.qb64]).qb64,
+                    sn=2)
+    vrc = chit(pre=coepre, sn=0, dig=coeIcp.dig,
+               seal=SealEvent(pre=valpre, dig=valRot.dig))
+    siger = valSigners[1].sign(ser=coeIcp.raw, index=0)
+    triplet = valpre.encode("utf-8") + valRot.digb + siger.qb64b
+    coeIxn = interact(pre=coepre, dig=coeIcp.dig, sn=1)
+    stale = chit(pre=coepre, sn=1, dig=coeIxn.dig,
+                 seal=SealEvent(pre=valpre, dig=valIcp.dig))
+    ssiger = valSigners[0].sign(ser=coeIxn.raw, index=0)
+    sdgkey = dgKey(coepre, coeIxn.dig)
+
+    with openLogger("validator") as lgr:
+        kevery = Kevery(logger=lgr)
+        kevery.processAll(ims=bytearray(valIcp.raw + SigCounter().qb64b +
+                          valSigners[0].sign(valIcp.raw, index=0).qb64b))
+        kevery.processAll(ims=bytearray(valRot.raw + SigCounter().qb64b +
+                          valSigners[1].sign(valRot.raw, index=0).qb64b))
+        assert kevery.kevers[valpre].sn == 0  # rotation escrowed out of order
+        kevery.processAll(ims=bytearray(vrc.raw + SigCounter(count=1).qb64b +
+                                        siger.qb64b))
+        assert [bytes(val) for val in lgr.getVres(dgkey)] == [triplet]
+
+        kevery.processAll(ims=bytearray(coeIcp.raw + SigCounter().qb64b +
+                          coeSigners[0].sign(coeIcp.raw, index=0).qb64b))
+        assert [bytes(val) for val in lgr.getVres(dgkey)] == [triplet]
+        assert lgr.getVrcs(dgkey) == []
+        assert [bytes(val) for val in lgr.getVrvs(valpre)] == [dgkey]
+
+        # interaction accepted so rotation replayed and triplet promoted
+        kevery.processAll(ims=bytearray(valIxn.raw + SigCounter().qb64b +
+                          valSigners[0].sign(valIxn.raw, index=0).qb64b))
+        assert kevery.kevers[valpre].sn == 2
+        assert [bytes(val) for val in lgr.getVrcs(dgkey)] == [triplet]
+        assert lgr.getVres(dgkey) == []
+        assert lgr.getVrvs(valpre) == []
+
+        # triplet from accepted but superseded inception is dropped as stale
+        kevery.processAll(ims=bytearray(stale.raw + SigCounter(count=1).qb64b +
+                                        ssiger.qb64b))
+        assert len(lgr.getVres(sdgkey)) == 1
+        kevery.processAll(ims=bytearray(coeIxn.raw + SigCounter().qb64b +
+                          coeSigners[0].sign(coeIxn.raw, index=0).qb64b))
+        assert lgr.getVres(sdgkey) == []
+        assert lgr.getVrcs(sdgkey) == []
+        assert lgr.getVrvs(valpre) == []
+
+    """ Done Test """
+
+
+def test_kevery_pipelined_receipt_escrows():
+    """
+    Test Kevery in pipelined mode promotes escrowed triplets of an event
+    accepted in one lane with the key state of a validator rotated in another
+    """
+    secrets = generateSecrets(root=b'pipelinedreceipt', count=5)
+    coeSigner = Signer(qb64=secrets[0])
+    valSigners = [Signer(qb64=secret) for secret in secrets[1:4]]
+
+    coeIcp = incept(keys=[coeSigner.verfer.qb64],
+                    nxt=Nexter(keys=[Signer(qb64=secrets[4]).verfer.qb64]).qb64)
+    valIcp = incept(keys=[valSigners[0].verfer.qb64],
+                    nxt=Nexter(keys=[valSigners[1].verfer.qb64]).qb64)
+    coepre, valpre = coeIcp.ked["pre"], valIcp.ked["pre"]
+    valRot = rotate(pre=valpre, keys=[valSigners[1].verfer.qb64],
+                    dig=valIcp.dig,
+                    nxt=Nexter(keys=[valSigners[2].verfer.qb64]).qb64)
+    dgkey = dgKey(coepre, coeIcp.dig)
+
+    # triplets from validator rotation and from its superseded inception
+    vrc = chit(pre=coepre, sn=0, dig=coeIcp.dig,
+               seal=SealEvent(pre=valpre, dig=valRot.dig))
+    siger = valSigners[1].sign(ser=coeIcp.raw, index=0)
+    triplet = valpre.encode("utf-8") + valRot.digb + siger.qb64b
+    svrc = chit(pre=coepre, sn=0, dig=coeIcp.dig,
+                seal=SealEvent(pre=valpre, dig=valIcp.dig))
+    ssiger = valSigners[0].sign(ser=coeIcp.raw, index=0)
+    stale = valpre.encode("utf-8") + valIcp.digb + ssiger.qb64b
+
+    with openLogger("validator") as lgr:
+        kevery = Kevery(logger=lgr, pipelined=True, workers=2)
+        kevery.processAll(ims=bytearray(valIcp.raw + SigCounter().qb64b +
+                          valSigners[0].sign(valIcp.raw, index=0).qb64b))
+        kevery.processAll(ims=bytearray(vrc.raw + SigCounter(count=1).qb64b +
+                                        siger.qb64b +
+                                        svrc.raw + SigCounter(count=1).qb64b +
+                                        ssiger.qb64b))
+        assert [bytes(val) for val in lgr.getVres(dgkey)] == sorted([triplet,
+                                                                     stale])
+
+        # rotation and receipted event in one stream run in parallel lanes
+        kevery.processAll(ims=bytearray(valRot.raw + SigCounter().qb64b +
+                          valSigners[1].sign(valRot.raw, index=0).qb64b +
+                          coeIcp.raw + SigCounter().qb64b +
+                          coeSigner.sign(coeIcp.raw, index=0).qb64b))
+        assert kevery.kevers[valpre].sn == 1
+        assert kevery.kevers[coepre].sn == 0
+        assert [bytes(val) for val in lgr.getVrcs(dgkey)] == [triplet]
+        assert lgr.getVres(dgkey) == []
+        assert lgr.getVrvs(valpre) == []
+        assert kevery._deferred is None
+        kevery.close()
+
+    """ Done Test """
+
+
+def test_kever_state():
+    """
+    Test Kever key state persisted with each event and Kevers restored from it
+    """
+    secrets = generateSecrets(root=b'keverstatekevers', count=3)
+    signers = [Signer(qb64=secret) for secret in secrets]
+
+    lgr = Logger(name="state", temp=True)
+    try:
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64,
+                        cnfg=[dict(trait=TraitDex.EstOnly)])
+        kever = Kever(serder=serder, sigers=[signers[0].sign(serder.raw, index=0)],
+                      logger=lgr)
+        pre = kever.prefixer.qb64
+        assert bytes(lgr.getState(pre)) == kever.state()
+        serder = rotate(pre=pre, keys=[signers[1].verfer.qb64],
+                        dig=kever.diger.qb64,
+                        nxt=Nexter(keys=[signers[2].verfer.qb64]).qb64, sn=1)
+        kever.update(serder=serder, sigers=[signers[1].sign(serder.raw, index=0)])
+        assert bytes(lgr.getState(pre)) == kever.state()
+
+        restored = Kever.fromState(lgr.getState(pre), logger=lgr)
+        for attr in ("version", "sn", "ilk", "sith", "toad", "wits", "cnfg",
+                     "estOnly", "nonTrans", "lastEst"):
+            assert getattr(restored, attr) == getattr(kever, attr)
+        assert restored.prefixer.qb64 == pre
+        assert restored.diger.qb64 == kever.diger.qb64
+        assert restored.nexter.qb64 == kever.nexter.qb64
+        assert [verfer.qb64 for verfer in restored.verfers] == \
+               [verfer.qb64 for verfer in kever.verfers]
+        assert restored.state() == kever.state()
+
+        # restored kever accepts next event without replay
+        kevery = Kevery(logger=lgr)
+        assert kevery.loadKevers() == 1
+        serder = rotate(pre=pre, keys=[signers[2].verfer.qb64],
+                        dig=kever.diger.qb64, sn=2)
+        kevery.kevers[pre].update(serder=serder,
+                                  sigers=[signers[2].sign(serder.raw, index=0)])
+        assert kevery.kevers[pre].sn == 2
+        assert kevery.kevers[pre].nonTrans
+        assert Kever.fromState(lgr.getState(pre), logger=lgr).lastEst.sn == 2
+
+        with pytest.raises(ValidationError):
+            Kever.fromState(kever.state().replace(b'"v":1', b'"v":9'),
+                            logger=lgr)
+        with pytest.raises(ValidationError):
+            Kever.fromState(b'{"v":1}', logger=lgr)
+    finally:
+        lgr.clearDirPath()
+
+    """ Done Test """
+
+
+def test_kevers():
+    """
+    Test Kevers mapping loads Kevers from key state and evicts under budget
+    """
+    secrets = generateSecrets(root=b'keversmappingkev', count=8)
+    signers = [Signer(qb64=secret) for secret in secrets]
+
+    with openLogger("controller") as conlgr:
+        kes = bytearray()
+        pres = []
+        for i in range(4):  # four single event KELs
+            serder = incept(keys=[signers[2 * i].verfer.qb64],
+                            nxt=Nexter(keys=[signers[2 * i + 1].verfer.qb64]).qb64)
+            siger = signers[2 * i].sign(serder.raw, index=0)
+            kes.extend(serder.raw + SigCounter().qb64b + siger.qb64b)
+            pres.append(serder.ked["pre"])
+
+    lgr = Logger(name="kevers", temp=True)
+    try:
+        kevers = Kevers(logger=lgr, size=2)
+        kevery = Kevery(kevers=kevers, logger=lgr, framed=False)
+        kevery.processAll(ims=kes)
+        assert kevers.resident == 2
+        assert kevers.evictions == 2
+        assert len(kevers) == 4
+        assert sorted(kevers) == sorted(pres)
+        assert pres[0] in kevers and "Enotaprefix" not in kevers
+
+        assert kevers[pres[3]].sn == 0  # resident
+        assert (kevers.hits, kevers.misses) == (1, 0)
+        kever = kevers[pres[0]]  # loaded and evicts least recent
+        assert kever.prefixer.qb64 == pres[0]
+        assert (kevers.hits, kevers.misses) == (1, 1)
+        assert kevers.resident == 2 and kevers.evictions == 3
+        assert kevers.rate == 0.5
+        assert kevers.nbytes == 2 * len(kever.state()) * Kevers.StateFactor
+
+        # update of loaded kever persists its state for next load
+        serder = interact(pre=pres[0], dig=kever.diger.qb64, sn=1)
+        kevery.processAll(ims=bytearray(serder.raw + SigCounter().qb64b +
+                                        signers[0].sign(serder.raw, index=0).qb64b))
+        assert kevers[pres[0]].sn == 1
+        kevers.evict()
+        assert kevers.resident == 0 and kevers.nbytes == 0
+        assert kevers[pres[0]].sn == 1
+
+        # byte budget of three kevers
+        assert kevers.resident == 1
+        kevers = Kevers(logger=lgr, size=None, maxBytes=3 * kevers.nbytes)
+        for pre in pres:
+            assert kevers[pre].prefixer.qb64 == pre
+        assert kevers.resident == 3
+        assert kevers.nbytes <= kevers.maxBytes
+
+        del kevers[pres[1]]
+        assert pres[1] not in kevers and len(kevers) == 3
+        with pytest.raises(KeyError):
+            kevers[pres[1]]
+        with pytest.raises(KeyError):
+            del kevers[pres[1]]
+    finally:
+        lgr.clearDirPath()
+
+    """ Done Test """
+
+
 def test_multisig_digprefix():
     """
     Test multisig with self-addressing (digest) pre
@@ -7,15 +7,17 @@ import pytest
 
 import os
 import json
+import threading
 
 import lmdb
 
 from keri.db.dbing import clearDatabaserDir, openDatabaser, openLogger
-from keri.db.dbing import dgKey, snKey, Databaser, Logger
+from keri.db.dbing import dgKey, snKey, escKey, Databaser, Logger
+from keri.db.dbing import DatabaseError, Durabilities, convertLogger
 
 from keri.core.coring import Signer, Nexter, Prefixer, Serder
 from keri.core.coring import CryCntDex, CryOneDex, CryTwoDex, CryFourDex
-from keri.core.coring import Serials, Vstrings, Versify
+from keri.core.coring import Serials, Vstrings, Versify, generateSecrets
 
 from keri.core.eventing import incept, rotate, interact, Kever, Kevery
 
@@ -211,6 +213,44 @@ def test_databaser():
         allvals = vals0 + vals1 + vals2
         assert vals == allvals
 
+        # sn bounds and reverse with gap at sn 3
+        vals = [bytes(val) for val in dber.getIoValsAnyPreIter(db, pre, fromSn=2)]
+        assert vals == vals1 + vals2
+        vals = [bytes(val) for val in dber.getIoValsAnyPreIter(db, pre, toSn=3)]
+        assert vals == vals0 + vals1
+        vals = [bytes(val) for val in dber.getIoValsAnyPreIter(db, pre, reverse=True)]
+        assert vals == allvals[::-1]
+        vals = [bytes(val) for val in dber.getIoValsAnyPreIter(db, pre, toSn=2,
+                                                                reverse=True)]
+        assert vals == (vals0 + vals1)[::-1]
+        vals = [bytes(val) for val in dber.getIoValsAnyPreIter(db, pre, fromSn=5)]
+        assert vals == []
+
+        # gapless iters stop at gap
+        assert [bytes(val) for val in dber.getIoValsAllPreIter(db, pre)] == []
+        vals = [bytes(val) for val in dber.getIoValsAllPreIter(db, pre, fromSn=1)]
+        assert vals == vals0 + vals1
+        vals = [bytes(val) for val in dber.getIoValsAllPreIter(db, pre, reverse=True)]
+        assert vals == vals2[::-1]
+        vals = [bytes(val) for val in dber.getIoValsAllPreIter(db, pre, toSn=2,
+                                                                reverse=True)]
+        assert vals == (vals0 + vals1)[::-1]
+        vals = [bytes(val) for val in dber.getIoValsLastAllPreIter(db, pre,
+                                                                    fromSn=1)]
+        assert vals == [vals0[-1], vals1[-1]]
+        vals = [bytes(val) for val in dber.getIoValsLastAllPreIter(db, pre,
+                                                                    fromSn=1,
+                                                                    toSn=1)]
+        assert vals == [vals0[-1]]
+        vals = [bytes(val) for val in dber.getIoValsLastAllPreIter(db, pre,
+                                                                    toSn=2,
+                                                                    reverse=True)]
+        assert vals == [vals1[-1], vals0[-1]]
+        # other pres on both sides are not included
+        assert [bytes(val) for val in dber.getIoValsLastAllPreIter(db,
+                b'B4ejWzwQPYGGwTmuupUhPx5_yZ-Wk1xEHHzq7K0gzhcc', reverse=True)] == \
+               [b"bird", b"paul", b"beta"]
+
 
     assert not os.path.exists(dber.path)
 
@@ -626,6 +666,8 @@ def test_fetchkeldel():
         vals = [bytes(val) for val in lgr.getKelIter(preb)]
         allvals = vals0 + vals1 + vals2
         assert vals == allvals
+        vals = [bytes(val) for val in lgr.getKelIter(preb, fromSn=1, toSn=1)]
+        assert vals == vals1
 
         # test getKelEstIter
         preb = 'B4ejhccWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x'.encode("utf-8")
@@ -651,6 +693,9 @@ def test_fetchkeldel():
         vals = [bytes(val) for val in lgr.getKelEstIter(preb)]
         lastvals = [vals0[-1], vals1[-1], vals2[-1]]
         assert vals == lastvals
+        vals = [bytes(val) for val in lgr.getKelEstIter(preb, fromSn=1,
+                                                         reverse=True)]
+        assert vals == lastvals[:0:-1]
 
 
         # test getDelIter
@@ -677,6 +722,10 @@ def test_fetchkeldel():
         vals = [bytes(val) for val in lgr.getDelIter(preb)]
         allvals = vals0 + vals1 + vals2
         assert vals == allvals
+        vals = [bytes(val) for val in lgr.getDelIter(preb, fromSn=2, toSn=5)]
+        assert vals == vals1 + vals2
+        vals = [bytes(val) for val in lgr.getDelIter(preb, reverse=True)]
+        assert vals == allvals[::-1]
 
     assert not os.path.exists(lgr.path)
     """ End Test """
@@ -753,5 +802,580 @@ def test_uselogger():
 
     """ End Test """
 
+
+def test_evtfilter():
+    """
+    Test Logger .evtFilter rebuilt on init and updated by putEvt and hasEvt
+    """
+    import tempfile
+    import shutil
+
+    headDirPath = tempfile.mkdtemp(prefix="keri_lmdb_", suffix="_test", dir="/tmp")
+    try:
+        lgr = Logger(headDirPath=headDirPath, name="filter")
+        assert lgr.evtFilter is None
+        pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+        keys = [dgKey(pre, b'E%043d' % i) for i in range(50)]
+        for key in keys[:25]:
+            assert lgr.putEvt(key, b'event') == True
+        assert lgr.hasEvt(keys[0])
+        assert not lgr.hasEvt(keys[-1])
+        lgr.env.close()
+
+        # reopen rebuilds filter from .evts
+        lgr = Logger(headDirPath=headDirPath, name="filter", bloom=16)
+        evtFilter = lgr.evtFilter
+        assert evtFilter.capacity == 50  # twice existing count
+        assert evtFilter.count == 25
+        assert all(bytes(key) in evtFilter for key in keys[:25])
+        hits = evtFilter.hits
+
+        for key in keys[25:]:
+            assert lgr.putEvt(key, b'event') == True
+        assert evtFilter.count == 50
+        assert all(lgr.hasEvt(key) for key in keys)
+        assert evtFilter.hits == hits + 50
+
+        absent = [dgKey(pre, b'F%043d' % i) for i in range(1000)]
+        assert not any(lgr.hasEvt(key) for key in absent)
+        assert evtFilter.misses + evtFilter.falses == 1000
+        assert evtFilter.observed < 0.02
+        assert 0.0 < evtFilter.rate < 0.002
+        assert evtFilter.nbytes == evtFilter.m // 8 < 128
+        lgr.env.close()
+    finally:
+        shutil.rmtree(headDirPath)
+
+    """ End Test """
+
+
+def test_iovals_dedup():
+    """
+    Test putIoVals and addIoVal duplicate checks with many dups at key
+    """
+    with openDatabaser() as dber:
+        db = dber.env.open_db(key=b'rcts.', dupsort=True)
+        key = b'A'
+        vals = [b'couplet%04d' % i for i in range(300)]
+        assert dber.putIoVals(db, key, vals) == True
+        assert dber.cntIoVals(db, key) == 300
+        assert dber.addIoVal(db, key, vals[150]) == False
+        assert dber.addIoVal(db, key, b'couplet%04d' % 150 + b'x') == True
+        assert dber.addIoVal(db, key, b'couplet') == True  # prefix of dups
+        assert dber.cntIoVals(db, key) == 302
+
+        # repeats within vals added once and order preserved
+        assert dber.putIoVals(db, key, [b'new1', vals[0], b'new0', b'new1']) == True
+        assert dber.putIoVals(db, key, [vals[299], b'new0']) == False
+        assert dber.cntIoVals(db, key) == 304
+        assert [bytes(val) for val in dber.getIoVals(db, key)[-4:]] == \
+               [b'couplet%04d' % 150 + b'x', b'couplet', b'new1', b'new0']
+        assert bytes(dber.getIoValsLast(db, key)) == b'new0'
+
+        # delete one dup and later adds stay in insertion order
+        assert dber.delIoVal(db, key, b'couplet') == True
+        assert dber.delIoVal(db, key, b'couplet') == False
+        assert dber.addIoVal(db, key, b'new2') == True
+        assert [bytes(val) for val in dber.getIoVals(db, key)[-4:]] == \
+               [b'couplet%04d' % 150 + b'x', b'new1', b'new0', b'new2']
+
+    assert not os.path.exists(dber.path)
+    """ End Test """
+
+
+def test_logevt():
+    """
+    Test Logger.logEvt and transact write all event logs in one transaction
+    """
+    pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+    dig = b'EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4'
+    raw = b'{"vs":"KERI10JSON000000_","pre":"","sn":"0","ilk":"icp"}'
+    sigs = [b'AAsig0', b'ABsig1']
+    dts = b'2020-08-22T17:50:09.988921+00:00'
+    dgkey = dgKey(pre, dig)
+
+    with openLogger() as lgr:
+        assert lgr.logEvt(pre=pre, dig=dig, sn=0, raw=raw, sigs=sigs, dts=dts)
+        assert bytes(lgr.getEvt(dgkey)) == raw
+        assert bytes(lgr.getDts(dgkey)) == dts
+        assert [bytes(sig) for sig in lgr.getSigs(dgkey)] == sigs
+        assert lgr.getKes(snKey(pre, 0)) == [dig]
+        # repeated log does not add index dup
+        assert not lgr.logEvt(pre=pre, dig=dig.decode("utf-8"), sn=0,
+                              raw=raw, sigs=sigs)
+        assert lgr.getKes(snKey(pre, 0)) == [dig]
+        assert lgr.getState(pre) is None
+
+        # key state written with event and overwritten by later event
+        assert lgr.logEvt(pre=pre, dig=b'E' * 44, sn=1, raw=raw, sigs=sigs,
+                          state=b'{"sn":1}')
+        assert bytes(lgr.getState(pre)) == b'{"sn":1}'
+        assert not lgr.putState(pre, b'{"sn":2}')
+        assert lgr.setState(pre.decode("utf-8"), b'{"sn":2}')
+        assert list(lgr.getStateItemIter()) == [(pre, b'{"sn":2}')]
+        assert lgr.delState(pre)
+        assert lgr.getState(pre) is None
+        assert list(lgr.getStateItemIter()) == []
+
+        # escrow index
+        odig = b'EOutOfOrderDigestXXXXXXXXXXXXXXXXXXXXXXXXXXX'
+        assert lgr.logEvt(pre=pre, dig=odig, sn=3, raw=raw, sigs=sigs,
+                          idx=lgr.ooes)
+        assert lgr.getOoes(snKey(pre, 3)) == [odig]
+        assert lgr.getKes(snKey(pre, 3)) == []
+        assert lgr.getDts(dgKey(pre, odig)) is not None
+
+        # exception in transact aborts all writes
+        pdig = b'EPartialDigestXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX'
+        with pytest.raises(ValueError):
+            with lgr.transact() as txn:
+                lgr.putDts(dgKey(pre, pdig), dts, txn=txn)
+                lgr.putEvt(dgKey(pre, pdig), raw, txn=txn)
+                assert bytes(lgr.getVal(lgr.evts, dgKey(pre, pdig), txn=txn)) == raw
+                lgr.addPse(snKey(pre, 1), pdig, txn=txn)
+                assert lgr.getIoVals(lgr.pses, snKey(pre, 1), txn=txn) == [pdig]
+                raise ValueError("abort")
+        assert lgr.getEvt(dgKey(pre, pdig)) is None
+        assert lgr.getDts(dgKey(pre, pdig)) is None
+        assert lgr.getPses(snKey(pre, 1)) == []
+
+    assert not os.path.exists(lgr.path)
+    """ End Test """
+
+
+def test_batched():
+    """
+    Test group commit of Databaser writes with .batched and .flush
+    """
+    lgr = Logger(name="batched", temp=True, batchSize=3, batchTime=60.0)
+    try:
+        pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+        with lgr.batched() as batch:
+            assert batch is lgr.batch
+            for i in range(7):
+                dig = b'E%043d' % i
+                assert lgr.logEvt(pre=pre, dig=dig, sn=i, raw=b'raw%d' % i,
+                                  sigs=[b'sig'])
+                # read your writes inside batch
+                assert lgr.getEvt(dgKey(pre, dig)) == b'raw%d' % i
+                assert lgr.getKeLast(snKey(pre, i)) == dig
+                # not yet visible to other threads readers until committed
+                with lgr.env.begin(db=lgr.evts) as txn:
+                    visible = txn.get(dgKey(pre, dig)) is not None
+                assert visible == (i < (i // 3) * 3)
+                lgr.flush()
+            assert lgr.commits == 2  # after 3 and 6
+            assert lgr.batchCount == 1
+
+        assert lgr.batch is None
+        assert lgr.commits == 3
+        assert [bytes(dig) for dig in lgr.getKelIter(pre)] == \
+                [b'E%043d' % i for i in range(7)]
+
+        # exception aborts uncommitted writes of batch
+        with pytest.raises(ValueError):
+            with lgr.batched():
+                lgr.putEvt(dgKey(pre, b'Ea'), b'a')
+                lgr.flush(force=True)
+                lgr.putEvt(dgKey(pre, b'Eb'), b'b')
+                raise ValueError("abort")
+        assert lgr.getEvt(dgKey(pre, b'Ea')) == b'a'
+        assert lgr.getEvt(dgKey(pre, b'Eb')) is None
+
+        # disabled when batchSize is 0
+        lgr.batchSize = 0
+        with lgr.batched() as batch:
+            assert batch is None
+            assert not lgr.flush()
+    finally:
+        lgr.clearDirPath()
+
+    assert not os.path.exists(lgr.path)
+    """ End Test """
+
+
+def test_mapgrowth():
+    """
+    Test Databaser environment options and automatic map growth
+    """
+    with pytest.raises(DatabaseError):
+        Logger(name="tune", temp=True, durability="never")
+
+    for durability in Durabilities:
+        lgr = Logger(name="tune", temp=True, durability=durability,
+                     mapSize=65536, mapMax=4 * 65536)
+        try:
+            assert lgr.durability == durability
+            assert lgr.mapSize == 65536
+            flags = lgr.env.flags()
+            assert flags["sync"] == Durabilities[durability]["sync"]
+            assert flags["map_async"] == Durabilities[durability]["map_async"]
+
+            # writes retry after growing map until at mapMax
+            pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+            with pytest.raises(DatabaseError):
+                for i in range(2000):
+                    assert lgr.logEvt(pre=pre, dig=b'E%043d' % i, sn=i,
+                                      raw=b'x' * 256, sigs=[b'sig'])
+            assert lgr.grows == 2
+            assert lgr.mapSize == 4 * 65536
+            assert 0 < i < 2000
+            assert lgr.getEvt(dgKey(pre, b'E%043d' % (i - 1))) is not None
+            assert lgr.getEvt(dgKey(pre, b'E%043d' % i)) is None  # all or none
+            assert lgr.getDts(dgKey(pre, b'E%043d' % i)) is None
+        finally:
+            lgr.clearDirPath()
+
+    # batch grows map ahead of group commit
+    lgr = Logger(name="tune", temp=True, mapSize=65536, batchSize=16,
+                 writemap=True)
+    try:
+        assert lgr.env.flags()["writemap"]
+        pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+        with lgr.batched():
+            for i in range(512):
+                lgr.logEvt(pre=pre, dig=b'E%043d' % i, sn=i,
+                           raw=b'x' * 256, sigs=[b'sig'])
+                lgr.flush()
+        assert lgr.grows > 0
+        assert lgr.mapUsed() <= lgr.mapSize
+        assert len([dig for dig in lgr.getKelIter(pre)]) == 512
+    finally:
+        lgr.clearDirPath()
+
+    # batch larger than map commits early and grows map within batch
+    lgr = Logger(name="tune", temp=True, mapSize=65536, batchSize=10000,
+                 batchTime=600.0)
+    try:
+        pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+        with lgr.batched():
+            for i in range(512):
+                lgr.logEvt(pre=pre, dig=b'E%043d' % i, sn=i,
+                           raw=b'x' * 256, sigs=[b'sig'])
+                lgr.flush()
+        assert lgr.grows > 0
+        assert lgr.commits > 1
+        assert len([dig for dig in lgr.getKelIter(pre)]) == 512
+    finally:
+        lgr.clearDirPath()
+
+    # write that overflows nested txn of batch commits batch, grows, retries
+    lgr = Logger(name="tune", temp=True, mapSize=4 * 65536, batchSize=10000,
+                 batchTime=600.0)
+    try:
+        lgr._crowded = lambda: False  # no early commit
+        with lgr.batched():
+            for i in range(8):
+                assert lgr.putVal(lgr.evts, b'k%d' % i, bytes(65536))
+                lgr.flush()
+        assert lgr.grows > 0
+        for i in range(8):
+            assert lgr.getVal(lgr.evts, b'k%d' % i) == bytes(65536)
+    finally:
+        lgr.clearDirPath()
+
+    # growth waits for transactions of other threads and refuses own
+    lgr = Logger(name="tune", temp=True, mapSize=65536)
+    try:
+        pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+        opened, done = threading.Event(), threading.Event()
+
+        def read():
+            with lgr.transact(write=False) as txn:
+                opened.set()
+                done.wait(10.0)
+
+        def write():
+            for i in range(512):
+                lgr.logEvt(pre=pre, dig=b'E%043d' % i, sn=i,
+                           raw=b'x' * 256, sigs=[b'sig'])
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        assert opened.wait(10.0)
+        writer = threading.Thread(target=write)
+        writer.start()
+        writer.join(0.5)
+        assert writer.is_alive()  # blocked in growMap by open reader
+        assert lgr.grows == 0
+        done.set()
+        reader.join(10.0)
+        writer.join(10.0)
+        assert not writer.is_alive()
+        assert lgr.grows > 0
+        assert len([dig for dig in lgr.getKelIter(pre)]) == 512
+
+        with lgr.transact(write=False) as txn:
+            with pytest.raises(DatabaseError):
+                lgr.growMap()
+        assert lgr._txns == {}
+    finally:
+        lgr.clearDirPath()
+
+    """ End Test """
+
+
+def test_layout():
+    """
+    Test Logger binary key layout 2 behind same methods and convertLogger
+    """
+    import tempfile
+    import shutil
+
+    secrets = generateSecrets(root=b'layoutlayoutlayo', count=3)
+    signers = [Signer(qb64=secret) for secret in secrets]
+
+    def logKel(lgr):
+        """
+        Logs KEL of inception, rotation and two interactions plus escrows
+        Returns Kever
+        """
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64)
+        kever = Kever(serder=serder, sigers=[signers[0].sign(serder.raw, index=0)],
+                      logger=lgr)
+        serder = rotate(pre=kever.prefixer.qb64, keys=[signers[1].verfer.qb64],
+                        dig=kever.diger.qb64,
+                        nxt=Nexter(keys=[signers[2].verfer.qb64]).qb64, sn=1)
+        kever.update(serder=serder, sigers=[signers[1].sign(serder.raw, index=0)])
+        for sn in (2, 3):
+            serder = interact(pre=kever.prefixer.qb64, dig=kever.diger.qb64,
+                              sn=sn)
+            kever.update(serder=serder,
+                         sigers=[signers[1].sign(serder.raw, index=0)])
+        dgkey = dgKey(kever.prefixer.qb64b, kever.diger.qb64b)
+        lgr.putRcts(dgkey, [b'couplet0', b'couplet1'])
+        lgr.addOoe(snKey(kever.prefixer.qb64b, 5), b'Eooe')
+        lgr.addOoe(snKey(kever.prefixer.qb64b, 5), b'Eooe2')
+        return kever
+
+    def dump(lgr):
+        """
+        Returns dict of sub db name to sorted list of (dgKey/snKey key, val)
+        records. Sorted since qb2 keys sort in other order than qb64 keys
+        """
+        records = {}
+        with lgr.env.begin(write=False) as txn:
+            for name in lgr.DgKeyDBs:
+                records[name] = [(lgr._dgKeyOf(key), val) for key, val
+                                 in txn.cursor(db=getattr(lgr, name)).iternext()]
+            for name in lgr.SnKeyDBs:
+                records[name] = [(lgr._snKeyOf(key), lgr._ordOf(val),
+                                  val[lgr._ordSize:]) for key, val
+                                 in txn.cursor(db=getattr(lgr, name)).iternext()]
+            for name in lgr.PreKeyDBs:
+                records[name] = [(lgr._preOf(key), val) for key, val
+                                 in txn.cursor(db=getattr(lgr, name)).iternext()]
+            for name in lgr.TimeKeyDBs:
+                records[name] = list(txn.cursor(db=getattr(lgr, name)).iternext())
+        return {name: sorted((tuple(bytes(item) if isinstance(item, memoryview)
+                                    else item for item in record)
+                              for record in records[name]))
+                for name in records}
+
+    headDirPath = tempfile.mkdtemp(prefix="keri_lmdb_", suffix="_test", dir="/tmp")
+    try:
+        lgr1 = Logger(headDirPath=headDirPath, name="one")
+        assert lgr1.layout == 1 and not lgr1.qb2
+        kever = logKel(lgr1)
+        pre = kever.prefixer.qb64b
+        digs = [bytes(dig) for dig in lgr1.getKelIter(pre)]
+        assert len(digs) == 4
+
+        for qb2 in (False, True):
+            lgr2 = Logger(headDirPath=headDirPath, name="two%d" % qb2,
+                          layout=2, qb2=qb2, bloom=64)
+            assert lgr2.layout == 2 and lgr2.qb2 == qb2
+            kever2 = logKel(lgr2)  # same methods and same keys
+            assert kever2.diger.qb64 == kever.diger.qb64
+            assert [bytes(dig) for dig in lgr2.getKelIter(pre)] == digs
+            assert [bytes(dig) for dig in lgr2.getKelIter(pre, reverse=True)] == digs[::-1]
+            assert [bytes(dig) for dig in lgr2.getKelEstIter(pre)] == digs
+            assert lgr2.getKeLast(snKey(pre, 3)) == digs[3]
+            assert lgr2.getOoes(snKey(pre, 5)) == [b'Eooe', b'Eooe2']
+            dgkey = dgKey(pre, digs[3])
+            assert lgr2.hasEvt(dgkey)
+            assert lgr2.getRcts(dgkey) == [b'couplet0', b'couplet1']
+            assert lgr2.getState(pre) == lgr1.getState(pre) == kever.state()
+            records1, records2 = dump(lgr1), dump(lgr2)
+            assert [key for key, val in records2.pop("dtss")] == \
+                   [key for key, val in records1.pop("dtss")]
+            assert records2 == records1
+
+            # native keys are smaller
+            with lgr2.env.begin(db=lgr2.kels) as txn:
+                key, val = next(txn.cursor().iternext())
+                assert len(key) == (33 if qb2 else 44) + 8
+                assert len(val) == 3 + 44
+            with lgr2.env.begin(db=lgr2.sigs) as txn:
+                key = next(txn.cursor().iternext(values=False))
+                assert len(key) == (66 if qb2 else 88)
+            lgr2.env.close()
+
+            # reopen keeps stored layout and refuses other layout
+            lgr2 = Logger(headDirPath=headDirPath, name="two%d" % qb2)
+            assert lgr2.layout == 2 and lgr2.qb2 == qb2
+            lgr2.env.close()
+            with pytest.raises(DatabaseError):
+                Logger(headDirPath=headDirPath, name="two%d" % qb2, layout=1)
+
+        # convert 1 to 2 with qb2 and back to 1
+        lgr2 = Logger(headDirPath=headDirPath, name="conv2", layout=2, qb2=True,
+                      bloom=64)
+        count = convertLogger(lgr1, lgr2, chunk=5)
+        assert count == sum(len(records) for records in dump(lgr1).values())
+        assert dump(lgr2) == dump(lgr1)
+        assert lgr2.evtFilter.count == len(dump(lgr1)["evts"])
+        assert [bytes(dig) for dig in lgr2.getKelIter(pre)] == digs
+        assert list(lgr2.getStateItemIter()) == [(pre, kever.state())]
+        with pytest.raises(DatabaseError):
+            convertLogger(lgr1, lgr2)  # target not empty
+
+        lgr3 = Logger(headDirPath=headDirPath, name="conv1", layout=1)
+        assert convertLogger(lgr2, lgr3) == count
+        with lgr1.env.begin() as txn1, lgr3.env.begin() as txn3:
+            for name in lgr1.DgKeyDBs + lgr1.SnKeyDBs + lgr1.PreKeyDBs + lgr1.TimeKeyDBs:
+                assert list(txn3.cursor(db=getattr(lgr3, name)).iternext()) == \
+                       list(txn1.cursor(db=getattr(lgr1, name)).iternext())
+        for lgr in (lgr1, lgr2, lgr3):
+            lgr.env.close()
+    finally:
+        shutil.rmtree(headDirPath)
+
+    """ End Test """
+
 if __name__ == "__main__":
     test_logger()
+
+
+def test_promote_escrows():
+    """
+    Test receipt escrows promoted by value in one transaction
+    """
+    pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+    vpres = [b'EwBwUb2eZcA5GDcN7g-87wpreM0nNkLqzkwviBHTcV1A',
+             b'EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4']
+    key = dgKey(pre, b'E%043d' % 0)
+
+    with openLogger("promote") as lgr:
+        lgr.putUres(key, [b'couplet0', b'couplet1', b'couplet2'])
+        assert lgr.promoteUres(key, [b'couplet0', b'couplet9'], [b'couplet1']) == 1
+        assert [bytes(val) for val in lgr.getRcts(key)] == [b'couplet0']
+        assert [bytes(val) for val in lgr.getUres(key)] == [b'couplet2']
+        assert lgr.promoteUres(key, [b'couplet0'], []) == 0  # already moved
+        assert [bytes(val) for val in lgr.getRcts(key)] == [b'couplet0']
+
+        triplets = [vpres[0] + b'.0', vpres[0] + b'.1', vpres[1] + b'.0']
+        lgr.putVres(key, triplets)
+        for vpre in vpres:
+            lgr.addVrv(vpre, key)
+        assert lgr.promoteVres(key, [triplets[0]], []) == 1
+        assert [bytes(val) for val in lgr.getVrcs(key)] == [triplets[0]]
+        assert [bytes(val) for val in lgr.getVrvs(vpres[0])] == [key]  # pending
+        assert lgr.promoteVres(key, [triplets[0]], [triplets[1]]) == 0
+        assert [bytes(val) for val in lgr.getVres(key)] == [triplets[2]]
+        assert lgr.getVrvs(vpres[0]) == []
+        assert [bytes(val) for val in lgr.getVrvs(vpres[1])] == [key]
+        assert lgr.promoteVres(key, [triplets[2]], []) == 1
+        assert lgr.getVres(key) == []
+        assert lgr.getVrvs(vpres[1]) == []
+
+    """ End Test """
+
+
+def test_escrow_sweep():
+    """
+    Test escrow time index written with escrows and bounded expiry sweeps
+    """
+    import datetime
+
+    pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+    vpre = b'EwBwUb2eZcA5GDcN7g-87wpreM0nNkLqzkwviBHTcV1A'
+    raw = b'{"vs":"KERI10JSON000000_","pre":"","sn":"0","ilk":"rot"}'
+    old = b'2020-08-22T17:50:09.988921+00:00'
+    now = datetime.datetime(2020, 8, 22, 19, 50, 9, tzinfo=datetime.timezone.utc)
+
+    assert escKey("ooes", old) == b'ooes' + (1598118609988921).to_bytes(8, "big")
+    assert escKey(b'ooes', datetime.datetime(2020, 8, 22, 17, 50, 9, 988921)) == \
+           escKey("ooes", old.decode("utf-8"))
+    assert escKey("ooes", old) < escKey("ooes", now) < escKey("pses", old)
+
+    lgr = Logger(name="sweep", temp=True, escrowTTLs=dict(ldes=None))
+    try:
+        assert lgr.escrowTTLs["ooes"] == Logger.EscrowTTLs["ooes"]
+        assert lgr.escrowTTLs["ldes"] is None
+        digs = [b'E%043d' % i for i in range(6)]
+        lgr.logEvt(pre=pre, dig=digs[0], sn=0, raw=raw, sigs=[b'sig'], dts=old)
+        lgr.logEvt(pre=pre, dig=digs[1], sn=3, raw=raw, sigs=[b'sig'], dts=old,
+                   idx=lgr.ooes)
+        lgr.logEvt(pre=pre, dig=digs[2], sn=4, raw=raw, sigs=[b'sig'], dts=old,
+                   idx=lgr.ooes)
+        lgr.logEvt(pre=pre, dig=digs[3], sn=5, raw=raw, sigs=[b'sig'],
+                   idx=lgr.ooes)  # now so not expired
+        lgr.logEvt(pre=pre, dig=digs[4], sn=1, raw=raw, sigs=[b'sig'], dts=old,
+                   idx=lgr.pses)
+        lgr.logEvt(pre=pre, dig=digs[5], sn=1, raw=raw, sigs=[b'sig'], dts=old,
+                   idx=lgr.ldes)
+        assert list(lgr.getEscItemIter("kels")) == []
+        assert list(lgr.getEscItemIter("ooes"))[:2] == \
+               [(escKey("ooes", old), dgKey(pre, digs[1]) + b'.3'),
+                (escKey("ooes", old), dgKey(pre, digs[2]) + b'.4')]
+
+        rkey = dgKey(pre, digs[0])
+        assert lgr.logRct(key=rkey, val=b'couplet0', dts=old)
+        assert not lgr.logRct(key=rkey, val=b'couplet0')
+        assert lgr.logRct(key=rkey, val=b'couplet1')  # indexed on its own
+        assert list(lgr.getEscItemIter("ures"))[0] == \
+               (escKey("ures", old), rkey + b'.couplet0')
+        assert list(lgr.getEscItemIter("ures"))[1][1] == rkey + b'.couplet1'
+        triplet = vpre + digs[0] + b'AA' + b'x' * 86
+        assert lgr.logRct(key=rkey, val=triplet, idx=lgr.vres, dts=old)
+        lgr.addVrv(vpre, rkey)
+
+        # bounded sweep of one entry per kind
+        assert lgr.sweepEscrows(now=now, limit=1) == 4  # ooes pses ures vres
+        assert lgr.getOoes(snKey(pre, 3)) == []
+        assert lgr.getEvt(dgKey(pre, digs[1])) is None
+        assert lgr.getSigs(dgKey(pre, digs[1])) == []
+        assert lgr.getDts(dgKey(pre, digs[1])) is None
+        assert lgr.getOoes(snKey(pre, 4)) == [digs[2]]  # next sweep
+        assert lgr.getPses(snKey(pre, 1)) == []
+        assert lgr.getLdes(snKey(pre, 1)) == [digs[5]]  # never expires
+        assert [bytes(val) for val in lgr.getUres(rkey)] == [b'couplet1']  # later
+        assert lgr.getVres(rkey) == []
+        assert lgr.getVrvs(vpre) == []
+        assert bytes(lgr.getEvt(dgKey(pre, digs[0]))) == raw  # in kels not escrow
+
+        # quarantine keeps logged event
+        assert lgr.sweepEscrows(now=now, quarantine=True) == 1
+        assert lgr.getOoes(snKey(pre, 4)) == []
+        assert bytes(lgr.getEvt(dgKey(pre, digs[2]))) == raw
+        assert lgr.getOoes(snKey(pre, 5)) == [digs[3]]
+        assert lgr.sweepEscrows(now=now) == 0
+
+        # entry already gone from escrow only loses its index entry
+        lgr.delOoes(snKey(pre, 5))
+        later = datetime.datetime.now(datetime.timezone.utc) + \
+                datetime.timedelta(seconds=lgr.escrowTTLs["ooes"] + 1)
+        assert lgr.sweepEscrows(now=later) == 1
+        assert bytes(lgr.getEvt(dgKey(pre, digs[3]))) == raw
+        assert list(lgr.getEscItemIter("ooes")) == []
+
+        # promoted receipt leaves stale index entry that spares later escrow
+        lgr.logRct(key=rkey, val=triplet, idx=lgr.vres, dts=old)
+        lgr.addVrv(vpre, rkey)
+        assert lgr.promoteVres(rkey, [triplet], []) == 1
+        later = now + datetime.timedelta(seconds=1800)
+        lgr.logRct(key=rkey, val=triplet[:-1] + b'y', idx=lgr.vres,
+                   dts=later.isoformat().encode("utf-8"))
+        lgr.addVrv(vpre, rkey)
+        assert lgr.sweepEscrows(now=now) == 1  # index entry of promoted only
+        assert [bytes(val) for val in lgr.getVres(rkey)] == [triplet[:-1] + b'y']
+        assert [bytes(val) for val in lgr.getVrvs(vpre)] == [rkey]
+        assert lgr.sweepEscrows(now=later + datetime.timedelta(seconds=3601)) == 1
+        assert lgr.getVres(rkey) == []
+        assert lgr.getVrvs(vpre) == []
+    finally:
+        lgr.clearDirPath()
+
+    """ End Test """
@@ -4,6 +4,7 @@ tests.help.test_helping module
 
 """
 import datetime
+import threading
 
 import pytest
 
@@ -13,6 +14,7 @@ import pysodium
 from keri.help.helping import mdict
 from keri.help.helping import extractValues
 from keri.help.helping import nowIso8601, toIso8601, fromIso8601
+from keri.help.helping import LruCache, BloomFilter
 
 
 def test_mdict():
@@ -133,5 +135,103 @@ def test_iso8601():
     """ End Test """
 
 
+def test_lrucache():
+    """
+    Test LruCache bounded least recently used cache
+    """
+    cache = LruCache(size=3)
+    assert cache.size == 3
+    assert len(cache) == 0
+    assert cache.get("a") is None
+    assert cache.get("a", 0) == 0
+    assert cache.misses == 2
+    assert cache.hits == 0
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert len(cache) == 3
+    assert cache.get("a") == 1  # a now most recent so b is least
+    assert cache.hits == 1
+
+    cache.put("d", 4)  # evicts b
+    assert len(cache) == 3
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache and "d" in cache
+
+    cache.put("c", 30)  # replace refreshes c so a is least
+    cache.put("e", 5)  # evicts a
+    assert "a" not in cache
+    assert cache.get("c") == 30
+
+    assert cache.pop("c") == 30
+    assert cache.pop("c", None) is None
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+    cache = LruCache(size=0)  # caches nothing
+    cache.put("a", 1)
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+    """ End Test """
+
+
+def test_bloomfilter():
+    """
+    Test BloomFilter sizing, membership, and metrics
+    """
+    bloom = BloomFilter(capacity=1000, fpr=0.01)
+    assert bloom.m == 9592  # ceil(-n ln p / ln2^2) rounded up to bytes
+    assert bloom.k == 7
+    assert bloom.nbytes == 1199
+    assert len(bloom) == 0
+    assert bloom.rate == 0.0
+
+    keys = [b'key%d' % i for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert len(bloom) == 1000
+    assert all(key in bloom for key in keys)  # no false negatives
+    assert bloom.hits == 1000
+    assert 0.005 < bloom.rate < 0.015
+
+    falses = sum(1 for i in range(10000) if b'nokey%d' % i in bloom)
+    assert falses == bloom.hits - 1000
+    assert bloom.misses == 10000 - falses
+    assert falses < 300
+    for i in range(falses):
+        bloom.falsed()
+    assert bloom.observed == falses / 10000
+
+    bloom.clear()
+    assert len(bloom) == 0
+    assert bloom.hits == bloom.misses == bloom.falses == 0
+    assert b'key0' not in bloom
+    assert bloom.observed == 0.0
+
+    # counters stay exact when shared across threads
+    bloom.add(b'key0')
+
+    def lookup():
+        for i in range(2000):
+            b'key0' in bloom
+            b'nokey0' in bloom
+            bloom.falsed()
+
+    threads = [threading.Thread(target=lookup) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert bloom.hits + bloom.misses == 16001  # one miss from before
+    assert bloom.falses == 8000
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_iso8601()
@@ -3,9 +3,70 @@
 tests.test_main module
 
 """
+import os
 
-from keri.cli import main
+import pytest
+
+from keri.cli import main, databaserKwa, convert
+from keri.db.dbing import Logger
+from keri import daemon
 
 
 def test_main():
     main([])
+    args = main(["--map-size", "65536", "--batch-size", "8", "alpha"])
+    assert args.names == ["alpha"]
+    assert databaserKwa(args)["mapSize"] == 65536
+    args = daemon.main(["--durability", "lazy", "alpha", "beta"])
+    assert args.names == ["alpha", "beta"]
+    assert databaserKwa(args)["durability"] == "lazy"
+
+
+def test_databaser_args():
+    args = main(["--map-size", "65536", "--map-max", "1048576",
+                 "--durability", "lazy", "--no-readahead", "--batch-size", "8"])
+    kwa = databaserKwa(args)
+    assert kwa == dict(mapSize=65536, mapMax=1048576, mapGrowth=None,
+                       durability="lazy", writemap=False, readahead=False,
+                       maxReaders=None, batchSize=8, batchTime=None)
+
+    lgr = Logger(name="args", temp=True, **kwa)
+    try:
+        assert lgr.mapSize == 65536
+        assert lgr.mapMax == 1048576
+        assert lgr.durability == "lazy"
+        assert lgr.batchSize == 8
+        assert not lgr.env.flags()["readahead"]
+        assert not lgr.env.flags()["sync"]
+    finally:
+        lgr.clearDirPath()
+
+
+def test_convert():
+    import tempfile
+    import shutil
+
+    headDirPath = tempfile.mkdtemp(prefix="keri_lmdb_", suffix="_test", dir="/tmp")
+    try:
+        lgr = Logger(headDirPath=headDirPath, name="old")
+        lgr.putEvt(b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc.'
+                   b'EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4', b'event')
+        lgr.env.close()
+        assert convert(["old", "new", "--head", headDirPath, "--qb2",
+                        "--map-size", "2097152"]) == 1
+        lgr = Logger(headDirPath=headDirPath, name="new")
+        assert lgr.layout == 2 and lgr.qb2
+        assert lgr.mapSize >= 2097152
+        assert bytes(lgr.getEvt(b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc.'
+                                b'EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4')) == b'event'
+        lgr.env.close()
+
+        # mistyped source fails without creating either database
+        with pytest.raises(SystemExit):
+            convert(["olde", "newer", "--head", headDirPath])
+        assert not os.path.exists(os.path.join(headDirPath, Logger.TailDirPath,
+                                               "olde"))
+        assert not os.path.exists(os.path.join(headDirPath, Logger.TailDirPath,
+                                               "newer"))
+    finally:
+        shutil.rmtree(headDirPath)